@@ -7,12 +7,76 @@ Usage:
     python add_data.py
 """
 
-import requests
+import asyncio
+import functools
 import json
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 
+import httpx
 
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:  # uvloop does not support Windows
+    UVLOOP_AVAILABLE = False
+
+# Keep-alive connection pool shared by every request the script makes.
+POOL_SIZE = 16
+LIMITS = httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+CLIENT = httpx.Client(http2=HTTP2_AVAILABLE, limits=LIMITS, timeout=5.0)
+
+# Upper bound on in-flight requests so a large batch cannot saturate the server.
+MAX_CONCURRENCY = int(os.environ.get("ARGOS_MAX_CONCURRENCY", "8"))
+_semaphore = None
+
+# Transient failures (connection errors, gateway/unavailable responses) are
+# retried with exponential backoff: 0.2s, 0.4s, 0.8s, ...
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = (502, 503, 504)
+# Non-idempotent requests may already have been applied when a read fails or
+# a gateway error comes back, so they are only retried when the request
+# never reached the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+UNSENT_STATUSES = (503,)
+
+# Result lines are collected while requests are in flight and written once
+# per stage, keeping stdout writes off the event loop's hot path.
+_output = []
+
+# Short-lived cache for idempotent GETs, keyed by path. A successful POST
+# drops every cached path it can have changed.
+GET_CACHE_TTL = 2.0
+_get_cache = {}
+_INVALIDATES = {
+    "/students": ("/students", "/statistics"),
+    "/courses": ("/courses", "/statistics"),
+    "/sections": ("/sections", "/courses", "/statistics"),
+    "/enrollments": ("/students", "/sections", "/statistics"),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def _console_supports_utf8() -> bool:
     try:
         enc = getattr(sys.stdout, "encoding", None)
@@ -21,104 +85,228 @@ def _console_supports_utf8() -> bool:
         return False
 
 
-_OK_CHAR = "\u2713" if _console_supports_utf8() else "[OK]"
-_FAIL_CHAR = "\u2717" if _console_supports_utf8() else "[FAIL]"
-_WARN_CHAR = "\u26A0" if _console_supports_utf8() else "[WARN]"
-_INFO_CHAR = "\u2139" if _console_supports_utf8() else "[INFO]"
+_UTF8 = _console_supports_utf8()
+_OK_CHAR = "\u2713" if _UTF8 else "[OK]"
+_FAIL_CHAR = "\u2717" if _UTF8 else "[FAIL]"
+_WARN_CHAR = "\u26A0" if _UTF8 else "[WARN]"
+_INFO_CHAR = "\u2139" if _UTF8 else "[INFO]"
 
 
-def _detect_base_url() -> str:
-    """Determine a reachable BASE_URL.
+@functools.lru_cache(maxsize=1)
+def _detect_base_url() -> Tuple[str, bool]:
+    """Determine a reachable BASE_URL and whether its health check passed.
 
     Priority: environment variable `ARGOS_BASE_URL`, then common local ports.
-    If nothing responds, fall back to http://127.0.0.1:8000.
+    If nothing responds, fall back to http://127.0.0.1:8000 and report the
+    server as down.
     """
     env = os.environ.get("ARGOS_BASE_URL")
-    if env:
-        return env
-
-    candidates = [
+    candidates = [env] if env else [
         "http://127.0.0.1:8000",
         "http://127.0.0.1:8888",
         "http://localhost:8000",
         "http://localhost:8888",
     ]
 
-    for c in candidates:
-        try:
-            resp = requests.get(f"{c}/health", timeout=0.5)
-            if resp.status_code == 200:
-                return c
-        except Exception:
-            continue
+    def probe(candidate):
+        return CLIENT.get(f"{candidate}/health", timeout=0.5).status_code == 200
 
-    return candidates[0]
+    # Probe every candidate at once, then take the first healthy one in
+    # candidate order; a dead port costs one timeout in total rather than one
+    # per candidate, and the choice stays deterministic when several answer.
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [pool.submit(probe, c) for c in candidates]
+        for candidate, future in zip(candidates, futures):
+            try:
+                healthy = future.result()
+            except Exception:
+                continue
+            if healthy:
+                return candidate, True
+    finally:
+        pool.shutdown(wait=False)
 
+    return candidates[0], False
 
-BASE_URL = _detect_base_url()
+
+BASE_URL, SERVER_HEALTHY = _detect_base_url()
 
 def check_server():
-    """Check if the server is running."""
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=2)
-        if response.status_code == 200:
-            print(f"{_OK_CHAR} Server is running")
-            return True
-    except requests.exceptions.RequestException:
-        print(f"{_FAIL_CHAR} Server is not running!")
-        print("\nPlease start the server first:")
-        print("  source venv_new/bin/activate")
-        print("  python -m argos.main --grpc-port 50052 --rest-port 8888")
-        return False
+    """Report whether the server passed the health probe made at start-up."""
+    if SERVER_HEALTHY:
+        print(f"{_OK_CHAR} Server is running")
+        return True
+    print(f"{_FAIL_CHAR} Server is not running!")
+    print("\nPlease start the server first:")
+    print("  source venv_new/bin/activate")
+    print("  python -m argos.main --grpc-port 50052 --rest-port 8888")
+    return False
 
-def create_student(first_name, last_name, email, student_id, grade_level):
-    """Create a new student."""
-    url = f"{BASE_URL}/students"
-    data = {
-        "first_name": first_name,
-        "last_name": last_name,
-        "email": email,
-        "student_id": student_id,
-        "grade_level": grade_level
-    }
+# Sample data. Sections refer to COURSES by index and enrollments refer to
+# (STUDENTS index, SECTIONS_SPEC index) pairs, resolved once the referenced
+# records exist on the server.
+STUDENTS = [
+    dict(first_name="Alice", last_name="Johnson", email="alice.johnson@university.edu", student_id="S001", grade_level="freshman"),
+    dict(first_name="Bob", last_name="Smith", email="bob.smith@university.edu", student_id="S002", grade_level="sophomore"),
+    dict(first_name="Carol", last_name="Davis", email="carol.davis@university.edu", student_id="S003", grade_level="junior"),
+    dict(first_name="David", last_name="Wilson", email="david.wilson@university.edu", student_id="S004", grade_level="senior"),
+    dict(first_name="Emma", last_name="Brown", email="emma.brown@university.edu", student_id="S005", grade_level="freshman"),
+    dict(first_name="Frank", last_name="Miller", email="frank.miller@university.edu", student_id="S006", grade_level="sophomore"),
+]
+
+COURSES = [
+    dict(course_code="CS101", title="Introduction to Programming", description="Learn Python programming basics", credits=3, department="Computer Science"),
+    dict(course_code="CS201", title="Data Structures", description="Advanced data structures and algorithms", credits=4, department="Computer Science", prerequisites=["CS101"]),
+    dict(course_code="CS301", title="Database Systems", description="Relational databases and SQL", credits=3, department="Computer Science", prerequisites=["CS201"]),
+    dict(course_code="MATH101", title="Calculus I", description="Differential calculus", credits=4, department="Mathematics"),
+    dict(course_code="MATH201", title="Calculus II", description="Integral calculus", credits=4, department="Mathematics", prerequisites=["MATH101"]),
+    dict(course_code="ENG101", title="English Composition", description="Academic writing skills", credits=3, department="English"),
+]
+
+# (course index, section number, semester, year, instructor ID, capacity)
+SECTIONS_SPEC = [
+    (0, "001", "Fall", 2024, "instructor-1", 30),  # CS101-001
+    (0, "002", "Fall", 2024, "instructor-2", 25),  # CS101-002
+    (1, "001", "Fall", 2024, "instructor-1", 20),  # CS201-001
+    (3, "001", "Fall", 2024, "instructor-3", 35),  # MATH101-001
+    (5, "001", "Fall", 2024, "instructor-4", 25),  # ENG101-001
+]
+
+# (student index, section index)
+ENROLLMENTS_SPEC = [
+    (0, 0),  # Alice in CS101-001
+    (1, 0),  # Bob in CS101-001
+    (2, 1),  # Carol in CS101-002
+    (3, 2),  # David in CS201-001
+    (4, 3),  # Emma in MATH101-001
+    (5, 4),  # Frank in ENG101-001
+    # Also enroll some students in multiple courses
+    (0, 3),  # Alice in MATH101
+    (1, 4),  # Bob in ENG101
+]
+
+def _request_slots():
+    """Return the semaphore limiting concurrent requests.
+
+    Created lazily so it binds to the loop started by `asyncio.run`.
+    """
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    return _semaphore
+
+async def _send(client, method, path, **kwargs):
+    """Send a request, retrying transient failures, and return (status, body)."""
+    if method.upper() in IDEMPOTENT_METHODS:
+        retry_errors, retry_statuses = httpx.TransportError, RETRY_STATUSES
+    else:
+        retry_errors, retry_statuses = UNSENT_ERRORS, UNSENT_STATUSES
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            async with _request_slots():
+                response = await client.request(method, path, **kwargs)
+        except retry_errors:
+            if attempt == RETRY_ATTEMPTS:
+                raise
+        else:
+            if response.status_code not in retry_statuses or attempt == RETRY_ATTEMPTS:
+                return response.status_code, response.content
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+def _dumps(data):
+    """Serialize a request payload to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def _loads(body):
+    """Parse a JSON response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def _log(line=""):
+    """Buffer an output line; see _flush."""
+    _output.append(line)
+
+def _flush():
+    """Write buffered output lines to stdout in a single call."""
+    if _output:
+        sys.stdout.write("\n".join(_output) + "\n")
+        sys.stdout.flush()
+        _output.clear()
+
+def _invalidate(path):
+    """Drop cached GETs that a write to `path` may have made stale."""
+    resource = "/" + path.lstrip("/").split("/", 1)[0]
+    prefixes = _INVALIDATES.get(resource)
+    if prefixes is None:
+        _get_cache.clear()
+        return
+    for key in [k for k in _get_cache if k.startswith(prefixes)]:
+        del _get_cache[key]
+
+async def _post(client, path, data):
+    """POST a JSON payload and return the response status and raw body."""
+    code, body = await _send(client, "POST", path, content=_dumps(data), headers=JSON_HEADERS)
+    if code < 400:
+        _invalidate(path)
+    return code, body
+
+async def _get(client, path):
+    """GET a path and return the response status and raw body.
+
+    Successful responses are served from cache for GET_CACHE_TTL seconds.
+    """
+    cached = _get_cache.get(path)
+    if cached is not None and time.monotonic() - cached[0] < GET_CACHE_TTL:
+        return cached[1]
+    code, body = await _send(client, "GET", path)
+    if code == 200:
+        _get_cache[path] = (time.monotonic(), (code, body))
+    return code, body
+
+async def create_students(client, students):
+    """Create several students with one bulk request.
+
+    Returns the created students in request order, or a list of None if the
+    batch failed.
+    """
     try:
-        response = requests.post(url, json=data)
-        if response.status_code == 201:
-            print(f"{_OK_CHAR} Created student: {first_name} {last_name} ({student_id})")
-            return response.json()
+        code, body = await _post(client, "/students/bulk", students)
+        if code == 201:
+            created = _loads(body)
+            for student in created:
+                _log(f"{_OK_CHAR} Created student: {student['first_name']} {student['last_name']} ({student['student_id']})")
+            return created
         else:
-            print(f"{_FAIL_CHAR} Failed to create student: {response.text}")
-            return None
+            _log(f"{_FAIL_CHAR} Failed to create students: {body.decode(errors='replace')}")
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error creating student: {e}")
-        return None
+        _log(f"{_FAIL_CHAR} Error creating students: {e}")
+    return [None] * len(students)
 
-def create_course(course_code, title, description, credits, department, prerequisites=None):
-    """Create a new course."""
-    url = f"{BASE_URL}/courses"
-    data = {
-        "course_code": course_code,
-        "title": title,
-        "description": description,
-        "credits": credits,
-        "department": department,
-        "prerequisites": prerequisites or []
-    }
+async def create_courses(client, courses):
+    """Create several courses with one bulk request.
+
+    Returns the created courses in request order, or a list of None if the
+    batch failed.
+    """
     try:
-        response = requests.post(url, json=data)
-        if response.status_code == 201:
-            print(f"{_OK_CHAR} Created course: {course_code} - {title}")
-            return response.json()
+        code, body = await _post(client, "/courses/bulk", courses)
+        if code == 201:
+            created = _loads(body)
+            for course in created:
+                _log(f"{_OK_CHAR} Created course: {course['course_code']} - {course['title']}")
+            return created
         else:
-            print(f"{_FAIL_CHAR} Failed to create course: {response.text}")
-            return None
+            _log(f"{_FAIL_CHAR} Failed to create courses: {body.decode(errors='replace')}")
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error creating course: {e}")
-        return None
+        _log(f"{_FAIL_CHAR} Error creating courses: {e}")
+    return [None] * len(courses)
 
-def create_section(course_id, section_number, semester, year, instructor_id, capacity):
+async def create_section(client, course_id, section_number, semester, year, instructor_id, capacity):
     """Create a new section."""
-    url = f"{BASE_URL}/sections"
     data = {
         "course_id": course_id,
         "section_number": section_number,
@@ -128,105 +316,104 @@ def create_section(course_id, section_number, semester, year, instructor_id, cap
         "capacity": capacity
     }
     try:
-        response = requests.post(url, json=data)
-        if response.status_code == 201:
-            print(f"{_OK_CHAR} Created section: {section_number} for course {course_id}")
-            return response.json()
+        code, body = await _post(client, "/sections", data)
+        if code == 201:
+            _log(f"{_OK_CHAR} Created section: {section_number} for course {course_id}")
+            return _loads(body)
         else:
-            print(f"{_FAIL_CHAR} Failed to create section: {response.text}")
+            _log(f"{_FAIL_CHAR} Failed to create section: {body.decode(errors='replace')}")
             return None
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error creating section: {e}")
+        _log(f"{_FAIL_CHAR} Error creating section: {e}")
         return None
 
-def enroll_student(student_id, section_id):
-    """Enroll a student in a section."""
-    url = f"{BASE_URL}/enrollments"
-    data = {
-        "student_id": student_id,
-        "section_id": section_id
-    }
+async def enroll_students(client, enrollments):
+    """Submit several enrollments with one bulk request.
+
+    Returns one result per requested enrollment, or a list of None if the
+    batch failed.
+    """
     try:
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            result = response.json()
-            status = result.get('status', 'unknown')
-            if status == 'confirmed':
-                print(f"{_OK_CHAR} Enrolled student {student_id}: {result['message']}")
-            elif status == 'waitlisted':
-                pos = result.get('waitlist_position', '?')
-                print(f"{_WARN_CHAR} Student {student_id} waitlisted at position {pos}")
-            else:
-                print(f"{_INFO_CHAR} Student {student_id}: {result['message']}")
-            return result
+        code, body = await _post(client, "/enrollments/bulk", enrollments)
+        if code == 200:
+            results = _loads(body)
+            for enrollment, result in zip(enrollments, results):
+                student_id = enrollment['student_id']
+                status = result.get('status', 'unknown')
+                if status == 'confirmed':
+                    _log(f"{_OK_CHAR} Enrolled student {student_id}: {result['message']}")
+                elif status == 'waitlisted':
+                    pos = result.get('waitlist_position', '?')
+                    _log(f"{_WARN_CHAR} Student {student_id} waitlisted at position {pos}")
+                elif status == 'rejected':
+                    _log(f"{_FAIL_CHAR} Failed to enroll student {student_id}: {result['message']}")
+                else:
+                    _log(f"{_INFO_CHAR} Student {student_id}: {result['message']}")
+            return results
         else:
-            print(f"{_FAIL_CHAR} Failed to enroll student: {response.text}")
-            return None
+            _log(f"{_FAIL_CHAR} Failed to enroll students: {body.decode(errors='replace')}")
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error enrolling student: {e}")
-        return None
+        _log(f"{_FAIL_CHAR} Error enrolling students: {e}")
+    return [None] * len(enrollments)
 
-def list_students():
+async def list_students(client):
     """List all students."""
-    url = f"{BASE_URL}/students"
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            students = response.json()
-            print(f"\n{'='*60}")
-            print(f"Students ({len(students)})")
-            print(f"{'='*60}")
+        code, body = await _get(client, "/students")
+        if code == 200:
+            students = _loads(body)
+            _log(f"\n{'='*60}")
+            _log(f"Students ({len(students)})")
+            _log(f"{'='*60}")
             for student in students:
-                print(f"  {student['student_id']:8} | {student['first_name']} {student['last_name']:15} | {student['grade_level']:12} | {student['email']}")
+                _log(f"  {student['student_id']:8} | {student['first_name']} {student['last_name']:15} | {student['grade_level']:12} | {student['email']}")
             return students
         else:
-            print(f"{_FAIL_CHAR} Failed to list students: {response.text}")
+            _log(f"{_FAIL_CHAR} Failed to list students: {body.decode(errors='replace')}")
             return []
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error listing students: {e}")
+        _log(f"{_FAIL_CHAR} Error listing students: {e}")
         return []
 
-def list_courses():
+async def list_courses(client):
     """List all courses."""
-    url = f"{BASE_URL}/courses"
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            courses = response.json()
-            print(f"\n{'='*60}")
-            print(f"Courses ({len(courses)})")
-            print(f"{'='*60}")
+        code, body = await _get(client, "/courses")
+        if code == 200:
+            courses = _loads(body)
+            _log(f"\n{'='*60}")
+            _log(f"Courses ({len(courses)})")
+            _log(f"{'='*60}")
             for course in courses:
                 prereqs = ", ".join(course.get('prerequisites', [])) or "None"
-                print(f"  {course['course_code']:10} | {course['title']:30} | {course['credits']} credits | Prereqs: {prereqs}")
+                _log(f"  {course['course_code']:10} | {course['title']:30} | {course['credits']} credits | Prereqs: {prereqs}")
             return courses
         else:
-            print(f"{_FAIL_CHAR} Failed to list courses: {response.text}")
+            _log(f"{_FAIL_CHAR} Failed to list courses: {body.decode(errors='replace')}")
             return []
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error listing courses: {e}")
+        _log(f"{_FAIL_CHAR} Error listing courses: {e}")
         return []
 
-def get_statistics():
+async def get_statistics(client):
     """Get system statistics."""
-    url = f"{BASE_URL}/statistics"
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            stats = response.json()
-            print(f"\n{'='*60}")
-            print("System Statistics")
-            print(f"{'='*60}")
-            print(json.dumps(stats['statistics'], indent=2))
+        code, body = await _get(client, "/statistics")
+        if code == 200:
+            stats = _loads(body)
+            _log(f"\n{'='*60}")
+            _log("System Statistics")
+            _log(f"{'='*60}")
+            _log(json.dumps(stats['statistics'], indent=2))
             return stats
         else:
-            print(f"{_FAIL_CHAR} Failed to get statistics: {response.text}")
+            _log(f"{_FAIL_CHAR} Failed to get statistics: {body.decode(errors='replace')}")
             return None
     except Exception as e:
-        print(f"{_FAIL_CHAR} Error getting statistics: {e}")
+        _log(f"{_FAIL_CHAR} Error getting statistics: {e}")
         return None
 
-def main():
+async def main():
     """Main execution."""
     print("="*60)
     print("Argos Platform - Data Addition Script")
@@ -241,73 +428,9 @@ def main():
     print("Adding Sample Data...")
     print("="*60 + "\n")
     
-    # Create students
-    print("Creating students...")
-    students = []
-    students.append(create_student("Alice", "Johnson", "alice.johnson@university.edu", "S001", "freshman"))
-    students.append(create_student("Bob", "Smith", "bob.smith@university.edu", "S002", "sophomore"))
-    students.append(create_student("Carol", "Davis", "carol.davis@university.edu", "S003", "junior"))
-    students.append(create_student("David", "Wilson", "david.wilson@university.edu", "S004", "senior"))
-    students.append(create_student("Emma", "Brown", "emma.brown@university.edu", "S005", "freshman"))
-    students.append(create_student("Frank", "Miller", "frank.miller@university.edu", "S006", "sophomore"))
-    
-    # Create courses
-    print("\nCreating courses...")
-    courses = []
-    courses.append(create_course("CS101", "Introduction to Programming", "Learn Python programming basics", 3, "Computer Science"))
-    courses.append(create_course("CS201", "Data Structures", "Advanced data structures and algorithms", 4, "Computer Science", ["CS101"]))
-    courses.append(create_course("CS301", "Database Systems", "Relational databases and SQL", 3, "Computer Science", ["CS201"]))
-    courses.append(create_course("MATH101", "Calculus I", "Differential calculus", 4, "Mathematics"))
-    courses.append(create_course("MATH201", "Calculus II", "Integral calculus", 4, "Mathematics", ["MATH101"]))
-    courses.append(create_course("ENG101", "English Composition", "Academic writing skills", 3, "English"))
-    
-    # Create sections
-    print("\nCreating sections...")
-    sections = []
-    if courses[0]:  # CS101
-        sections.append(create_section(courses[0]['id'], "001", "Fall", 2024, "instructor-1", 30))
-        sections.append(create_section(courses[0]['id'], "002", "Fall", 2024, "instructor-2", 25))
-    
-    if courses[1]:  # CS201
-        sections.append(create_section(courses[1]['id'], "001", "Fall", 2024, "instructor-1", 20))
-    
-    if courses[3]:  # MATH101
-        sections.append(create_section(courses[3]['id'], "001", "Fall", 2024, "instructor-3", 35))
-    
-    if courses[5]:  # ENG101
-        sections.append(create_section(courses[5]['id'], "001", "Fall", 2024, "instructor-4", 25))
-    
-    # Enroll students
-    print("\nEnrolling students...")
-    if students[0] and sections[0]:  # Alice in CS101-001
-        enroll_student(students[0]['student_id'], sections[0]['id'])
-    
-    if students[1] and sections[0]:  # Bob in CS101-001
-        enroll_student(students[1]['student_id'], sections[0]['id'])
-    
-    if students[2] and sections[1]:  # Carol in CS101-002
-        enroll_student(students[2]['student_id'], sections[1]['id'])
-    
-    if students[3] and sections[2]:  # David in CS201-001
-        enroll_student(students[3]['student_id'], sections[2]['id'])
-    
-    if students[4] and sections[3]:  # Emma in MATH101-001
-        enroll_student(students[4]['student_id'], sections[3]['id'])
-    
-    if students[5] and sections[4]:  # Frank in ENG101-001
-        enroll_student(students[5]['student_id'], sections[4]['id'])
-    
-    # Also enroll some students in multiple courses
-    if students[0] and sections[3]:  # Alice in MATH101
-        enroll_student(students[0]['student_id'], sections[3]['id'])
-    
-    if students[1] and sections[4]:  # Bob in ENG101
-        enroll_student(students[1]['student_id'], sections[4]['id'])
-    
-    # Display results
-    list_students()
-    list_courses()
-    get_statistics()
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=HTTP2_AVAILABLE,
+                                 limits=LIMITS, timeout=5.0) as client:
+        await _add_sample_data(client)
     
     print("\n" + "="*60)
     print(f"{_OK_CHAR} Sample data added successfully!")
@@ -319,9 +442,47 @@ def main():
     print(f"  - Get statistics: curl {BASE_URL}/statistics")
     print()
 
+async def _add_sample_data(client):
+    """Create the sample records described by the tables at the top of the module."""
+    # Students depend on nothing, so their batch runs alongside the
+    # course -> section chain; only the enrollments need both sides.
+    _log("Creating students, courses and sections...")
+    students_task = asyncio.create_task(create_students(client, STUDENTS))
+    
+    courses = await create_courses(client, COURSES)
+    
+    # `sections` stays aligned with SECTIONS_SPEC, holding None where the
+    # course (or the section itself) could not be created.
+    async def section_for(course_idx, *spec):
+        course = courses[course_idx]
+        return await create_section(client, course['id'], *spec) if course else None
+    
+    sections = await asyncio.gather(*(section_for(*spec) for spec in SECTIONS_SPEC))
+    students = await students_task
+    _flush()
+    
+    # Enroll students
+    _log("\nEnrolling students...")
+    enrollments = [
+        {"student_id": students[student_idx]["student_id"], "section_id": sections[section_idx]["id"]}
+        for student_idx, section_idx in ENROLLMENTS_SPEC
+        if students[student_idx] and sections[section_idx]
+    ]
+    if enrollments:
+        await enroll_students(client, enrollments)
+    _flush()
+    
+    # Display results
+    await list_students(client)
+    await list_courses(client)
+    await get_statistics(client)
+    _flush()
+
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print(f"\n\n{_FAIL_CHAR} Interrupted by user")
         sys.exit(1)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rgos.proto\x12\x05\x61rgos\"\xca\x01\n\x06Person\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\x12&\n\x0bperson_type\x18\x05 \x01(\x0e\x32\x11.argos.PersonType\x12\r\n\x05roles\x18\x06 \x03(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\x03\x12\x12\n\nupdated_at\x18\x08 \x01(\x03\x12\x0f\n\x07version\x18\t \x01(\x05\x12\x0e\n\x06status\x18\n \x01(\t\"\xbd\x01\n\x07Student\x12\x1d\n\x06person\x18\x01 \x01(\x0b\x32\r.argos.Person\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x13\n\x0bgrade_level\x18\x03 \x01(\t\x12\x10\n\x03gpa\x18\x04 \x01(\x02H\x00\x88\x01\x01\x12\x19\n\x11\x61\x63\x61\x64\x65mic_standing\x18\x05 \x01(\t\x12\x14\n\x07\x61\x64visor\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x0b\x65nrollments\x18\x07 \x03(\tB\x06\n\x04_gpaB\n\n\x08_advisor\"\x83\x02\n\x08Lecturer\x12\x1d\n\x06person\x18\x01 \x01(\x0b\x32\r.argos.Person\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\t\x12\x12\n\ndepartment\x18\x03 \x01(\t\x12\x0f\n\x07\x63ourses\x18\x04 \x03(\t\x12\x36\n\x0coffice_hours\x18\x05 \x03(\x0b\x32 .argos.Lecturer.OfficeHoursEntry\x12\x1a\n\x12research_interests\x18\x06 \x03(\t\x12\x16\n\x0equalifications\x18\x07 \x03(\t\x1a\x32\n\x10OfficeHoursEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x88\x02\n\x06\x43ourse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07\x63redits\x18\x05 \x01(\x05\x12\x12\n\ndepartment\x18\x06 \x01(\t\x12\x15\n\rprerequisites\x18\x07 \x03(\t\x12\x10\n\x08sections\x18\x08 \x03(\t\x12\x15\n\x08syllabus\x18\t \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03\x12\x0f\n\x07version\x18\x0c \x01(\x05\x12\x0e\n\x06status\x18\r \x01(\tB\x0b\n\t_syllabus\"\xaf\x03\n\x07Section\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x16\n\x0esection_number\x18\x03 \x01(\t\x12\x10\n\x08semester\x18\x04 \x01(\t\x12\x0c\n\x04year\x18\x05 \x01(\x05\x12\x15\n\rinstructor_id\x18\x06 \x01(\t\x12\x14\n\x07room_id\x18\x07 \x01(\tH\x00\x88\x01\x01\x12.\n\x08schedule\x18\x08 \x03(\x0b\x32\x1c.argos.Section.ScheduleEntry\x12\x10\n\x08\x63\x61pacity\x18\t \x01(\x05\x12\x10\n\x08\x65nrolled\x18\n \x03(\t\x12\x10\n\x08waitlist\x18\x0b \x03(\t\x12\x1e\n\x11\x65nrollment_policy\x18\x0c \x01(\tH\x01\x88\x01\x01\x12\x12\n\ncreated_at\x18\r \x01(\x03\x12\x12\n\nupdated_at\x18\x0e \x01(\x03\x12\x0f\n\x07version\x18\x0f \x01(\x05\x12\x0e\n\x06status\x18\x10 \x01(\t\x1a/\n\rScheduleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\n\n\x08_room_idB\x14\n\x12_enrollment_policy\"\xba\x02\n\x05Grade\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x12\n\nsection_id\x18\x03 \x01(\t\x12\x15\n\rassessment_id\x18\x04 \x01(\t\x12\x16\n\x0cletter_grade\x18\x05 \x01(\tH\x00\x12\x17\n\rnumeric_grade\x18\x06 \x01(\x02H\x00\x12\x12\n\npercentage\x18\x07 \x01(\x02\x12\x11\n\tgraded_at\x18\x08 \x01(\x03\x12\x16\n\tgrader_id\x18\t \x01(\tH\x01\x88\x01\x01\x12\x10\n\x08\x63omments\x18\n \x01(\t\x12\x12\n\ncreated_at\x18\x0b \x01(\x03\x12\x12\n\nupdated_at\x18\x0c \x01(\x03\x12\x0f\n\x07version\x18\r \x01(\x05\x12\x0e\n\x06status\x18\x0e \x01(\tB\r\n\x0bgrade_valueB\x0c\n\n_grader_id\"\xd3\x01\n\x08\x46\x61\x63ility\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rfacility_type\x18\x03 \x01(\t\x12\x10\n\x08location\x18\x04 \x01(\t\x12\r\n\x05rooms\x18\x05 \x03(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_level\x18\x06 \x01(\t\x12\x16\n\x0esecurity_zones\x18\x07 \x03(\t\x12\x12\n\ncreated_at\x18\x08 \x01(\x03\x12\x12\n\nupdated_at\x18\t \x01(\x03\x12\x0f\n\x07version\x18\n \x01(\x05\x12\x0e\n\x06status\x18\x0b \x01(\t\"\xdd\x02\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0broom_number\x18\x02 \x01(\t\x12\x13\n\x0b\x66\x61\x63ility_id\x18\x03 \x01(\t\x12\x11\n\troom_type\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\x05\x12\x11\n\tequipment\x18\x06 \x03(\t\x12\x16\n\x0e\x61\x63\x63\x65ss_control\x18\x07 \x01(\x08\x12:\n\x10\x62ooking_schedule\x18\x08 \x03(\x0b\x32 .argos.Room.BookingScheduleEntry\x12\x12\n\ncreated_at\x18\t \x01(\x03\x12\x12\n\nupdated_at\x18\n \x01(\x03\x12\x0f\n\x07version\x18\x0b \x01(\x05\x12\x0e\n\x06status\x18\x0c \x01(\t\x1aJ\n\x14\x42ookingScheduleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.argos.BookingInfo:\x02\x38\x01\"F\n\x0b\x42ookingInfo\x12\x11\n\tbooker_id\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\x03\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\x03\"\xe1\x01\n\x05\x45vent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tstream_id\x18\x02 \x01(\t\x12$\n\nevent_type\x18\x03 \x01(\x0e\x32\x10.argos.EventType\x12\x12\n\nevent_data\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\x03\x12\x0f\n\x07version\x18\x06 \x01(\x05\x12\x1b\n\x0e\x63orrelation_id\x18\x07 \x01(\tH\x00\x88\x01\x01\x12\x19\n\x0c\x63\x61usation_id\x18\x08 \x01(\tH\x01\x88\x01\x01\x42\x11\n\x0f_correlation_idB\x0f\n\r_causation_id\"u\n\x14\x43reateStudentRequest\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x11\n\tlast_name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x12\n\nstudent_id\x18\x04 \x01(\t\x12\x13\n\x0bgrade_level\x18\x05 \x01(\t\"k\n\x15\x43reateStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07student\x18\x03 \x01(\x0b\x32\x0e.argos.StudentH\x00\x88\x01\x01\x42\n\n\x08_student\"\'\n\x11GetStudentRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"h\n\x12GetStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07student\x18\x03 \x01(\x0b\x32\x0e.argos.StudentH\x00\x88\x01\x01\x42\n\n\x08_student\">\n\x14\x45nrollStudentRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\x12\n\nsection_id\x18\x02 \x01(\t\"\x7f\n\x15\x45nrollStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x1e\n\x11waitlist_position\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\x14\n\x12_waitlist_position\"\x8a\x01\n\x13\x43reateCourseRequest\x12\x13\n\x0b\x63ourse_code\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x63redits\x18\x04 \x01(\x05\x12\x12\n\ndepartment\x18\x05 \x01(\t\x12\x15\n\rprerequisites\x18\x06 \x03(\t\"g\n\x14\x43reateCourseResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06\x63ourse\x18\x03 \x01(\x0b\x32\r.argos.CourseH\x00\x88\x01\x01\x42\t\n\x07_course\"\x8a\x01\n\x14\x43reateSectionRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x16\n\x0esection_number\x18\x02 \x01(\t\x12\x10\n\x08semester\x18\x03 \x01(\t\x12\x0c\n\x04year\x18\x04 \x01(\x05\x12\x15\n\rinstructor_id\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x05\"k\n\x15\x43reateSectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07section\x18\x03 \x01(\x0b\x32\x0e.argos.SectionH\x00\x88\x01\x01\x42\n\n\x08_section\"\x9a\x01\n\x16ScheduleSectionRequest\x12\x12\n\nsection_id\x18\x01 \x01(\t\x12#\n\ntime_slots\x18\x02 \x03(\x0b\x32\x0f.argos.TimeSlot\x12\x32\n\x11room_requirements\x18\x03 \x01(\x0b\x32\x17.argos.RoomRequirements\x12\x13\n\x0b\x63onstraints\x18\x04 \x03(\t\"E\n\x08TimeSlot\x12\x12\n\nstart_time\x18\x01 \x01(\x03\x12\x10\n\x08\x65nd_time\x18\x02 \x01(\x03\x12\x13\n\x0b\x64\x61y_of_week\x18\x03 \x01(\x05\"y\n\x10RoomRequirements\x12\x14\n\x0cmin_capacity\x18\x01 \x01(\x05\x12\x16\n\troom_type\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tequipment\x18\x03 \x03(\t\x12\x16\n\x0e\x61\x63\x63\x65ss_control\x18\x04 \x01(\x08\x42\x0c\n\n_room_type\"\xcf\x01\n\x17ScheduleSectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0bschedule_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1a\n\rassigned_room\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\'\n\x0e\x61ssigned_times\x18\x05 \x03(\x0b\x32\x0f.argos.TimeSlot\x12\x11\n\tconflicts\x18\x06 \x03(\tB\x0e\n\x0c_schedule_idB\x10\n\x0e_assigned_room\"+\n\x15GetEnrollmentsRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"O\n\x16GetEnrollmentsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bsection_ids\x18\x03 \x03(\t\"(\n\x12GetScheduleRequest\x12\x12\n\nsection_id\x18\x01 \x01(\t\"\xa8\x01\n\x13GetScheduleResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0bschedule_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07room_id\x18\x04 \x01(\tH\x01\x88\x01\x01\x12#\n\ntime_slots\x18\x05 \x03(\x0b\x32\x0f.argos.TimeSlotB\x0e\n\x0c_schedule_idB\n\n\x08_room_id\"=\n\x13MLPredictionRequest\x12\x12\n\nmodel_type\x18\x01 \x01(\t\x12\x12\n\ninput_data\x18\x02 \x01(\t\"a\n\x14MLPredictionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nprediction\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\"+\n\x14GetStatisticsRequest\x12\x13\n\x0b\x65ntity_type\x18\x01 \x01(\t\"M\n\x15GetStatisticsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nstatistics\x18\x03 \x01(\t*H\n\nPersonType\x12\x0b\n\x07STUDENT\x10\x00\x12\x0c\n\x08LECTURER\x10\x01\x12\t\n\x05STAFF\x10\x02\x12\t\n\x05\x41\x44MIN\x10\x03\x12\t\n\x05GUEST\x10\x04*\x8c\x01\n\tEventType\x12\x0e\n\nENROLLMENT\x10\x00\x12\x0b\n\x07GRADING\x10\x01\x12\x13\n\x0f\x46\x41\x43ILITY_ACCESS\x10\x02\x12\x15\n\x11SECURITY_INCIDENT\x10\x03\x12\x10\n\x0cSYSTEM_ALERT\x10\x04\x12\x11\n\rPOLICY_CHANGE\x10\x05\x12\x11\n\rML_PREDICTION\x10\x06\x32\xfd\x05\n\x0c\x41rgosService\x12J\n\rCreateStudent\x12\x1b.argos.CreateStudentRequest\x1a\x1c.argos.CreateStudentResponse\x12\x41\n\nGetStudent\x12\x18.argos.GetStudentRequest\x1a\x19.argos.GetStudentResponse\x12J\n\rEnrollStudent\x12\x1b.argos.EnrollStudentRequest\x1a\x1c.argos.EnrollStudentResponse\x12M\n\x0eGetEnrollments\x12\x1c.argos.GetEnrollmentsRequest\x1a\x1d.argos.GetEnrollmentsResponse\x12G\n\x0c\x43reateCourse\x12\x1a.argos.CreateCourseRequest\x1a\x1b.argos.CreateCourseResponse\x12J\n\rCreateSection\x12\x1b.argos.CreateSectionRequest\x1a\x1c.argos.CreateSectionResponse\x12P\n\x0fScheduleSection\x12\x1d.argos.ScheduleSectionRequest\x1a\x1e.argos.ScheduleSectionResponse\x12\x44\n\x0bGetSchedule\x12\x19.argos.GetScheduleRequest\x1a\x1a.argos.GetScheduleResponse\x12J\n\x0fGetMLPrediction\x12\x1a.argos.MLPredictionRequest\x1a\x1b.argos.MLPredictionResponse\x12J\n\rGetStatistics\x12\x1b.argos.GetStatisticsRequest\x1a\x1c.argos.GetStatisticsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rgos.proto\x12\x05\x61rgos\"\xca\x01\n\x06Person\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\x12&\n\x0bperson_type\x18\x05 \x01(\x0e\x32\x11.argos.PersonType\x12\r\n\x05roles\x18\x06 \x03(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\x03\x12\x12\n\nupdated_at\x18\x08 \x01(\x03\x12\x0f\n\x07version\x18\t \x01(\x05\x12\x0e\n\x06status\x18\n \x01(\t\"\xbd\x01\n\x07Student\x12\x1d\n\x06person\x18\x01 \x01(\x0b\x32\r.argos.Person\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x13\n\x0bgrade_level\x18\x03 \x01(\t\x12\x10\n\x03gpa\x18\x04 \x01(\x02H\x00\x88\x01\x01\x12\x19\n\x11\x61\x63\x61\x64\x65mic_standing\x18\x05 \x01(\t\x12\x14\n\x07\x61\x64visor\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x0b\x65nrollments\x18\x07 \x03(\tB\x06\n\x04_gpaB\n\n\x08_advisor\"\x83\x02\n\x08Lecturer\x12\x1d\n\x06person\x18\x01 \x01(\x0b\x32\r.argos.Person\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\t\x12\x12\n\ndepartment\x18\x03 \x01(\t\x12\x0f\n\x07\x63ourses\x18\x04 \x03(\t\x12\x36\n\x0coffice_hours\x18\x05 \x03(\x0b\x32 .argos.Lecturer.OfficeHoursEntry\x12\x1a\n\x12research_interests\x18\x06 \x03(\t\x12\x16\n\x0equalifications\x18\x07 \x03(\t\x1a\x32\n\x10OfficeHoursEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x88\x02\n\x06\x43ourse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ourse_code\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07\x63redits\x18\x05 \x01(\x05\x12\x12\n\ndepartment\x18\x06 \x01(\t\x12\x15\n\rprerequisites\x18\x07 \x03(\t\x12\x10\n\x08sections\x18\x08 \x03(\t\x12\x15\n\x08syllabus\x18\t \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncreated_at\x18\n \x01(\x03\x12\x12\n\nupdated_at\x18\x0b \x01(\x03\x12\x0f\n\x07version\x18\x0c \x01(\x05\x12\x0e\n\x06status\x18\r \x01(\tB\x0b\n\t_syllabus\"\xaf\x03\n\x07Section\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x16\n\x0esection_number\x18\x03 \x01(\t\x12\x10\n\x08semester\x18\x04 \x01(\t\x12\x0c\n\x04year\x18\x05 \x01(\x05\x12\x15\n\rinstructor_id\x18\x06 \x01(\t\x12\x14\n\x07room_id\x18\x07 \x01(\tH\x00\x88\x01\x01\x12.\n\x08schedule\x18\x08 \x03(\x0b\x32\x1c.argos.Section.ScheduleEntry\x12\x10\n\x08\x63\x61pacity\x18\t \x01(\x05\x12\x10\n\x08\x65nrolled\x18\n \x03(\t\x12\x10\n\x08waitlist\x18\x0b \x03(\t\x12\x1e\n\x11\x65nrollment_policy\x18\x0c \x01(\tH\x01\x88\x01\x01\x12\x12\n\ncreated_at\x18\r \x01(\x03\x12\x12\n\nupdated_at\x18\x0e \x01(\x03\x12\x0f\n\x07version\x18\x0f \x01(\x05\x12\x0e\n\x06status\x18\x10 \x01(\t\x1a/\n\rScheduleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\n\n\x08_room_idB\x14\n\x12_enrollment_policy\"\xba\x02\n\x05Grade\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nstudent_id\x18\x02 \x01(\t\x12\x12\n\nsection_id\x18\x03 \x01(\t\x12\x15\n\rassessment_id\x18\x04 \x01(\t\x12\x16\n\x0cletter_grade\x18\x05 \x01(\tH\x00\x12\x17\n\rnumeric_grade\x18\x06 \x01(\x02H\x00\x12\x12\n\npercentage\x18\x07 \x01(\x02\x12\x11\n\tgraded_at\x18\x08 \x01(\x03\x12\x16\n\tgrader_id\x18\t \x01(\tH\x01\x88\x01\x01\x12\x10\n\x08\x63omments\x18\n \x01(\t\x12\x12\n\ncreated_at\x18\x0b \x01(\x03\x12\x12\n\nupdated_at\x18\x0c \x01(\x03\x12\x0f\n\x07version\x18\r \x01(\x05\x12\x0e\n\x06status\x18\x0e \x01(\tB\r\n\x0bgrade_valueB\x0c\n\n_grader_id\"\xd3\x01\n\x08\x46\x61\x63ility\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rfacility_type\x18\x03 \x01(\t\x12\x10\n\x08location\x18\x04 \x01(\t\x12\r\n\x05rooms\x18\x05 \x03(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_level\x18\x06 \x01(\t\x12\x16\n\x0esecurity_zones\x18\x07 \x03(\t\x12\x12\n\ncreated_at\x18\x08 \x01(\x03\x12\x12\n\nupdated_at\x18\t \x01(\x03\x12\x0f\n\x07version\x18\n \x01(\x05\x12\x0e\n\x06status\x18\x0b \x01(\t\"\xdd\x02\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0broom_number\x18\x02 \x01(\t\x12\x13\n\x0b\x66\x61\x63ility_id\x18\x03 \x01(\t\x12\x11\n\troom_type\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\x05\x12\x11\n\tequipment\x18\x06 \x03(\t\x12\x16\n\x0e\x61\x63\x63\x65ss_control\x18\x07 \x01(\x08\x12:\n\x10\x62ooking_schedule\x18\x08 \x03(\x0b\x32 .argos.Room.BookingScheduleEntry\x12\x12\n\ncreated_at\x18\t \x01(\x03\x12\x12\n\nupdated_at\x18\n \x01(\x03\x12\x0f\n\x07version\x18\x0b \x01(\x05\x12\x0e\n\x06status\x18\x0c \x01(\t\x1aJ\n\x14\x42ookingScheduleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.argos.BookingInfo:\x02\x38\x01\"F\n\x0b\x42ookingInfo\x12\x11\n\tbooker_id\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\x03\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\x03\"\xe1\x01\n\x05\x45vent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tstream_id\x18\x02 \x01(\t\x12$\n\nevent_type\x18\x03 \x01(\x0e\x32\x10.argos.EventType\x12\x12\n\nevent_data\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\x03\x12\x0f\n\x07version\x18\x06 \x01(\x05\x12\x1b\n\x0e\x63orrelation_id\x18\x07 \x01(\tH\x00\x88\x01\x01\x12\x19\n\x0c\x63\x61usation_id\x18\x08 \x01(\tH\x01\x88\x01\x01\x42\x11\n\x0f_correlation_idB\x0f\n\r_causation_id\"u\n\x14\x43reateStudentRequest\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x11\n\tlast_name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x12\n\nstudent_id\x18\x04 \x01(\t\x12\x13\n\x0bgrade_level\x18\x05 \x01(\t\"k\n\x15\x43reateStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07student\x18\x03 \x01(\x0b\x32\x0e.argos.StudentH\x00\x88\x01\x01\x42\n\n\x08_student\"\'\n\x11GetStudentRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"h\n\x12GetStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07student\x18\x03 \x01(\x0b\x32\x0e.argos.StudentH\x00\x88\x01\x01\x42\n\n\x08_student\">\n\x14\x45nrollStudentRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\x12\x12\n\nsection_id\x18\x02 \x01(\t\"\x7f\n\x15\x45nrollStudentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x1e\n\x11waitlist_position\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\x14\n\x12_waitlist_position\"\x8a\x01\n\x13\x43reateCourseRequest\x12\x13\n\x0b\x63ourse_code\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x63redits\x18\x04 \x01(\x05\x12\x12\n\ndepartment\x18\x05 \x01(\t\x12\x15\n\rprerequisites\x18\x06 \x03(\t\"g\n\x14\x43reateCourseResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\"\n\x06\x63ourse\x18\x03 \x01(\x0b\x32\r.argos.CourseH\x00\x88\x01\x01\x42\t\n\x07_course\"\x8a\x01\n\x14\x43reateSectionRequest\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x16\n\x0esection_number\x18\x02 \x01(\t\x12\x10\n\x08semester\x18\x03 \x01(\t\x12\x0c\n\x04year\x18\x04 \x01(\x05\x12\x15\n\rinstructor_id\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x05\"k\n\x15\x43reateSectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\x07section\x18\x03 \x01(\x0b\x32\x0e.argos.SectionH\x00\x88\x01\x01\x42\n\n\x08_section\"G\n\x16\x43reateStudentsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0b\n\x03ids\x18\x03 \x03(\t\"F\n\x15\x43reateCoursesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0b\n\x03ids\x18\x03 \x03(\t\"G\n\x16\x43reateSectionsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0b\n\x03ids\x18\x03 \x03(\t\"\x9a\x01\n\x16ScheduleSectionRequest\x12\x12\n\nsection_id\x18\x01 \x01(\t\x12#\n\ntime_slots\x18\x02 \x03(\x0b\x32\x0f.argos.TimeSlot\x12\x32\n\x11room_requirements\x18\x03 \x01(\x0b\x32\x17.argos.RoomRequirements\x12\x13\n\x0b\x63onstraints\x18\x04 \x03(\t\"E\n\x08TimeSlot\x12\x12\n\nstart_time\x18\x01 \x01(\x03\x12\x10\n\x08\x65nd_time\x18\x02 \x01(\x03\x12\x13\n\x0b\x64\x61y_of_week\x18\x03 \x01(\x05\"y\n\x10RoomRequirements\x12\x14\n\x0cmin_capacity\x18\x01 \x01(\x05\x12\x16\n\troom_type\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tequipment\x18\x03 \x03(\t\x12\x16\n\x0e\x61\x63\x63\x65ss_control\x18\x04 \x01(\x08\x42\x0c\n\n_room_type\"\xcf\x01\n\x17ScheduleSectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0bschedule_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1a\n\rassigned_room\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\'\n\x0e\x61ssigned_times\x18\x05 \x03(\x0b\x32\x0f.argos.TimeSlot\x12\x11\n\tconflicts\x18\x06 \x03(\tB\x0e\n\x0c_schedule_idB\x10\n\x0e_assigned_room\"+\n\x15GetEnrollmentsRequest\x12\x12\n\nstudent_id\x18\x01 \x01(\t\"O\n\x16GetEnrollmentsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bsection_ids\x18\x03 \x03(\t\"&\n\x0f\x45nrollmentBatch\x12\x13\n\x0bsection_ids\x18\x01 \x03(\t\"(\n\x12GetScheduleRequest\x12\x12\n\nsection_id\x18\x01 \x01(\t\"\xa8\x01\n\x13GetScheduleResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0bschedule_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07room_id\x18\x04 \x01(\tH\x01\x88\x01\x01\x12#\n\ntime_slots\x18\x05 \x03(\x0b\x32\x0f.argos.TimeSlotB\x0e\n\x0c_schedule_idB\n\n\x08_room_id\"=\n\x13MLPredictionRequest\x12\x12\n\nmodel_type\x18\x01 \x01(\t\x12\x12\n\ninput_data\x18\x02 \x01(\t\"a\n\x14MLPredictionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nprediction\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\"+\n\x14GetStatisticsRequest\x12\x13\n\x0b\x65ntity_type\x18\x01 \x01(\t\"M\n\x15GetStatisticsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nstatistics\x18\x03 \x01(\t*H\n\nPersonType\x12\x0b\n\x07STUDENT\x10\x00\x12\x0c\n\x08LECTURER\x10\x01\x12\t\n\x05STAFF\x10\x02\x12\t\n\x05\x41\x44MIN\x10\x03\x12\t\n\x05GUEST\x10\x04*\x8c\x01\n\tEventType\x12\x0e\n\nENROLLMENT\x10\x00\x12\x0b\n\x07GRADING\x10\x01\x12\x13\n\x0f\x46\x41\x43ILITY_ACCESS\x10\x02\x12\x15\n\x11SECURITY_INCIDENT\x10\x03\x12\x10\n\x0cSYSTEM_ALERT\x10\x04\x12\x11\n\rPOLICY_CHANGE\x10\x05\x12\x11\n\rML_PREDICTION\x10\x06\x32\xb7\x08\n\x0c\x41rgosService\x12J\n\rCreateStudent\x12\x1b.argos.CreateStudentRequest\x1a\x1c.argos.CreateStudentResponse\x12\x41\n\nGetStudent\x12\x18.argos.GetStudentRequest\x1a\x19.argos.GetStudentResponse\x12J\n\rEnrollStudent\x12\x1b.argos.EnrollStudentRequest\x1a\x1c.argos.EnrollStudentResponse\x12M\n\x0eGetEnrollments\x12\x1c.argos.GetEnrollmentsRequest\x1a\x1d.argos.GetEnrollmentsResponse\x12K\n\x11StreamEnrollments\x12\x1c.argos.GetEnrollmentsRequest\x1a\x16.argos.EnrollmentBatch0\x01\x12G\n\x0c\x43reateCourse\x12\x1a.argos.CreateCourseRequest\x1a\x1b.argos.CreateCourseResponse\x12J\n\rCreateSection\x12\x1b.argos.CreateSectionRequest\x1a\x1c.argos.CreateSectionResponse\x12N\n\x0e\x43reateStudents\x12\x1b.argos.CreateStudentRequest\x1a\x1d.argos.CreateStudentsResponse(\x01\x12K\n\rCreateCourses\x12\x1a.argos.CreateCourseRequest\x1a\x1c.argos.CreateCoursesResponse(\x01\x12N\n\x0e\x43reateSections\x12\x1b.argos.CreateSectionRequest\x1a\x1d.argos.CreateSectionsResponse(\x01\x12P\n\x0fScheduleSection\x12\x1d.argos.ScheduleSectionRequest\x1a\x1e.argos.ScheduleSectionResponse\x12\x44\n\x0bGetSchedule\x12\x19.argos.GetScheduleRequest\x1a\x1a.argos.GetScheduleResponse\x12J\n\x0fGetMLPrediction\x12\x1a.argos.MLPredictionRequest\x1a\x1b.argos.MLPredictionResponse\x12J\n\rGetStatistics\x12\x1b.argos.GetStatisticsRequest\x1a\x1c.argos.GetStatisticsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,10 +37,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SECTION_SCHEDULEENTRY']._serialized_options = b'8\001'
   _globals['_ROOM_BOOKINGSCHEDULEENTRY']._loaded_options = None
   _globals['_ROOM_BOOKINGSCHEDULEENTRY']._serialized_options = b'8\001'
-  _globals['_PERSONTYPE']._serialized_start=4815
-  _globals['_PERSONTYPE']._serialized_end=4887
-  _globals['_EVENTTYPE']._serialized_start=4890
-  _globals['_EVENTTYPE']._serialized_end=5030
+  _globals['_PERSONTYPE']._serialized_start=5073
+  _globals['_PERSONTYPE']._serialized_end=5145
+  _globals['_EVENTTYPE']._serialized_start=5148
+  _globals['_EVENTTYPE']._serialized_end=5288
   _globals['_PERSON']._serialized_start=23
   _globals['_PERSON']._serialized_end=225
   _globals['_STUDENT']._serialized_start=228
@@ -87,30 +87,38 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CREATESECTIONREQUEST']._serialized_end=3518
   _globals['_CREATESECTIONRESPONSE']._serialized_start=3520
   _globals['_CREATESECTIONRESPONSE']._serialized_end=3627
-  _globals['_SCHEDULESECTIONREQUEST']._serialized_start=3630
-  _globals['_SCHEDULESECTIONREQUEST']._serialized_end=3784
-  _globals['_TIMESLOT']._serialized_start=3786
-  _globals['_TIMESLOT']._serialized_end=3855
-  _globals['_ROOMREQUIREMENTS']._serialized_start=3857
-  _globals['_ROOMREQUIREMENTS']._serialized_end=3978
-  _globals['_SCHEDULESECTIONRESPONSE']._serialized_start=3981
-  _globals['_SCHEDULESECTIONRESPONSE']._serialized_end=4188
-  _globals['_GETENROLLMENTSREQUEST']._serialized_start=4190
-  _globals['_GETENROLLMENTSREQUEST']._serialized_end=4233
-  _globals['_GETENROLLMENTSRESPONSE']._serialized_start=4235
-  _globals['_GETENROLLMENTSRESPONSE']._serialized_end=4314
-  _globals['_GETSCHEDULEREQUEST']._serialized_start=4316
-  _globals['_GETSCHEDULEREQUEST']._serialized_end=4356
-  _globals['_GETSCHEDULERESPONSE']._serialized_start=4359
-  _globals['_GETSCHEDULERESPONSE']._serialized_end=4527
-  _globals['_MLPREDICTIONREQUEST']._serialized_start=4529
-  _globals['_MLPREDICTIONREQUEST']._serialized_end=4590
-  _globals['_MLPREDICTIONRESPONSE']._serialized_start=4592
-  _globals['_MLPREDICTIONRESPONSE']._serialized_end=4689
-  _globals['_GETSTATISTICSREQUEST']._serialized_start=4691
-  _globals['_GETSTATISTICSREQUEST']._serialized_end=4734
-  _globals['_GETSTATISTICSRESPONSE']._serialized_start=4736
-  _globals['_GETSTATISTICSRESPONSE']._serialized_end=4813
-  _globals['_ARGOSSERVICE']._serialized_start=5033
-  _globals['_ARGOSSERVICE']._serialized_end=5798
+  _globals['_CREATESTUDENTSRESPONSE']._serialized_start=3629
+  _globals['_CREATESTUDENTSRESPONSE']._serialized_end=3700
+  _globals['_CREATECOURSESRESPONSE']._serialized_start=3702
+  _globals['_CREATECOURSESRESPONSE']._serialized_end=3772
+  _globals['_CREATESECTIONSRESPONSE']._serialized_start=3774
+  _globals['_CREATESECTIONSRESPONSE']._serialized_end=3845
+  _globals['_SCHEDULESECTIONREQUEST']._serialized_start=3848
+  _globals['_SCHEDULESECTIONREQUEST']._serialized_end=4002
+  _globals['_TIMESLOT']._serialized_start=4004
+  _globals['_TIMESLOT']._serialized_end=4073
+  _globals['_ROOMREQUIREMENTS']._serialized_start=4075
+  _globals['_ROOMREQUIREMENTS']._serialized_end=4196
+  _globals['_SCHEDULESECTIONRESPONSE']._serialized_start=4199
+  _globals['_SCHEDULESECTIONRESPONSE']._serialized_end=4406
+  _globals['_GETENROLLMENTSREQUEST']._serialized_start=4408
+  _globals['_GETENROLLMENTSREQUEST']._serialized_end=4451
+  _globals['_GETENROLLMENTSRESPONSE']._serialized_start=4453
+  _globals['_GETENROLLMENTSRESPONSE']._serialized_end=4532
+  _globals['_ENROLLMENTBATCH']._serialized_start=4534
+  _globals['_ENROLLMENTBATCH']._serialized_end=4572
+  _globals['_GETSCHEDULEREQUEST']._serialized_start=4574
+  _globals['_GETSCHEDULEREQUEST']._serialized_end=4614
+  _globals['_GETSCHEDULERESPONSE']._serialized_start=4617
+  _globals['_GETSCHEDULERESPONSE']._serialized_end=4785
+  _globals['_MLPREDICTIONREQUEST']._serialized_start=4787
+  _globals['_MLPREDICTIONREQUEST']._serialized_end=4848
+  _globals['_MLPREDICTIONRESPONSE']._serialized_start=4850
+  _globals['_MLPREDICTIONRESPONSE']._serialized_end=4947
+  _globals['_GETSTATISTICSREQUEST']._serialized_start=4949
+  _globals['_GETSTATISTICSREQUEST']._serialized_end=4992
+  _globals['_GETSTATISTICSRESPONSE']._serialized_start=4994
+  _globals['_GETSTATISTICSRESPONSE']._serialized_end=5071
+  _globals['_ARGOSSERVICE']._serialized_start=5291
+  _globals['_ARGOSSERVICE']._serialized_end=6370
 # @@protoc_insertion_point(module_scope)
@@ -55,6 +55,11 @@ class ArgosServiceStub(object):
                 request_serializer=argos__pb2.GetEnrollmentsRequest.SerializeToString,
                 response_deserializer=argos__pb2.GetEnrollmentsResponse.FromString,
                 _registered_method=True)
+        self.StreamEnrollments = channel.unary_stream(
+                '/argos.ArgosService/StreamEnrollments',
+                request_serializer=argos__pb2.GetEnrollmentsRequest.SerializeToString,
+                response_deserializer=argos__pb2.EnrollmentBatch.FromString,
+                _registered_method=True)
         self.CreateCourse = channel.unary_unary(
                 '/argos.ArgosService/CreateCourse',
                 request_serializer=argos__pb2.CreateCourseRequest.SerializeToString,
@@ -65,6 +70,21 @@ class ArgosServiceStub(object):
                 request_serializer=argos__pb2.CreateSectionRequest.SerializeToString,
                 response_deserializer=argos__pb2.CreateSectionResponse.FromString,
                 _registered_method=True)
+        self.CreateStudents = channel.stream_unary(
+                '/argos.ArgosService/CreateStudents',
+                request_serializer=argos__pb2.CreateStudentRequest.SerializeToString,
+                response_deserializer=argos__pb2.CreateStudentsResponse.FromString,
+                _registered_method=True)
+        self.CreateCourses = channel.stream_unary(
+                '/argos.ArgosService/CreateCourses',
+                request_serializer=argos__pb2.CreateCourseRequest.SerializeToString,
+                response_deserializer=argos__pb2.CreateCoursesResponse.FromString,
+                _registered_method=True)
+        self.CreateSections = channel.stream_unary(
+                '/argos.ArgosService/CreateSections',
+                request_serializer=argos__pb2.CreateSectionRequest.SerializeToString,
+                response_deserializer=argos__pb2.CreateSectionsResponse.FromString,
+                _registered_method=True)
         self.ScheduleSection = channel.unary_unary(
                 '/argos.ArgosService/ScheduleSection',
                 request_serializer=argos__pb2.ScheduleSectionRequest.SerializeToString,
@@ -116,6 +136,12 @@ class ArgosServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamEnrollments(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateCourse(self, request, context):
         """Course operations
         """
@@ -129,6 +155,25 @@ class ArgosServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateStudents(self, request_iterator, context):
+        """Bulk loading; each call is saved in a single transaction
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateCourses(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateSections(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ScheduleSection(self, request, context):
         """Scheduling operations
         """
@@ -179,6 +224,11 @@ def add_ArgosServiceServicer_to_server(servicer, server):
                     request_deserializer=argos__pb2.GetEnrollmentsRequest.FromString,
                     response_serializer=argos__pb2.GetEnrollmentsResponse.SerializeToString,
             ),
+            'StreamEnrollments': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamEnrollments,
+                    request_deserializer=argos__pb2.GetEnrollmentsRequest.FromString,
+                    response_serializer=argos__pb2.EnrollmentBatch.SerializeToString,
+            ),
             'CreateCourse': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateCourse,
                     request_deserializer=argos__pb2.CreateCourseRequest.FromString,
@@ -189,6 +239,21 @@ def add_ArgosServiceServicer_to_server(servicer, server):
                     request_deserializer=argos__pb2.CreateSectionRequest.FromString,
                     response_serializer=argos__pb2.CreateSectionResponse.SerializeToString,
             ),
+            'CreateStudents': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateStudents,
+                    request_deserializer=argos__pb2.CreateStudentRequest.FromString,
+                    response_serializer=argos__pb2.CreateStudentsResponse.SerializeToString,
+            ),
+            'CreateCourses': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateCourses,
+                    request_deserializer=argos__pb2.CreateCourseRequest.FromString,
+                    response_serializer=argos__pb2.CreateCoursesResponse.SerializeToString,
+            ),
+            'CreateSections': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateSections,
+                    request_deserializer=argos__pb2.CreateSectionRequest.FromString,
+                    response_serializer=argos__pb2.CreateSectionsResponse.SerializeToString,
+            ),
             'ScheduleSection': grpc.unary_unary_rpc_method_handler(
                     servicer.ScheduleSection,
                     request_deserializer=argos__pb2.ScheduleSectionRequest.FromString,
@@ -329,6 +394,33 @@ class ArgosService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamEnrollments(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/argos.ArgosService/StreamEnrollments',
+            argos__pb2.GetEnrollmentsRequest.SerializeToString,
+            argos__pb2.EnrollmentBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateCourse(request,
             target,
@@ -383,6 +475,87 @@ class ArgosService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateStudents(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/argos.ArgosService/CreateStudents',
+            argos__pb2.CreateStudentRequest.SerializeToString,
+            argos__pb2.CreateStudentsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateCourses(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/argos.ArgosService/CreateCourses',
+            argos__pb2.CreateCourseRequest.SerializeToString,
+            argos__pb2.CreateCoursesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateSections(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/argos.ArgosService/CreateSections',
+            argos__pb2.CreateSectionRequest.SerializeToString,
+            argos__pb2.CreateSectionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ScheduleSection(request,
             target,
@@ -2,11 +2,24 @@
 gRPC API implementation for the Argos platform.
 """
 
+import asyncio
+import functools
 import json
+import os
 import threading
+import time
+import weakref
 import grpc
-from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from google.protobuf.internal import api_implementation
 
 from . import argos_pb2, argos_pb2_grpc
 from ..core.entities import Student, Lecturer, Course, Section, Grade, Facility, Room
@@ -16,11 +29,82 @@ from ..services import EnrollmentService, SchedulerService, EventService
 from ..persistence import DatabaseManager, StudentRepository, CourseRepository, SectionRepository
 
 
+# Active protobuf backend: "upb" (or "cpp" on older releases) is native; "python"
+# means every message build and serialize runs as interpreted descriptor code.
+PROTOBUF_BACKEND = api_implementation.Type()
+
+# RPCs a servicer handles at once before new calls are shed with UNAVAILABLE
+MAX_INFLIGHT = int(os.getenv("ARGOS_MAX_INFLIGHT", "200"))
+
+# Section ids per message on the StreamEnrollments stream
+ENROLLMENT_BATCH_SIZE = 100
+
+# How long an encoded GetStatistics payload is served before it is recomputed
+STATISTICS_TTL = 1.0
+
+# Most serialized students kept in the Student message cache (least recently used go first)
+STUDENT_PB_CACHE_SIZE = 4096
+
+# Enum-to-proto lookups resolved once instead of per conversion
+_PERSON_TYPE_PB = {pt: argos_pb2.PersonType.Value(pt.name) for pt in PersonType}
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a payload for the JSON string fields of a response."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+# Fixed-shape responses built once and returned as-is. Handlers share one event
+# loop thread, so a reused scratch message could be overwritten by another call
+# before gRPC serializes it; these are never mutated after construction.
+_SCHEDULE_RESPONSE = argos_pb2.GetScheduleResponse(
+    success=True,
+    message="Schedule retrieved successfully"
+)
+_PREDICTION_RESPONSE = argos_pb2.MLPredictionResponse(
+    success=True,
+    message="Prediction generated successfully",
+    prediction=_json_dumps({"prediction": "mock_prediction", "confidence": 0.85}),
+    explanation=_json_dumps({"explanation": "mock_explanation"})
+)
+
+
+def grpc_handler(response_cls):
+    """Map handler exceptions onto gRPC status codes and an unsuccessful response."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, request, context):
+            # Shed load instead of queueing behind the executor; clients retry on UNAVAILABLE
+            if self._inflight >= self._max_inflight:
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "Server overloaded, retry later")
+            
+            self._inflight += 1
+            try:
+                return await handler(self, request, context)
+            except ValidationError as e:
+                message = str(e)
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(message)
+                return response_cls(success=False, message=f"Validation error: {message}")
+            except Exception as e:
+                message = str(e)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(message)
+                return response_cls(success=False, message=f"Internal error: {message}")
+            finally:
+                self._inflight -= 1
+        return wrapper
+    return decorator
+
+
 class ArgosGrpcService(argos_pb2_grpc.ArgosServiceServicer):
     """gRPC service implementation for Argos platform."""
     
     def __init__(self, database: DatabaseManager, enrollment_service: EnrollmentService,
-                 scheduler_service: SchedulerService, event_service: EventService):
+                 scheduler_service: SchedulerService, event_service: EventService,
+                 max_inflight: int = MAX_INFLIGHT):
         self._database = database
         self._enrollment_service = enrollment_service
         self._scheduler_service = scheduler_service
@@ -31,416 +115,448 @@ class ArgosGrpcService(argos_pb2_grpc.ArgosServiceServicer):
         self._course_repo = CourseRepository(database)
         self._section_repo = SectionRepository(database)
         
-        self._lock = threading.RLock()
+        # One lock per repository so unrelated creates don't serialize each other
+        self._student_lock = threading.Lock()
+        self._course_lock = threading.Lock()
+        self._section_lock = threading.Lock()
+        
+        # Enrollment and scheduling only need ordering within a section, so each
+        # section gets its own lock; entries vanish once no call holds them.
+        self._section_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+        self._section_locks_guard = threading.Lock()
+        
+        # Serialized Student messages keyed by entity id, tagged with the entity
+        # version they were built from; any mutation bumps the version. Bounded LRU.
+        self._student_pb_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._student_pb_cache_lock = threading.Lock()
+        
+        # Encoded statistics as (monotonic timestamp, JSON), plus the in-flight
+        # collection that concurrent GetStatistics calls share
+        self._statistics_cache: Optional[Tuple[float, str]] = None
+        self._statistics_task: Optional[asyncio.Future] = None
+        
+        # Calls currently inside a handler; only touched from the event loop thread
+        self._max_inflight = max_inflight
+        self._inflight = 0
+    
+    @property
+    def max_inflight(self) -> int:
+        """Get the number of concurrent RPCs accepted before shedding."""
+        return self._max_inflight
+    
+    async def _run(self, func, *args, lock: Optional[threading.Lock] = None):
+        """Run a blocking repository/service call on the loop's executor, optionally under lock."""
+        def call():
+            if lock is None:
+                return func(*args)
+            with lock:
+                return func(*args)
+        
+        return await asyncio.get_running_loop().run_in_executor(None, call)
+    
+    def _lock_for_section(self, section_id: str) -> threading.Lock:
+        """Get the lock that orders enrollment and scheduling within one section."""
+        with self._section_locks_guard:
+            lock = self._section_locks.get(section_id)
+            if lock is None:
+                lock = self._section_locks[section_id] = threading.Lock()
+            return lock
     
-    def CreateStudent(self, request, context):
+    @grpc_handler(argos_pb2.CreateStudentResponse)
+    async def CreateStudent(self, request, context):
         """Create a new student."""
-        try:
-            with self._lock:
-                # Create student entity
-                student = Student(
-                    first_name=request.first_name,
-                    last_name=request.last_name,
-                    email=request.email,
-                    student_id=request.student_id,
-                    grade_level=GradeLevel(request.grade_level)
-                )
-                
-                # Save to database
-                saved_student = self._student_repo.save(student)
-                
-                # Convert to protobuf
-                student_pb = self._student_to_protobuf(saved_student)
-                
-                return argos_pb2.CreateStudentResponse(
-                    success=True,
-                    message="Student created successfully",
-                    student=student_pb
-                )
+        # Create student entity
+        student = self._student_from_request(request)
         
-        except ValidationError as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return argos_pb2.CreateStudentResponse(
-                success=False,
-                message=f"Validation error: {str(e)}"
-            )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.CreateStudentResponse(
-                success=False,
-                message=f"Internal error: {str(e)}"
-            )
+        # Save to database
+        saved_student = await self._run(self._student_repo.save, student, lock=self._student_lock)
+        
+        # Convert to protobuf
+        student_pb = self._student_to_protobuf(saved_student)
+        
+        return argos_pb2.CreateStudentResponse(
+            success=True,
+            message="Student created successfully",
+            student=student_pb
+        )
     
-    def GetStudent(self, request, context):
+    @grpc_handler(argos_pb2.GetStudentResponse)
+    async def GetStudent(self, request, context):
         """Get a student by ID."""
-        try:
-            with self._lock:
-                student = self._student_repo.find_by_student_id(request.student_id)
-                
-                if not student:
-                    context.set_code(grpc.StatusCode.NOT_FOUND)
-                    return argos_pb2.GetStudentResponse(
-                        success=False,
-                        message="Student not found"
-                    )
-                
-                student_pb = self._student_to_protobuf(student)
-                
-                return argos_pb2.GetStudentResponse(
-                    success=True,
-                    message="Student retrieved successfully",
-                    student=student_pb
-                )
+        # An index miss still has to ask the database, so always go through the executor
+        student = await self._run(self._student_repo.find_by_student_id, request.student_id)
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
+        if not student:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
             return argos_pb2.GetStudentResponse(
                 success=False,
-                message=f"Internal error: {str(e)}"
+                message="Student not found"
             )
+        
+        response = argos_pb2.GetStudentResponse(
+            success=True,
+            message="Student retrieved successfully"
+        )
+        response.student.MergeFromString(self._serialized_student(student))
+        return response
     
-    def EnrollStudent(self, request, context):
+    @grpc_handler(argos_pb2.EnrollStudentResponse)
+    async def EnrollStudent(self, request, context):
         """Enroll a student in a section."""
-        try:
-            with self._lock:
-                # Get student and section
-                student = self._student_repo.find_by_student_id(request.student_id)
-                section = self._section_repo.find_by_id(request.section_id)
-                
-                if not student:
-                    context.set_code(grpc.StatusCode.NOT_FOUND)
-                    return argos_pb2.EnrollStudentResponse(
-                        success=False,
-                        message="Student not found"
-                    )
-                
-                if not section:
-                    context.set_code(grpc.StatusCode.NOT_FOUND)
-                    return argos_pb2.EnrollStudentResponse(
-                        success=False,
-                        message="Section not found"
-                    )
-                
-                # Enroll student
-                result = self._enrollment_service.enroll_student(student, section)
-                
-                if result.success:
-                    return argos_pb2.EnrollStudentResponse(
-                        success=True,
-                        message=result.message,
-                        status=result.status.value,
-                        waitlist_position=result.waitlist_position
-                    )
-                else:
-                    context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
-                    return argos_pb2.EnrollStudentResponse(
-                        success=False,
-                        message=result.message
-                    )
+        # Get student and section; plain reads, the repositories guard their own queries
+        student, section = await asyncio.gather(
+            self._run(self._student_repo.find_by_student_id, request.student_id),
+            self._run(self._section_repo.find_by_id, request.section_id)
+        )
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
+        if not student:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
             return argos_pb2.EnrollStudentResponse(
                 success=False,
-                message=f"Internal error: {str(e)}"
+                message="Student not found"
             )
-    
-    def GetEnrollments(self, request, context):
-        """Get student enrollments."""
-        try:
-            with self._lock:
-                enrollments = self._enrollment_service.get_enrollments(request.student_id)
-                
-                return argos_pb2.GetEnrollmentsResponse(
-                    success=True,
-                    message="Enrollments retrieved successfully",
-                    section_ids=enrollments
-                )
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.GetEnrollmentsResponse(
+        if not section:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return argos_pb2.EnrollStudentResponse(
                 success=False,
-                message=f"Internal error: {str(e)}"
+                message="Section not found"
             )
-    
-    def CreateCourse(self, request, context):
-        """Create a new course."""
-        try:
-            with self._lock:
-                # Create course entity
-                course = Course(
-                    course_code=request.course_code,
-                    title=request.title,
-                    description=request.description,
-                    credits=request.credits,
-                    department=request.department
-                )
-                
-                # Add prerequisites
-                for prereq in request.prerequisites:
-                    course.add_prerequisite(prereq)
-                
-                # Save to database
-                saved_course = self._course_repo.save(course)
-                
-                # Convert to protobuf
-                course_pb = self._course_to_protobuf(saved_course)
-                
-                return argos_pb2.CreateCourseResponse(
-                    success=True,
-                    message="Course created successfully",
-                    course=course_pb
-                )
         
-        except ValidationError as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return argos_pb2.CreateCourseResponse(
-                success=False,
-                message=f"Validation error: {str(e)}"
+        # Enroll student
+        result = await self._run(self._enrollment_service.enroll_student, student, section,
+                                 lock=self._lock_for_section(request.section_id))
+        
+        if result.success:
+            return argos_pb2.EnrollStudentResponse(
+                success=True,
+                message=result.message,
+                status=result.status.value,
+                waitlist_position=result.waitlist_position
             )
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.CreateCourseResponse(
+        else:
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            return argos_pb2.EnrollStudentResponse(
                 success=False,
-                message=f"Internal error: {str(e)}"
+                message=result.message
             )
     
-    def CreateSection(self, request, context):
-        """Create a new section."""
-        try:
-            with self._lock:
-                # Create section entity
-                section = Section(
-                    course_id=request.course_id,
-                    section_number=request.section_number,
-                    semester=request.semester,
-                    year=request.year,
-                    instructor_id=request.instructor_id
-                )
-                
-                section.set_capacity(request.capacity)
-                
-                # Save to database
-                saved_section = self._section_repo.save(section)
-                
-                # Convert to protobuf
-                section_pb = self._section_to_protobuf(saved_section)
-                
-                return argos_pb2.CreateSectionResponse(
-                    success=True,
-                    message="Section created successfully",
-                    section=section_pb
-                )
+    @grpc_handler(argos_pb2.GetEnrollmentsResponse)
+    async def GetEnrollments(self, request, context):
+        """Get student enrollments."""
+        # EnrollmentService guards its own state
+        enrollments = await self._run(self._enrollment_service.get_enrollments, request.student_id)
         
-        except ValidationError as e:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(str(e))
-            return argos_pb2.CreateSectionResponse(
-                success=False,
-                message=f"Validation error: {str(e)}"
-            )
+        return argos_pb2.GetEnrollmentsResponse(
+            success=True,
+            message="Enrollments retrieved successfully",
+            section_ids=enrollments
+        )
+    
+    async def StreamEnrollments(self, request, context):
+        """Stream student enrollments in batches of ENROLLMENT_BATCH_SIZE."""
+        try:
+            enrollments = await self._run(self._enrollment_service.get_enrollments, request.student_id)
         except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.CreateSectionResponse(
-                success=False,
-                message=f"Internal error: {str(e)}"
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        
+        for start in range(0, len(enrollments), ENROLLMENT_BATCH_SIZE):
+            yield argos_pb2.EnrollmentBatch(
+                section_ids=enrollments[start:start + ENROLLMENT_BATCH_SIZE]
             )
     
-    def ScheduleSection(self, request, context):
+    @grpc_handler(argos_pb2.CreateCourseResponse)
+    async def CreateCourse(self, request, context):
+        """Create a new course."""
+        # Create course entity
+        course = self._course_from_request(request)
+        
+        # Save to database
+        saved_course = await self._run(self._course_repo.save, course, lock=self._course_lock)
+        
+        # Convert to protobuf
+        course_pb = self._course_to_protobuf(saved_course)
+        
+        return argos_pb2.CreateCourseResponse(
+            success=True,
+            message="Course created successfully",
+            course=course_pb
+        )
+    
+    @grpc_handler(argos_pb2.CreateSectionResponse)
+    async def CreateSection(self, request, context):
+        """Create a new section."""
+        # Create section entity
+        section = self._section_from_request(request)
+        
+        # Save to database
+        saved_section = await self._run(self._section_repo.save, section, lock=self._section_lock)
+        
+        # Convert to protobuf
+        section_pb = self._section_to_protobuf(saved_section)
+        
+        return argos_pb2.CreateSectionResponse(
+            success=True,
+            message="Section created successfully",
+            section=section_pb
+        )
+    
+    @grpc_handler(argos_pb2.CreateStudentsResponse)
+    async def CreateStudents(self, request_iterator, context):
+        """Create students streamed by the client in a single transaction."""
+        students = [self._student_from_request(request) async for request in request_iterator]
+        
+        # Save the whole batch at once
+        await self._run(self._student_repo.save_many, students, lock=self._student_lock)
+        
+        return argos_pb2.CreateStudentsResponse(
+            success=True,
+            message=f"{len(students)} students created successfully",
+            ids=[student.id for student in students]
+        )
+    
+    @grpc_handler(argos_pb2.CreateCoursesResponse)
+    async def CreateCourses(self, request_iterator, context):
+        """Create courses streamed by the client in a single transaction."""
+        courses = [self._course_from_request(request) async for request in request_iterator]
+        
+        # Save the whole batch at once
+        await self._run(self._course_repo.save_many, courses, lock=self._course_lock)
+        
+        return argos_pb2.CreateCoursesResponse(
+            success=True,
+            message=f"{len(courses)} courses created successfully",
+            ids=[course.id for course in courses]
+        )
+    
+    @grpc_handler(argos_pb2.CreateSectionsResponse)
+    async def CreateSections(self, request_iterator, context):
+        """Create sections streamed by the client in a single transaction."""
+        sections = [self._section_from_request(request) async for request in request_iterator]
+        
+        # Save the whole batch at once
+        await self._run(self._section_repo.save_many, sections, lock=self._section_lock)
+        
+        return argos_pb2.CreateSectionsResponse(
+            success=True,
+            message=f"{len(sections)} sections created successfully",
+            ids=[section.id for section in sections]
+        )
+    
+    @grpc_handler(argos_pb2.ScheduleSectionResponse)
+    async def ScheduleSection(self, request, context):
         """Schedule a section."""
-        try:
-            with self._lock:
-                # Convert time slots
-                time_slots = []
-                for slot_pb in request.time_slots:
-                    time_slot = {
-                        'start_time': datetime.fromtimestamp(slot_pb.start_time / 1000),
-                        'end_time': datetime.fromtimestamp(slot_pb.end_time / 1000),
-                        'day_of_week': slot_pb.day_of_week
-                    }
-                    time_slots.append(time_slot)
-                
-                # Convert room requirements
-                room_requirements = {
-                    'min_capacity': request.room_requirements.min_capacity,
-                    'room_type': request.room_requirements.room_type or None,
-                    'equipment': list(request.room_requirements.equipment),
-                    'access_control': request.room_requirements.access_control
-                }
-                
-                # Create schedule request
-                from ..services.scheduler_service import ScheduleRequest
-                schedule_request = ScheduleRequest(
-                    section_id=request.section_id,
-                    time_slots=time_slots,
-                    room_requirements=room_requirements,
-                    constraints=list(request.constraints)
-                )
-                
-                # Schedule section
-                result = self._scheduler_service.schedule_section(schedule_request)
-                
-                if result.success:
-                    # Convert assigned times back to protobuf
-                    assigned_times = []
-                    for slot in result.assigned_times:
-                        assigned_times.append(argos_pb2.TimeSlot(
-                            start_time=int(slot['start_time'].timestamp() * 1000),
-                            end_time=int(slot['end_time'].timestamp() * 1000),
-                            day_of_week=slot['day_of_week']
-                        ))
-                    
-                    return argos_pb2.ScheduleSectionResponse(
-                        success=True,
-                        message=result.message,
-                        schedule_id=result.schedule_id,
-                        assigned_room=result.assigned_room,
-                        assigned_times=assigned_times,
-                        conflicts=result.conflicts
-                    )
-                else:
-                    context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
-                    return argos_pb2.ScheduleSectionResponse(
-                        success=False,
-                        message=result.message,
-                        conflicts=result.conflicts
-                    )
+        from ..services.scheduler_service import ScheduleRequest, TimeSlot
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
+        # Convert time slots; the scheduler works in epoch milliseconds like the proto
+        time_slots = [
+            TimeSlot(slot_pb.start_time, slot_pb.end_time, slot_pb.day_of_week)
+            for slot_pb in request.time_slots
+        ]
+        
+        # Convert room requirements
+        room_requirements = {
+            'min_capacity': request.room_requirements.min_capacity,
+            'room_type': request.room_requirements.room_type or None,
+            'equipment': list(request.room_requirements.equipment),
+            'access_control': request.room_requirements.access_control
+        }
+        
+        # Create schedule request
+        schedule_request = ScheduleRequest(
+            section_id=request.section_id,
+            time_slots=time_slots,
+            room_requirements=room_requirements,
+            constraints=list(request.constraints)
+        )
+        
+        # Schedule section
+        result = await self._run(self._scheduler_service.schedule_section, schedule_request,
+                                 lock=self._lock_for_section(request.section_id))
+        
+        if result.success:
+            response = argos_pb2.ScheduleSectionResponse(
+                success=True,
+                message=result.message,
+                schedule_id=result.schedule_id,
+                assigned_room=result.assigned_room,
+                conflicts=result.conflicts
+            )
+            
+            # Write assigned times straight into the response
+            for slot in result.assigned_times:
+                response.assigned_times.add(
+                    start_time=slot.start_time,
+                    end_time=slot.end_time,
+                    day_of_week=slot.day_of_week
+                )
+            
+            return response
+        else:
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
             return argos_pb2.ScheduleSectionResponse(
                 success=False,
-                message=f"Internal error: {str(e)}"
+                message=result.message,
+                conflicts=result.conflicts
             )
     
-    def GetSchedule(self, request, context):
+    @grpc_handler(argos_pb2.GetScheduleResponse)
+    async def GetSchedule(self, request, context):
         """Get section schedule."""
-        try:
-            with self._lock:
-                # This would integrate with the scheduler service
-                # For now, return a simple response
-                return argos_pb2.GetScheduleResponse(
-                    success=True,
-                    message="Schedule retrieved successfully"
-                )
-        
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.GetScheduleResponse(
-                success=False,
-                message=f"Internal error: {str(e)}"
-            )
+        # This would integrate with the scheduler service
+        # For now, return a simple response
+        return _SCHEDULE_RESPONSE
     
-    def GetMLPrediction(self, request, context):
+    @grpc_handler(argos_pb2.MLPredictionResponse)
+    async def GetMLPrediction(self, request, context):
         """Get ML prediction."""
-        try:
-            with self._lock:
-                # This would integrate with ML services
-                # For now, return a mock response
-                prediction = {"prediction": "mock_prediction", "confidence": 0.85}
-                explanation = {"explanation": "mock_explanation"}
-                
-                return argos_pb2.MLPredictionResponse(
-                    success=True,
-                    message="Prediction generated successfully",
-                    prediction=json.dumps(prediction),
-                    explanation=json.dumps(explanation)
-                )
-        
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.MLPredictionResponse(
-                success=False,
-                message=f"Internal error: {str(e)}"
-            )
+        # This would integrate with ML services
+        # For now, return a mock response
+        return _PREDICTION_RESPONSE
     
-    def GetStatistics(self, request, context):
+    @grpc_handler(argos_pb2.GetStatisticsResponse)
+    async def GetStatistics(self, request, context):
         """Get system statistics."""
-        try:
-            with self._lock:
-                # Get statistics from services
-                enrollment_stats = self._enrollment_service.get_statistics()
-                scheduler_stats = self._scheduler_service.get_statistics()
-                event_stats = self._event_service.get_processing_statistics()
-                
-                statistics = {
-                    "enrollment": enrollment_stats,
-                    "scheduler": scheduler_stats,
-                    "events": event_stats
-                }
-                
-                return argos_pb2.GetStatisticsResponse(
-                    success=True,
-                    message="Statistics retrieved successfully",
-                    statistics=json.dumps(statistics)
-                )
+        return argos_pb2.GetStatisticsResponse(
+            success=True,
+            message="Statistics retrieved successfully",
+            statistics=await self._statistics_payload()
+        )
+    
+    async def _statistics_payload(self) -> str:
+        """Get encoded statistics, collected at most once per STATISTICS_TTL for all callers."""
+        cached = self._statistics_cache
+        if cached is not None and time.monotonic() - cached[0] < STATISTICS_TTL:
+            return cached[1]
         
-        except Exception as e:
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
-            return argos_pb2.GetStatisticsResponse(
-                success=False,
-                message=f"Internal error: {str(e)}"
-            )
+        if self._statistics_task is None:
+            self._statistics_task = asyncio.ensure_future(self._collect_statistics())
+            self._statistics_task.add_done_callback(self._clear_statistics_task)
+        
+        # Shielded so one cancelled caller doesn't cancel the shared collection
+        return await asyncio.shield(self._statistics_task)
     
-    def _student_to_protobuf(self, student: Student) -> argos_pb2.Student:
-        """Convert Student entity to protobuf."""
-        person = argos_pb2.Person(
-            id=student.id,
-            first_name=student.first_name,
-            last_name=student.last_name,
-            email=student.email,
-            person_type=argos_pb2.PersonType.Value(student.person_type.name),
-            roles=list(student.roles),
-            created_at=int(student.created_at.timestamp() * 1000),
-            updated_at=int(student.updated_at.timestamp() * 1000),
-            version=student.version,
-            status=student.status.value
+    def _clear_statistics_task(self, task: asyncio.Future) -> None:
+        self._statistics_task = None
+    
+    async def _collect_statistics(self) -> str:
+        """Gather statistics from the services and encode them once."""
+        enrollment_stats, scheduler_stats, event_stats = await asyncio.gather(
+            self._run(self._enrollment_service.get_statistics),
+            self._run(self._scheduler_service.get_statistics),
+            self._run(self._event_service.get_processing_statistics)
         )
         
-        return argos_pb2.Student(
-            person=person,
-            student_id=student.student_id,
-            grade_level=student.grade_level.value,
-            gpa=student.gpa,
-            academic_standing=student.academic_standing,
-            advisor=student.advisor or "",
-            enrollments=list(student.enrollments)
+        statistics = {
+            "enrollment": enrollment_stats,
+            "scheduler": scheduler_stats,
+            "events": event_stats
+        }
+        
+        payload = _json_dumps(statistics)
+        self._statistics_cache = (time.monotonic(), payload)
+        return payload
+    
+    def _student_from_request(self, request) -> Student:
+        """Build a Student entity from a CreateStudentRequest."""
+        grade_level = request.grade_level
+        if grade_level not in GradeLevel.VALUES:
+            raise ValidationError(f"Invalid grade level: {grade_level!r}")
+        return Student(
+            first_name=request.first_name,
+            last_name=request.last_name,
+            email=request.email,
+            student_id=request.student_id,
+            grade_level=GradeLevel.from_value(grade_level)
+        )
+    
+    def _course_from_request(self, request) -> Course:
+        """Build a Course entity from a CreateCourseRequest."""
+        return Course(
+            course_code=request.course_code,
+            title=request.title,
+            description=request.description,
+            credits=request.credits,
+            department=request.department,
+            prerequisites=request.prerequisites
         )
     
+    def _section_from_request(self, request) -> Section:
+        """Build a Section entity from a CreateSectionRequest."""
+        return Section(
+            course_id=request.course_id,
+            section_number=request.section_number,
+            semester=request.semester,
+            year=request.year,
+            instructor_id=request.instructor_id,
+            capacity=request.capacity
+        )
+    
+    def _serialized_student(self, student: Student) -> bytes:
+        """Get the serialized Student protobuf, reusing it while the version is unchanged."""
+        cache = self._student_pb_cache
+        with self._student_pb_cache_lock:
+            cached = cache.get(student.id)
+            if cached is not None and cached[0] == student.version:
+                cache.move_to_end(student.id)
+                return cached[1]
+        
+        data = self._student_to_protobuf(student).SerializeToString()
+        with self._student_pb_cache_lock:
+            cache[student.id] = (student.version, data)
+            cache.move_to_end(student.id)
+            if len(cache) > STUDENT_PB_CACHE_SIZE:
+                cache.popitem(last=False)
+        return data
+    
+    def _student_to_protobuf(self, student: Student) -> argos_pb2.Student:
+        """Convert Student entity to protobuf."""
+        student_pb = argos_pb2.Student()
+        
+        person = student_pb.person
+        person.id = student.id
+        person.first_name = student.first_name
+        person.last_name = student.last_name
+        person.email = student.email
+        person.person_type = _PERSON_TYPE_PB[student.person_type]
+        person.roles.extend(student.roles)
+        person.created_at = student.created_at_ms
+        person.updated_at = student.updated_at_ms
+        person.version = student.version
+        # _value_ is the member's plain attribute; .value goes through a descriptor
+        person.status = student.status._value_
+        
+        student_pb.student_id = student.student_id
+        student_pb.grade_level = student.grade_level._value_
+        if student.gpa is not None:
+            student_pb.gpa = student.gpa
+        student_pb.academic_standing = student.academic_standing
+        student_pb.advisor = student.advisor or ""
+        student_pb.enrollments.extend(student.enrollment_list)
+        return student_pb
+    
     def _course_to_protobuf(self, course: Course) -> argos_pb2.Course:
         """Convert Course entity to protobuf."""
-        return argos_pb2.Course(
+        course_pb = argos_pb2.Course(
             id=course.id,
             course_code=course.course_code,
             title=course.title,
             description=course.description,
             credits=course.credits,
             department=course.department,
-            prerequisites=list(course.prerequisites),
-            sections=list(course.sections),
             syllabus=course.syllabus or "",
-            created_at=int(course.created_at.timestamp() * 1000),
-            updated_at=int(course.updated_at.timestamp() * 1000),
+            created_at=course.created_at_ms,
+            updated_at=course.updated_at_ms,
             version=course.version,
-            status=course.status.value
+            status=course.status._value_
         )
+        course_pb.prerequisites.extend(course.prerequisite_list)
+        course_pb.sections.extend(course.section_list)
+        return course_pb
     
     def _section_to_protobuf(self, section: Section) -> argos_pb2.Section:
         """Convert Section entity to protobuf."""
-        return argos_pb2.Section(
+        section_pb = argos_pb2.Section(
             id=section.id,
             course_id=section.course_id,
             section_number=section.section_number,
@@ -450,11 +566,12 @@ class ArgosGrpcService(argos_pb2_grpc.ArgosServiceServicer):
             room_id=section.room_id or "",
             schedule=section.schedule,
             capacity=section.capacity,
-            enrolled=list(section.enrolled),
-            waitlist=list(section.waitlist),
             enrollment_policy=section.enrollment_policy or "",
-            created_at=int(section.created_at.timestamp() * 1000),
-            updated_at=int(section.updated_at.timestamp() * 1000),
+            created_at=section.created_at_ms,
+            updated_at=section.updated_at_ms,
             version=section.version,
-            status=section.status.value
+            status=section.status._value_
         )
+        section_pb.enrolled.extend(section.enrolled)
+        section_pb.waitlist.extend(section.waitlist)
+        return section_pb
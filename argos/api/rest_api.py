@@ -2,15 +2,40 @@
 REST API implementation for the Argos platform using FastAPI.
 """
 
+import importlib.util
 import json
 import threading
-from typing import Optional, Dict, Any, List
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# uvicorn imports its loop and HTTP implementations itself; only probe for them
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+HTTPTOOLS_AVAILABLE = importlib.util.find_spec("httptools") is not None
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+try:
+    from fastrlock.rlock import FastRLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    FASTRLOCK_AVAILABLE = False
 
 from ..core.entities import Student, Lecturer, Course, Section, Grade, Facility, Room
 from ..core.enums import PersonType, GradeLevel, EventType
@@ -19,13 +44,46 @@ from ..services import EnrollmentService, SchedulerService, EventService
 from ..persistence import DatabaseManager, StudentRepository, CourseRepository, SectionRepository
 
 
+# uvicorn runtime: the libuv event loop and C HTTP parser when installed,
+# otherwise the pure-Python asyncio loop and h11
+REST_LOOP = "uvloop" if UVLOOP_AVAILABLE else "asyncio"
+REST_HTTP = "httptools" if HTTPTOOLS_AVAILABLE else "h11"
+
+# How long aggregated statistics are served before the services are asked again
+STATISTICS_TTL = 1.0
+
+# Most encoded entities kept in the per-entity JSON cache (least recently used go first)
+JSON_CACHE_SIZE = 4096
+
+# Read endpoints return pre-built dicts through this class, skipping
+# jsonable_encoder and response-model validation
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+
+# ISO-8601 parser for schedule time slots; ciso8601 is a C parser, fromisoformat the fallback
+_parse_datetime = ciso8601.parse_datetime if CISO8601_AVAILABLE else datetime.fromisoformat
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode a payload exactly as FastJSONResponse would render it."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _isoformat(value: datetime) -> str:
+    """Format a timestamp as the response models would (UTC with a trailing Z)."""
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
 # Pydantic models for API
 class StudentCreate(BaseModel):
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
     student_id: str = Field(..., min_length=1, max_length=20)
-    grade_level: str = Field(..., pattern=r'^(freshman|sophomore|junior|senior|graduate|postgraduate)$')
+    grade_level: Literal['freshman', 'sophomore', 'junior', 'senior', 'graduate', 'postgraduate']
 
 
 class StudentResponse(BaseModel):
@@ -112,7 +170,7 @@ class EnrollmentResponse(BaseModel):
 
 class ScheduleRequest(BaseModel):
     section_id: str = Field(..., min_length=1)
-    time_slots: List[Dict[str, Any]] = Field(..., min_items=1)
+    time_slots: List[Dict[str, Any]] = Field(..., min_length=1)
     room_requirements: Dict[str, Any] = Field(default_factory=dict)
     constraints: List[str] = Field(default_factory=list)
 
@@ -128,7 +186,7 @@ class ScheduleResponse(BaseModel):
 
 class MLPredictionRequest(BaseModel):
     model_type: str = Field(..., min_length=1)
-    input_data: Dict[str, Any] = Field(..., min_items=1)
+    input_data: Dict[str, Any] = Field(..., min_length=1)
 
 
 class MLPredictionResponse(BaseModel):
@@ -159,7 +217,16 @@ class ArgosRestAPI:
         self._course_repo = CourseRepository(database)
         self._section_repo = SectionRepository(database)
         
-        self._lock = threading.RLock()
+        # FastRLock skips the OS mutex when uncontended, the usual case here
+        self._lock = FastRLock() if FASTRLOCK_AVAILABLE else threading.RLock()
+        
+        # Encoded entity JSON keyed by entity id, tagged with the version it was
+        # built from; any mutation bumps the version. Bounded LRU.
+        self._json_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._json_cache_lock = threading.Lock()
+        
+        # Aggregated statistics as (monotonic timestamp, dict); see _statistics()
+        self._statistics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         # Create FastAPI app
         self.app = FastAPI(
@@ -182,6 +249,19 @@ class ArgosRestAPI:
         # Setup routes
         self._setup_routes()
     
+    def run(self, host: str = "0.0.0.0", port: int = 8000, log_level: str = "info") -> None:
+        """Serve the app with uvicorn on the fastest available runtime (blocks)."""
+        import uvicorn
+        
+        uvicorn.run(
+            self.app,
+            host=host,
+            port=port,
+            loop=REST_LOOP,
+            http=REST_HTTP,
+            log_level=log_level
+        )
+    
     def _setup_routes(self):
         """Setup API routes."""
         
@@ -205,156 +285,178 @@ class ArgosRestAPI:
             """Create a new student."""
             try:
                 with self._lock:
-                    # Create student entity
-                    student = Student(
-                        first_name=student_data.first_name,
-                        last_name=student_data.last_name,
-                        email=student_data.email,
-                        student_id=student_data.student_id,
-                        grade_level=GradeLevel(student_data.grade_level)
-                    )
-                    
-                    # Save to database
-                    saved_student = self._student_repo.save(student)
-                    
+                    self._check_new_student_ids([student_data.student_id])
+                    saved_student = self._create_student(student_data)
                     return self._student_to_response(saved_student)
             
+            except HTTPException:
+                raise
             except ValidationError as e:
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.app.get("/students/{student_id}", response_model=StudentResponse)
+        @self.app.post("/students/bulk", response_model=List[StudentResponse], status_code=status.HTTP_201_CREATED)
+        async def create_students_bulk(students_data: List[StudentCreate]):
+            """Create several students in one request, returned in request order."""
+            try:
+                with self._lock:
+                    self._check_new_student_ids([data.student_id for data in students_data])
+                    saved_students = [self._create_student(data) for data in students_data]
+                    return [self._student_to_response(student) for student in saved_students]
+            
+            except HTTPException:
+                raise
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+        
+        @self.app.get("/students/{student_id}", response_model=StudentResponse, response_class=FastJSONResponse)
         async def get_student(student_id: str):
             """Get a student by student ID."""
             try:
-                with self._lock:
-                    student = self._student_repo.find_by_student_id(student_id)
-                    
-                    if not student:
-                        raise HTTPException(status_code=404, detail="Student not found")
-                    
-                    return self._student_to_response(student)
+                student = self._student_repo.find_by_student_id(student_id)
+                
+                if not student:
+                    raise HTTPException(status_code=404, detail="Student not found")
+                
+                return self._json_response(self._entity_json(student, self._student_to_dict))
             
             except HTTPException:
                 raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.app.get("/students", response_model=List[StudentResponse])
+        @self.app.get("/students", response_model=List[StudentResponse], response_class=FastJSONResponse)
         async def list_students(skip: int = 0, limit: int = 100):
             """List all students."""
             try:
-                with self._lock:
-                    students = self._student_repo.find_all()
-                    
-                    # Apply pagination
-                    students = students[skip:skip + limit]
-                    
-                    return [self._student_to_response(student) for student in students]
+                students = self._student_repo.find_all()
+                
+                # Apply pagination
+                students = students[skip:skip + limit]
+                
+                return self._json_response(self._entity_list_json(students, self._student_to_dict))
             
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
+        @self.app.get("/students.ndjson")
+        async def stream_students(skip: int = 0, limit: int = 100):
+            """List students as newline-delimited JSON, one student per line."""
+            return StreamingResponse(
+                self._iter_ndjson(self._student_repo, skip, limit, self._student_to_dict),
+                media_type="application/x-ndjson"
+            )
+        
         # Course endpoints
         @self.app.post("/courses", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
         async def create_course(course_data: CourseCreate):
             """Create a new course."""
             try:
                 with self._lock:
-                    # Create course entity
-                    course = Course(
-                        course_code=course_data.course_code,
-                        title=course_data.title,
-                        description=course_data.description,
-                        credits=course_data.credits,
-                        department=course_data.department
-                    )
-                    
-                    # Add prerequisites
-                    for prereq in course_data.prerequisites:
-                        course.add_prerequisite(prereq)
-                    
-                    # Save to database
-                    saved_course = self._course_repo.save(course)
-                    
+                    self._check_new_course_codes([course_data.course_code])
+                    saved_course = self._create_course(course_data)
                     return self._course_to_response(saved_course)
             
+            except HTTPException:
+                raise
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+        
+        @self.app.post("/courses/bulk", response_model=List[CourseResponse], status_code=status.HTTP_201_CREATED)
+        async def create_courses_bulk(courses_data: List[CourseCreate]):
+            """Create several courses in one request, returned in request order."""
+            try:
+                with self._lock:
+                    self._check_new_course_codes([data.course_code for data in courses_data])
+                    saved_courses = [self._create_course(data) for data in courses_data]
+                    return [self._course_to_response(course) for course in saved_courses]
+            
+            except HTTPException:
+                raise
             except ValidationError as e:
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.app.get("/courses/{course_id}", response_model=CourseResponse)
+        @self.app.get("/courses/{course_id}", response_model=CourseResponse, response_class=FastJSONResponse)
         async def get_course(course_id: str):
             """Get a course by ID."""
             try:
-                with self._lock:
-                    course = self._course_repo.find_by_id(course_id)
-                    
-                    if not course:
-                        raise HTTPException(status_code=404, detail="Course not found")
-                    
-                    return self._course_to_response(course)
+                course = self._course_repo.find_by_id(course_id)
+                
+                if not course:
+                    raise HTTPException(status_code=404, detail="Course not found")
+                
+                return self._json_response(self._entity_json(course, self._course_to_dict))
             
             except HTTPException:
                 raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.app.get("/courses", response_model=List[CourseResponse])
+        @self.app.get("/courses", response_model=List[CourseResponse], response_class=FastJSONResponse)
         async def list_courses(skip: int = 0, limit: int = 100):
             """List all courses."""
             try:
-                with self._lock:
-                    courses = self._course_repo.find_all()
-                    
-                    # Apply pagination
-                    courses = courses[skip:skip + limit]
-                    
-                    return [self._course_to_response(course) for course in courses]
+                courses = self._course_repo.find_all()
+                
+                # Apply pagination
+                courses = courses[skip:skip + limit]
+                
+                return self._json_response(self._entity_list_json(courses, self._course_to_dict))
             
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
+        @self.app.get("/courses.ndjson")
+        async def stream_courses(skip: int = 0, limit: int = 100):
+            """List courses as newline-delimited JSON, one course per line."""
+            return StreamingResponse(
+                self._iter_ndjson(self._course_repo, skip, limit, self._course_to_dict),
+                media_type="application/x-ndjson"
+            )
+        
         # Section endpoints
         @self.app.post("/sections", response_model=SectionResponse, status_code=status.HTTP_201_CREATED)
         async def create_section(section_data: SectionCreate):
             """Create a new section."""
             try:
+                # Create section entity
+                section = Section(
+                    course_id=section_data.course_id,
+                    section_number=section_data.section_number,
+                    semester=section_data.semester,
+                    year=section_data.year,
+                    instructor_id=section_data.instructor_id,
+                    capacity=section_data.capacity
+                )
+                
+                # Save to database
                 with self._lock:
-                    # Create section entity
-                    section = Section(
-                        course_id=section_data.course_id,
-                        section_number=section_data.section_number,
-                        semester=section_data.semester,
-                        year=section_data.year,
-                        instructor_id=section_data.instructor_id
-                    )
-                    
-                    section.set_capacity(section_data.capacity)
-                    
-                    # Save to database
                     saved_section = self._section_repo.save(section)
-                    
-                    return self._section_to_response(saved_section)
+                
+                return self._section_to_response(saved_section)
             
             except ValidationError as e:
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.app.get("/sections/{section_id}", response_model=SectionResponse)
+        @self.app.get("/sections/{section_id}", response_model=SectionResponse, response_class=FastJSONResponse)
         async def get_section(section_id: str):
             """Get a section by ID."""
             try:
-                with self._lock:
-                    section = self._section_repo.find_by_id(section_id)
-                    
-                    if not section:
-                        raise HTTPException(status_code=404, detail="Section not found")
-                    
-                    return self._section_to_response(section)
+                section = self._section_repo.find_by_id(section_id)
+                
+                if not section:
+                    raise HTTPException(status_code=404, detail="Section not found")
+                
+                return self._json_response(self._entity_json(section, self._section_to_dict))
             
             except HTTPException:
                 raise
@@ -367,38 +469,39 @@ class ArgosRestAPI:
             """Enroll a student in a section."""
             try:
                 with self._lock:
-                    # Get student and section
-                    student = self._student_repo.find_by_student_id(enrollment_data.student_id)
-                    section = self._section_repo.find_by_id(enrollment_data.section_id)
-                    
-                    if not student:
-                        raise HTTPException(status_code=404, detail="Student not found")
-                    
-                    if not section:
-                        raise HTTPException(status_code=404, detail="Section not found")
-                    
-                    # Enroll student
-                    result = self._enrollment_service.enroll_student(student, section)
-                    
-                    return EnrollmentResponse(
-                        success=result.success,
-                        message=result.message,
-                        status=result.status.value,
-                        waitlist_position=result.waitlist_position
-                    )
+                    return self._enroll(enrollment_data)
             
             except HTTPException:
                 raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
+        @self.app.post("/enrollments/bulk", response_model=List[EnrollmentResponse])
+        async def enroll_students_bulk(enrollments_data: List[EnrollmentRequest]):
+            """Process several enrollments in one request, one result per item."""
+            try:
+                with self._lock:
+                    results = []
+                    for enrollment_data in enrollments_data:
+                        try:
+                            results.append(self._enroll(enrollment_data))
+                        except HTTPException as e:
+                            results.append(EnrollmentResponse(
+                                success=False,
+                                message=e.detail,
+                                status="rejected"
+                            ))
+                    return results
+            
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+        
         @self.app.get("/students/{student_id}/enrollments", response_model=List[str])
         async def get_student_enrollments(student_id: str):
             """Get student enrollments."""
             try:
-                with self._lock:
-                    enrollments = self._enrollment_service.get_enrollments(student_id)
-                    return enrollments
+                enrollments = self._enrollment_service.get_enrollments(student_id)
+                return enrollments
             
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
@@ -409,18 +512,19 @@ class ArgosRestAPI:
             """Schedule a section."""
             try:
                 with self._lock:
+                    from ..services.scheduler_service import ScheduleRequest as SchedulerRequest, TimeSlot
+                    
                     # Convert time slots
-                    time_slots = []
-                    for slot_data in schedule_data.time_slots:
-                        time_slot = {
-                            'start_time': datetime.fromisoformat(slot_data['start_time']),
-                            'end_time': datetime.fromisoformat(slot_data['end_time']),
-                            'day_of_week': slot_data['day_of_week']
-                        }
-                        time_slots.append(time_slot)
+                    time_slots = [
+                        TimeSlot(
+                            start_time=_parse_datetime(slot_data['start_time']),
+                            end_time=_parse_datetime(slot_data['end_time']),
+                            day_of_week=slot_data['day_of_week']
+                        )
+                        for slot_data in schedule_data.time_slots
+                    ]
                     
                     # Create schedule request
-                    from ..services.scheduler_service import ScheduleRequest as SchedulerRequest
                     schedule_request = SchedulerRequest(
                         section_id=schedule_data.section_id,
                         time_slots=time_slots,
@@ -436,7 +540,14 @@ class ArgosRestAPI:
                         message=result.message,
                         schedule_id=result.schedule_id,
                         assigned_room=result.assigned_room,
-                        assigned_times=result.assigned_times,
+                        assigned_times=[
+                            {
+                                'start_time': _isoformat(datetime.fromtimestamp(slot.start_time / 1000, timezone.utc)),
+                                'end_time': _isoformat(datetime.fromtimestamp(slot.end_time / 1000, timezone.utc)),
+                                'day_of_week': slot.day_of_week
+                            }
+                            for slot in result.assigned_times
+                        ],
                         conflicts=result.conflicts
                     )
             
@@ -469,30 +580,94 @@ class ArgosRestAPI:
         async def get_statistics():
             """Get system statistics."""
             try:
-                with self._lock:
-                    # Get statistics from services
-                    enrollment_stats = self._enrollment_service.get_statistics()
-                    scheduler_stats = self._scheduler_service.get_statistics()
-                    event_stats = self._event_service.get_processing_statistics()
-                    
-                    statistics = {
-                        "enrollment": enrollment_stats,
-                        "scheduler": scheduler_stats,
-                        "events": event_stats
-                    }
-                    
-                    return StatisticsResponse(
-                        success=True,
-                        message="Statistics retrieved successfully",
-                        statistics=statistics
-                    )
+                return StatisticsResponse(
+                    success=True,
+                    message="Statistics retrieved successfully",
+                    statistics=self._statistics()
+                )
             
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
     
+    def _statistics(self) -> Dict[str, Any]:
+        """Get aggregated service statistics, collected at most once per STATISTICS_TTL."""
+        cached = self._statistics_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < STATISTICS_TTL:
+            return cached[1]
+        
+        # Get statistics from services
+        statistics = {
+            "enrollment": self._enrollment_service.get_statistics(),
+            "scheduler": self._scheduler_service.get_statistics(),
+            "events": self._event_service.get_processing_statistics()
+        }
+        self._statistics_cache = (now, statistics)
+        return statistics
+    
+    def _check_new_student_ids(self, student_ids: List[str]) -> None:
+        """Reject the request with 409 before anything is built if a student ID is taken."""
+        seen = set()
+        for student_id in student_ids:
+            if student_id in seen or self._student_repo.has_student_id(student_id):
+                raise HTTPException(status_code=409, detail=f"Student ID already exists: {student_id}")
+            seen.add(student_id)
+    
+    def _check_new_course_codes(self, course_codes: List[str]) -> None:
+        """Reject the request with 409 before anything is built if a course code is taken."""
+        seen = set()
+        for course_code in course_codes:
+            if course_code in seen or self._course_repo.has_course_code(course_code):
+                raise HTTPException(status_code=409, detail=f"Course code already exists: {course_code}")
+            seen.add(course_code)
+    
+    def _create_student(self, student_data: StudentCreate) -> Student:
+        """Build and persist a Student from a request model."""
+        student = Student(
+            first_name=student_data.first_name,
+            last_name=student_data.last_name,
+            email=student_data.email,
+            student_id=student_data.student_id,
+            grade_level=GradeLevel.from_value(student_data.grade_level)
+        )
+        return self._student_repo.save(student)
+    
+    def _create_course(self, course_data: CourseCreate) -> Course:
+        """Build and persist a Course from a request model."""
+        course = Course(
+            course_code=course_data.course_code,
+            title=course_data.title,
+            description=course_data.description,
+            credits=course_data.credits,
+            department=course_data.department,
+            prerequisites=course_data.prerequisites
+        )
+        return self._course_repo.save(course)
+    
+    def _enroll(self, enrollment_data: EnrollmentRequest) -> EnrollmentResponse:
+        """Enroll a student in a section, raising 404 if either is unknown."""
+        student = self._student_repo.find_by_student_id(enrollment_data.student_id)
+        section = self._section_repo.find_by_id(enrollment_data.section_id)
+        
+        if not student:
+            raise HTTPException(status_code=404, detail="Student not found")
+        
+        if not section:
+            raise HTTPException(status_code=404, detail="Section not found")
+        
+        result = self._enrollment_service.enroll_student(student, section)
+        
+        return EnrollmentResponse(
+            success=result.success,
+            message=result.message,
+            status=result.status.value,
+            waitlist_position=result.waitlist_position
+        )
+    
     def _student_to_response(self, student: Student) -> StudentResponse:
         """Convert Student entity to response model."""
-        return StudentResponse(
+        # Entity fields were validated on the way in; model_construct skips re-validation
+        return StudentResponse.model_construct(
             id=student.id,
             first_name=student.first_name,
             last_name=student.last_name,
@@ -502,7 +677,7 @@ class ArgosRestAPI:
             gpa=student.gpa,
             academic_standing=student.academic_standing,
             advisor=student.advisor,
-            enrollments=list(student.enrollments),
+            enrollments=student.enrollment_list,
             created_at=student.created_at,
             updated_at=student.updated_at,
             version=student.version,
@@ -511,15 +686,15 @@ class ArgosRestAPI:
     
     def _course_to_response(self, course: Course) -> CourseResponse:
         """Convert Course entity to response model."""
-        return CourseResponse(
+        return CourseResponse.model_construct(
             id=course.id,
             course_code=course.course_code,
             title=course.title,
             description=course.description,
             credits=course.credits,
             department=course.department,
-            prerequisites=list(course.prerequisites),
-            sections=list(course.sections),
+            prerequisites=course.prerequisite_list,
+            sections=course.section_list,
             syllabus=course.syllabus,
             created_at=course.created_at,
             updated_at=course.updated_at,
@@ -529,7 +704,7 @@ class ArgosRestAPI:
     
     def _section_to_response(self, section: Section) -> SectionResponse:
         """Convert Section entity to response model."""
-        return SectionResponse(
+        return SectionResponse.model_construct(
             id=section.id,
             course_id=section.course_id,
             section_number=section.section_number,
@@ -537,7 +712,7 @@ class ArgosRestAPI:
             year=section.year,
             instructor_id=section.instructor_id,
             room_id=section.room_id,
-            schedule=section.schedule,
+            schedule=dict(section.schedule),
             capacity=section.capacity,
             enrolled_count=section.enrolled_count,
             waitlist_count=section.waitlist_count,
@@ -547,3 +722,91 @@ class ArgosRestAPI:
             version=section.version,
             status=section.status.value
         )
+    
+    def _json_response(self, body: bytes) -> Response:
+        """Wrap already-encoded JSON without another encoding pass."""
+        return Response(content=body, media_type="application/json")
+    
+    def _entity_json(self, entity, to_dict) -> bytes:
+        """Get an entity's encoded JSON, reusing it while the version is unchanged."""
+        cache = self._json_cache
+        with self._json_cache_lock:
+            cached = cache.get(entity.id)
+            if cached is not None and cached[0] == entity.version:
+                cache.move_to_end(entity.id)
+                return cached[1]
+        
+        body = _json_bytes(to_dict(entity))
+        with self._json_cache_lock:
+            cache[entity.id] = (entity.version, body)
+            cache.move_to_end(entity.id)
+            if len(cache) > JSON_CACHE_SIZE:
+                cache.popitem(last=False)
+        return body
+    
+    def _entity_list_json(self, entities: List[Any], to_dict) -> bytes:
+        """Encode a JSON array by joining the cached per-entity encodings."""
+        return b"[" + b",".join([self._entity_json(entity, to_dict) for entity in entities]) + b"]"
+    
+    def _iter_ndjson(self, repository, skip: int, limit: int, to_dict):
+        """Yield one encoded entity per line, reading the repository in batches."""
+        for entity in repository.iter_all(skip, limit):
+            yield self._entity_json(entity, to_dict) + b"\n"
+    
+    def _student_to_dict(self, student: Student) -> Dict[str, Any]:
+        """Convert Student entity to a JSON-ready dict shaped like StudentResponse."""
+        return {
+            "id": student.id,
+            "first_name": student.first_name,
+            "last_name": student.last_name,
+            "email": student.email,
+            "student_id": student.student_id,
+            "grade_level": student.grade_level.value,
+            "gpa": student.gpa,
+            "academic_standing": student.academic_standing,
+            "advisor": student.advisor,
+            "enrollments": student.enrollment_list,
+            "created_at": _isoformat(student.created_at),
+            "updated_at": _isoformat(student.updated_at),
+            "version": student.version,
+            "status": student.status.value
+        }
+    
+    def _course_to_dict(self, course: Course) -> Dict[str, Any]:
+        """Convert Course entity to a JSON-ready dict shaped like CourseResponse."""
+        return {
+            "id": course.id,
+            "course_code": course.course_code,
+            "title": course.title,
+            "description": course.description,
+            "credits": course.credits,
+            "department": course.department,
+            "prerequisites": course.prerequisite_list,
+            "sections": course.section_list,
+            "syllabus": course.syllabus,
+            "created_at": _isoformat(course.created_at),
+            "updated_at": _isoformat(course.updated_at),
+            "version": course.version,
+            "status": course.status.value
+        }
+    
+    def _section_to_dict(self, section: Section) -> Dict[str, Any]:
+        """Convert Section entity to a JSON-ready dict shaped like SectionResponse."""
+        return {
+            "id": section.id,
+            "course_id": section.course_id,
+            "section_number": section.section_number,
+            "semester": section.semester,
+            "year": section.year,
+            "instructor_id": section.instructor_id,
+            "room_id": section.room_id,
+            "schedule": dict(section.schedule),
+            "capacity": section.capacity,
+            "enrolled_count": section.enrolled_count,
+            "waitlist_count": section.waitlist_count,
+            "is_full": section.is_full,
+            "created_at": _isoformat(section.created_at),
+            "updated_at": _isoformat(section.updated_at),
+            "version": section.version,
+            "status": section.status.value
+        }
@@ -3,6 +3,7 @@ Core module containing the fundamental object model and base classes.
 """
 
 from .entities import *
+from .entity_pool import EntityPool
 from .interfaces import *
 from .exceptions import *
 from .enums import *
@@ -28,6 +29,7 @@ __all__ = [
     "AuditLogEntry",
     "Policy",
     "MLModel",
+    "EntityPool",
     
     # Interfaces
     "Reportable",
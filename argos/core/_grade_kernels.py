@@ -0,0 +1,79 @@
+"""
+Numeric kernels for bulk GPA processing.
+
+Uses numba when it is installed, then numpy, and falls back to plain Python.
+"""
+
+from typing import List, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Standing codes returned by classify_gpas
+STANDING_GOOD = 0
+STANDING_WARNING = 1
+STANDING_PROBATION = 2
+STANDING_INVALID = -1
+
+STANDING_NAMES = ("good", "warning", "probation")
+
+# Lower GPA bounds for good standing and for academic warning
+GOOD_STANDING_MIN_GPA = 2.0
+WARNING_MIN_GPA = 1.5
+
+
+def _classify_gpas_py(gpas: Sequence[float]) -> List[int]:
+    codes = []
+    append = codes.append
+    for gpa in gpas:
+        if not 0.0 <= gpa <= 4.0:
+            append(STANDING_INVALID)
+        elif gpa >= GOOD_STANDING_MIN_GPA:
+            append(STANDING_GOOD)
+        elif gpa >= WARNING_MIN_GPA:
+            append(STANDING_WARNING)
+        else:
+            append(STANDING_PROBATION)
+    return codes
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _classify_gpas_jit(gpas, good_min, warning_min):
+        codes = np.empty(gpas.shape[0], dtype=np.int8)
+        for i in range(gpas.shape[0]):
+            gpa = gpas[i]
+            # Written so that NaN also lands in the invalid branch
+            if not (gpa >= 0.0 and gpa <= 4.0):
+                codes[i] = -1
+            elif gpa >= good_min:
+                codes[i] = 0
+            elif gpa >= warning_min:
+                codes[i] = 1
+            else:
+                codes[i] = 2
+        return codes
+
+
+def classify_gpas(gpas: Sequence[float]):
+    """Map GPAs to standing codes (0=good, 1=warning, 2=probation, -1=out of range)."""
+    if NUMBA_AVAILABLE:
+        return _classify_gpas_jit(np.asarray(gpas, dtype=np.float64),
+                                  GOOD_STANDING_MIN_GPA, WARNING_MIN_GPA)
+    if NUMPY_AVAILABLE:
+        arr = np.asarray(gpas, dtype=np.float64)
+        codes = np.full(arr.shape[0], STANDING_PROBATION, dtype=np.int8)
+        codes[arr >= WARNING_MIN_GPA] = STANDING_WARNING
+        codes[arr >= GOOD_STANDING_MIN_GPA] = STANDING_GOOD
+        codes[~((arr >= 0.0) & (arr <= 4.0))] = STANDING_INVALID
+        return codes
+    return _classify_gpas_py(gpas)
@@ -0,0 +1,63 @@
+"""
+Numeric kernels for schedule constraint checks.
+
+Uses numba when it is installed, then numpy, and falls back to plain Python.
+"""
+
+from typing import Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Once bookings are sorted by (room, start), any clash in a room shows up
+# between two neighbours: if i overlaps some later j, it also overlaps i + 1,
+# whose start lies between start[i] and start[j].
+
+def _has_overlap_py(starts: Sequence[int], ends: Sequence[int], rooms: Sequence[int]) -> bool:
+    order = sorted(range(len(starts)), key=lambda i: (rooms[i], starts[i]))
+    for prev, cur in zip(order, order[1:]):
+        if rooms[prev] == rooms[cur] and starts[cur] < ends[prev]:
+            return True
+    return False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _has_overlap_jit(starts, ends, rooms):
+        # Two stable argsorts give the (room, start) order; numba has no lexsort
+        order = np.argsort(starts, kind='mergesort')
+        order = order[np.argsort(rooms[order], kind='mergesort')]
+        for k in range(1, order.shape[0]):
+            prev = order[k - 1]
+            cur = order[k]
+            if rooms[prev] == rooms[cur] and starts[cur] < ends[prev]:
+                return True
+        return False
+
+
+def has_overlap(starts: Sequence[int], ends: Sequence[int], rooms: Sequence[int]) -> bool:
+    """True if two bookings in the same room overlap; rooms are integer codes."""
+    if len(starts) < 2:
+        return False
+    if NUMBA_AVAILABLE:
+        return bool(_has_overlap_jit(np.asarray(starts, dtype=np.int64),
+                                     np.asarray(ends, dtype=np.int64),
+                                     np.asarray(rooms, dtype=np.int64)))
+    if NUMPY_AVAILABLE:
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        rooms = np.asarray(rooms, dtype=np.int64)
+        order = np.lexsort((starts, rooms))
+        starts, ends, rooms = starts[order], ends[order], rooms[order]
+        return bool(np.any((rooms[1:] == rooms[:-1]) & (starts[1:] < ends[:-1])))
+    return _has_overlap_py(starts, ends, rooms)
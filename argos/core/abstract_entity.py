@@ -8,10 +8,13 @@ class AbstractEntity:
     - created/updated timestamps
     - versioning
     """
+    __slots__ = ('id', 'created_at', 'updated_at', 'version')
+
     def __init__(self):
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.created_at = now
+        self.updated_at = now
         self.version = 1
 
     def touch(self):
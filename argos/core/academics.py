@@ -1,6 +1,9 @@
+from typing import NamedTuple
 from .abstract_entity import AbstractEntity
 
 class Course(AbstractEntity):
+    __slots__ = ('code', 'name', 'sections')
+
     def __init__(self, code, name):
         super().__init__()
         self.code = code
@@ -8,6 +11,8 @@ class Course(AbstractEntity):
         self.sections = []
 
 class Section(AbstractEntity):
+    __slots__ = ('course_id', 'capacity', 'students')
+
     def __init__(self, course_id, capacity):
         super().__init__()
         self.course_id = course_id
@@ -15,21 +20,24 @@ class Section(AbstractEntity):
         self.students = []
 
 class Syllabus(AbstractEntity):
+    __slots__ = ('course_id', 'topics')
+
     def __init__(self, course_id, topics):
         super().__init__()
         self.course_id = course_id
         self.topics = topics
 
 class Assessment(AbstractEntity):
+    __slots__ = ('section_id', 'title', 'max_points')
+
     def __init__(self, section_id, title, max_points):
         super().__init__()
         self.section_id = section_id
         self.title = title
         self.max_points = max_points
 
-class Grade:
+class Grade(NamedTuple):
     """Immutable value object."""
-    def __init__(self, assessment_id, student_id, value):
-        self.assessment_id = assessment_id
-        self.student_id = student_id
-        self.value = value
+    assessment_id: str
+    student_id: str
+    value: float
@@ -1,20 +1,39 @@
 import hashlib
 import json
+import sys
 from .abstract_entity import AbstractEntity
 
+
+def _canonical_json(payload):
+    # Compact, key-sorted JSON from the stdlib encoder only, so the chain hashes the
+    # same bytes on every install whether or not optional encoders are present
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
 class AuditLogEntry(AbstractEntity):
+    __slots__ = ('action', 'data', 'prev_hash', 'hash')
+
     def __init__(self, action, data, prev_hash):
         super().__init__()
-        self.action = action
+        self.action = sys.intern(action) if action.__class__ is str else action
         self.data = data
         self.prev_hash = prev_hash
         self.hash = self._compute_hash()
 
+    @classmethod
+    def compute_chain(cls, records, prev_hash):
+        """Build entries for (action, data) pairs, each linked to the previous hash."""
+        entries = []
+        append = entries.append
+        for action, data in records:
+            entry = cls(action, data, prev_hash)
+            append(entry)
+            prev_hash = entry.hash
+        return entries
+
     def _compute_hash(self):
-        h = hashlib.sha256()
-        h.update(json.dumps({
+        return hashlib.sha256(_canonical_json({
             "action": self.action,
             "data": self.data,
             "prev_hash": self.prev_hash
-        }).encode())
-        return h.hexdigest()
+        })).hexdigest()
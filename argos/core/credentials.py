@@ -1,29 +1,59 @@
 from abc import ABC, abstractmethod
 from .abstract_entity import AbstractEntity
 
+def _authenticate_password(credential):
+    return True  # mock
+
+def _authenticate_oauth(credential):
+    return True
+
+def _authenticate_certificate(credential):
+    return True
+
+# Flat dispatch for hot authentication paths; the classes below route through
+# the same functions so both entry points agree.
+_AUTH_TABLE = {
+    'password': _authenticate_password,
+    'oauth': _authenticate_oauth,
+    'certificate': _authenticate_certificate,
+}
+
+def authenticate(cred_type, credential):
+    return _AUTH_TABLE[cred_type](credential)
+
 class Credential(ABC):
     """Strategy interface."""
+    __slots__ = ()
+
     @abstractmethod
     def authenticate(self):
         pass
 
 class PasswordCredential(Credential):
+    __slots__ = ('username', 'password')
+
     def __init__(self, username, password):
         self.username = username
         self.password = password
 
     def authenticate(self):
-        return True  # mock
+        return _authenticate_password(self)
 
 class OAuthCredential(Credential):
+    __slots__ = ()
+
     def authenticate(self):
-        return True
+        return _authenticate_oauth(self)
 
 class CertificateCredential(Credential):
+    __slots__ = ()
+
     def authenticate(self):
-        return True
+        return _authenticate_certificate(self)
 
 class AuthToken(AbstractEntity):
+    __slots__ = ('person_id',)
+
     def __init__(self, person_id):
         super().__init__()
         self.person_id = person_id
@@ -5,14 +5,30 @@ class EnrollmentPolicy(ABC):
     def can_enroll(self, student, section):
         pass
 
+    def can_enroll_batch(self, students, section):
+        """One flag per candidate, as if each admitted candidate were enrolled in turn."""
+        return [self.can_enroll(student, section) for student in students]
+
 class PrereqPolicy(EnrollmentPolicy):
     def can_enroll(self, student, section):
         return True  # mock
 
+    def can_enroll_batch(self, students, section):
+        return [True] * len(students)
+
 class QuotaPolicy(EnrollmentPolicy):
     def can_enroll(self, student, section):
         return len(section.students) < section.capacity
 
+    def can_enroll_batch(self, students, section):
+        # The first (capacity - enrolled) candidates fit; everyone after them doesn't
+        count = len(students)
+        free = min(max(section.capacity - len(section.students), 0), count)
+        return [True] * free + [False] * (count - free)
+
 class PriorityPolicy(EnrollmentPolicy):
     def can_enroll(self, student, section):
         return True
+
+    def can_enroll_batch(self, students, section):
+        return [True] * len(students)
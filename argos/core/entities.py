@@ -2,10 +2,26 @@
 Core entities for the Argos platform with rich inheritance hierarchy.
 """
 
-import uuid
+import copy
+import array
+import bisect
+import heapq
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from contextlib import contextmanager
+from operator import attrgetter
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence,
+    Set, Tuple, Union
+)
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -15,18 +31,185 @@ from .enums import (
 )
 from .interfaces import Reportable, Credential, AuthToken, MLModel, Constraint
 from .exceptions import ValidationError, AuthorizationError
+from ._grade_kernels import STANDING_NAMES, classify_gpas
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """Convert epoch nanoseconds to an aware UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+
+
+_UUID_CHUNK = 16 * 4096
+_uuid_lock = threading.Lock()
+_uuid_pool = b''
+_uuid_pos = 0
+
+
+def _fast_uuid() -> str:
+    """Random (version 4) UUID string, sliced from a pooled os.urandom() buffer."""
+    global _uuid_pool, _uuid_pos
+    with _uuid_lock:
+        if _uuid_pos >= len(_uuid_pool):
+            _uuid_pool = os.urandom(_UUID_CHUNK)
+            _uuid_pos = 0
+        raw = _uuid_pool[_uuid_pos:_uuid_pos + 16]
+        _uuid_pos += 16
+    h = raw.hex()
+    # Same layout as str(uuid.uuid4()): version nibble 4, RFC 4122 variant bits
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{(int(h[16], 16) & 0x3) | 0x8:x}{h[17:20]}-{h[20:]}"
+
+
+def _reset_uuid_pool() -> None:
+    # A forked child must not hand out the same IDs as its parent
+    global _uuid_pool, _uuid_pos
+    _uuid_pool = b''
+    _uuid_pos = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+_NO_EXPIRY = float('inf')
+_token_seq = itertools.count()
+
+
+class IDRegistry:
+    """Process-wide mapping between entity ID strings and compact integer codes.
+    
+    Lets per-entity ID collections be stored as array('I') instead of sets of
+    UUID strings. Codes are never reused or released.
+    """
+    
+    _codes: Dict[str, int] = {}
+    _ids: List[str] = []
+    _lock = threading.Lock()
+    
+    @classmethod
+    def intern(cls, entity_id: str) -> int:
+        """Get the code for an ID, assigning a new one if needed."""
+        code = cls._codes.get(entity_id)
+        if code is None:
+            with cls._lock:
+                code = cls._codes.get(entity_id)
+                if code is None:
+                    code = len(cls._ids)
+                    cls._ids.append(entity_id)
+                    cls._codes[entity_id] = code
+        return code
+    
+    @classmethod
+    def code_of(cls, entity_id: str) -> Optional[int]:
+        """Get the code for an ID, or None if it was never interned."""
+        return cls._codes.get(entity_id)
+    
+    @classmethod
+    def lookup(cls, code: int) -> str:
+        return cls._ids[code]
+    
+    @classmethod
+    def encode(cls, entity_ids: Iterable[str]) -> 'array.array':
+        """Pack IDs into an array('I') of codes, dropping duplicates."""
+        codes = array.array('I')
+        for code in dict.fromkeys(map(cls.intern, entity_ids)):
+            codes.append(code)
+        return codes
+
+
+def _decode_id_list(codes: 'array.array') -> List[str]:
+    ids = IDRegistry._ids
+    return [ids[code] for code in codes]
+
+
+def _decode_id_set(codes: 'array.array') -> FrozenSet[str]:
+    ids = IDRegistry._ids
+    return frozenset([ids[code] for code in codes])
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings (departments, semesters, ...) shared across entities."""
+    return sys.intern(value) if value.__class__ is str else value
+
+
+# How _build_dict() renders each kind of field listed in a _FIELD_SPEC
+_FIELD_EXPRESSIONS = {
+    'scalar': 'self.{name}',
+    'enum': 'self.{name}.value',
+    'list': 'list(self.{name})',
+    'ids': '_decode_id_list(self.{name})',
+    'rows': '[list(row) for row in self.{name}]',
+}
+
+
+def _compile_build_dict(cls: type, spec: Dict[str, str]) -> Callable:
+    """Generate a _build_dict() for cls with its fields written out inline."""
+    items = [f"        {name!r}: {_FIELD_EXPRESSIONS[kind].format(name=name)},"
+             for name, kind in spec.items()]
+    source = "\n".join([
+        "def _build_dict(self, stringify_times=True):",
+        "    created_at = self.created_at",
+        "    updated_at = self.updated_at",
+        "    if stringify_times:",
+        "        created_at = created_at.isoformat()",
+        "        updated_at = updated_at.isoformat()",
+        "    return {",
+        "        'id': self._id,",
+        "        'created_at': created_at,",
+        "        'updated_at': updated_at,",
+        "        'version': self._version,",
+        "        'status': self._status.value,",
+        "        'metadata': self._metadata or {},",
+        *items,
+        "    }",
+    ])
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<{cls.__qualname__}._build_dict>", "exec"), globals(), namespace)
+    build_dict = namespace['_build_dict']
+    build_dict.__qualname__ = f"{cls.__qualname__}._build_dict"
+    build_dict.__doc__ = f"Convert {cls.__name__.lower()} to dictionary."
+    return build_dict
 
 
 class AbstractEntity(ABC):
     """Base abstract entity with universal ID, lifecycle, and versioning."""
     
+    __slots__ = ('_id', '_created_at', '_updated_at', '_version', '_status', '_metadata',
+                 '_created_at_ms', '_updated_at_ms', '_snapshots', '_batch_depth',
+                 '_batch_dirty', '_dict_cache')
+    
     def __init__(self, entity_id: Optional[str] = None):
-        self._id = entity_id or str(uuid.uuid4())
-        self._created_at = datetime.now(timezone.utc)
-        self._updated_at = self._created_at
+        self._id = entity_id or _fast_uuid()
+        # Timestamps are stored as epoch nanoseconds and turned into datetimes
+        # on first read; loaders may also assign datetimes directly
+        self._created_at = self._updated_at = time.time_ns()
         self._version = 1
         self._status = EntityStatus.ACTIVE
-        self._metadata: Dict[str, Any] = {}
+        self._metadata: Optional[Dict[str, Any]] = None  # allocated on first set_metadata()
+        self._batch_depth = 0
+        self._batch_dirty = False
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._CLS_NAME = cls.__name__
+        # Attribute names update(**kwargs) may assign, collected once per class
+        cls._UPDATABLE_FIELDS = frozenset(
+            name for klass in cls.__mro__ for name in getattr(klass, '__slots__', ())
+        )
+        # Serialized fields, inherited fields first; see _FIELD_EXPRESSIONS for kinds
+        spec: Dict[str, str] = {}
+        for klass in reversed(cls.__mro__):
+            spec.update(klass.__dict__.get('_FIELD_SPEC', {}))
+        if '_build_dict' not in cls.__dict__:
+            cls._build_dict = _compile_build_dict(cls, spec)
     
     @property
     def id(self) -> str:
@@ -36,12 +219,40 @@ class AbstractEntity(ABC):
     @property
     def created_at(self) -> datetime:
         """Get creation timestamp."""
-        return self._created_at
+        value = self._created_at
+        if value.__class__ is int:
+            value = self._created_at = _datetime_from_ns(value)
+        return value
     
     @property
     def updated_at(self) -> datetime:
         """Get last update timestamp."""
-        return self._updated_at
+        value = self._updated_at
+        if value.__class__ is int:
+            value = self._updated_at = _datetime_from_ns(value)
+        return value
+    
+    @property
+    def created_at_ms(self) -> int:
+        """Get creation timestamp as epoch milliseconds."""
+        if self._created_at.__class__ is int:
+            return self._created_at // 1_000_000
+        cached = getattr(self, '_created_at_ms', None)
+        if cached is None or cached[0] is not self._created_at:
+            cached = (self._created_at, int(self._created_at.timestamp() * 1000))
+            self._created_at_ms = cached
+        return cached[1]
+    
+    @property
+    def updated_at_ms(self) -> int:
+        """Get last update timestamp as epoch milliseconds."""
+        if self._updated_at.__class__ is int:
+            return self._updated_at // 1_000_000
+        cached = getattr(self, '_updated_at_ms', None)
+        if cached is None or cached[0] is not self._updated_at:
+            cached = (self._updated_at, int(self._updated_at.timestamp() * 1000))
+            self._updated_at_ms = cached
+        return cached[1]
     
     @property
     def version(self) -> int:
@@ -53,14 +264,62 @@ class AbstractEntity(ABC):
         """Get entity status."""
         return self._status
     
+    def _snapshot(self, attr: str, factory: Callable = list) -> Any:
+        """Copy of a collection attribute, rebuilt only after the entity changes.
+        
+        Every mutator goes through update(), so the version (plus the collection
+        object itself, which repositories replace on load) identifies the contents.
+        The returned copy is shared between callers and must not be modified.
+        Inside a batch_update() block the version lags behind, so copy directly.
+        """
+        if self._batch_dirty:
+            return factory(getattr(self, attr))
+        snapshots = getattr(self, '_snapshots', None)
+        if snapshots is None:
+            snapshots = self._snapshots = {}
+        collection = getattr(self, attr)
+        key = (attr, factory)
+        cached = snapshots.get(key)
+        if cached is None or cached[0] is not collection or cached[1] != self._version:
+            cached = (collection, self._version, factory(collection))
+            snapshots[key] = cached
+        return cached[2]
+    
     def update(self, **kwargs) -> None:
         """Update entity with new data."""
+        fields = self._UPDATABLE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(self, f"_{key}"):
-                setattr(self, f"_{key}", value)
-        self._updated_at = datetime.now(timezone.utc)
+            attr = f"_{key}"
+            if attr in fields:
+                if attr == '_status':
+                    # Keep _status an EntityStatus so serializers can read .value directly
+                    try:
+                        value = EntityStatus(value)
+                    except ValueError:
+                        raise ValidationError(f"Invalid entity status: {value!r}")
+                setattr(self, attr, value)
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._updated_at = time.time_ns()
         self._version += 1
     
+    @contextmanager
+    def batch_update(self) -> Iterator['AbstractEntity']:
+        """Group several mutations into a single timestamp/version bump.
+        
+        Nested blocks are allowed; the bump happens when the outermost one exits,
+        and only if something inside actually called update().
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.update()
+    
     def activate(self) -> None:
         """Activate the entity."""
         self._status = EntityStatus.ACTIVE
@@ -83,34 +342,94 @@ class AbstractEntity(ABC):
     
     def get_metadata(self, key: str) -> Any:
         """Get metadata value."""
-        return self._metadata.get(key)
+        metadata = self._metadata
+        return None if metadata is None else metadata.get(key)
     
     def set_metadata(self, key: str, value: Any) -> None:
         """Set metadata value."""
+        if self._metadata is None:
+            self._metadata = {}
         self._metadata[key] = value
         self.update()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert entity to dictionary."""
+    def _reset(self) -> None:
+        """Clear every attribute so a pooled instance holds no references until re-initialized."""
+        for name in self._UPDATABLE_FIELDS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+    
+    def _evolve(self, **fields: Any) -> 'AbstractEntity':
+        """Copy of this entity with the given attributes replaced and the version bumped."""
+        clone = copy.copy(self)
+        if self._metadata is not None:
+            clone._metadata = dict(self._metadata)
+        clone._snapshots = None
+        clone._dict_cache = None
+        clone._batch_depth = 0
+        clone._batch_dirty = False
+        for name, value in fields.items():
+            setattr(clone, name, value)
+        clone._updated_at = time.time_ns()
+        clone._version = self._version + 1
+        return clone
+    
+    def to_dict(self, stringify_times: bool = True) -> Dict[str, Any]:
+        """Convert entity to dictionary.
+        
+        With stringify_times=False the timestamps stay datetime objects, for
+        encoders such as orjson that serialize them natively. The result is
+        cached per version and shared between callers; don't modify it.
+        """
+        caches = getattr(self, '_dict_cache', None)
+        if caches is None:
+            caches = self._dict_cache = {}
+        cached = caches.get(stringify_times)
+        if cached is not None and cached[0] == self._version and not self._batch_dirty:
+            return cached[1]
+        data = self._build_dict(stringify_times)
+        if not self._batch_dirty:
+            caches[stringify_times] = (self._version, data)
+        return data
+    
+    def _build_dict(self, stringify_times: bool = True) -> Dict[str, Any]:
+        """Build the to_dict() payload; subclasses extend this."""
+        created_at = self.created_at
+        updated_at = self.updated_at
+        if stringify_times:
+            created_at = created_at.isoformat()
+            updated_at = updated_at.isoformat()
         return {
             'id': self._id,
-            'created_at': self._created_at.isoformat(),
-            'updated_at': self._updated_at.isoformat(),
+            'created_at': created_at,
+            'updated_at': updated_at,
             'version': self._version,
-            'status': self._status.value if hasattr(self._status, 'value') else str(self._status),
-            'metadata': self._metadata
+            'status': self._status.value,
+            'metadata': self._metadata or {}
         }
     
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}(id={self._id})"
+        return f"{self._CLS_NAME}(id={self._id})"
     
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self._id}, status={self._status.value})"
+        return f"{self._CLS_NAME}(id={self._id}, status={self._status.value})"
 
 
 class Person(AbstractEntity):
     """Abstract base class for all persons in the system."""
     
+    __slots__ = ('_first_name', '_last_name', '_email', '_person_type', '_roles', '_credentials',
+                 '_active_tokens')
+    
+    _FIELD_SPEC = {
+        '_first_name': 'scalar',
+        '_last_name': 'scalar',
+        '_email': 'scalar',
+        '_person_type': 'enum',
+        '_roles': 'list',
+    }
+    
     def __init__(self, first_name: str, last_name: str, email: str, person_type: PersonType, **kwargs):
         super().__init__(**kwargs)
         self._first_name = first_name
@@ -119,7 +438,8 @@ class Person(AbstractEntity):
         self._person_type = person_type
         self._roles: Set[str] = set()
         self._credentials: List[Credential] = []
-        self._active_tokens: List[AuthToken] = []
+        # Heap of (expiry epoch, insertion seq, token); unknown expiry sorts last
+        self._active_tokens: List[Tuple[float, int, AuthToken]] = []
     
     @property
     def first_name(self) -> str:
@@ -142,7 +462,11 @@ class Person(AbstractEntity):
         return self._person_type
     
     @property
-    def roles(self) -> Set[str]:
+    def roles(self) -> FrozenSet[str]:
+        return self._snapshot('_roles', frozenset)
+    
+    def get_roles_copy(self) -> Set[str]:
+        """Get a mutable copy of the roles."""
         return self._roles.copy()
     
     def add_role(self, role: str) -> None:
@@ -170,28 +494,56 @@ class Person(AbstractEntity):
     
     def add_token(self, token: AuthToken) -> None:
         """Add an active token."""
-        self._active_tokens.append(token)
+        expires_at = token.expires_at_epoch()
+        if expires_at is None:
+            expires_at = _NO_EXPIRY
+        heapq.heappush(self._active_tokens, (expires_at, next(_token_seq), token))
         self.update()
     
     def remove_token(self, token: AuthToken) -> None:
         """Remove a token."""
-        self._active_tokens.remove(token)
+        for index, entry in enumerate(self._active_tokens):
+            if entry[2] == token:
+                break
+        else:
+            raise ValueError("token not found")
+        # Removal is rare; re-heapify rather than keeping tombstones
+        del self._active_tokens[index]
+        heapq.heapify(self._active_tokens)
         self.update()
     
     def get_active_tokens(self) -> List[AuthToken]:
         """Get all active tokens."""
-        return [token for token in self._active_tokens if not token.is_expired()]
+        tokens = self._active_tokens
+        now = time.time()
+        # Tokens with a known expiry leave from the front of the heap once it passes
+        while tokens and tokens[0][0] <= now:
+            heapq.heappop(tokens)
+        return [token for expires_at, _, token in tokens
+                if expires_at != _NO_EXPIRY or not token.is_expired()]
 
 
 class Student(Person):
     """Student entity with academic-specific properties."""
     
+    __slots__ = ('_student_id', '_grade_level', '_enrollments', '_gpa', '_academic_standing',
+                 '_advisor')
+    
+    _FIELD_SPEC = {
+        '_student_id': 'scalar',
+        '_grade_level': 'enum',
+        '_gpa': 'scalar',
+        '_academic_standing': 'scalar',
+        '_advisor': 'scalar',
+        '_enrollments': 'ids',
+    }
+    
     def __init__(self, first_name: str, last_name: str, email: str, student_id: str, 
                  grade_level: GradeLevel, **kwargs):
         super().__init__(first_name, last_name, email, PersonType.STUDENT, **kwargs)
         self._student_id = student_id
-        self._grade_level = grade_level
-        self._enrollments: Set[str] = set()  # Section IDs
+        self._grade_level = _intern(grade_level)
+        self._enrollments = array.array('I')  # IDRegistry codes of section IDs
         self._gpa: Optional[float] = None
         self._academic_standing: str = "good"
         self._advisor: Optional[str] = None  # Lecturer ID
@@ -218,26 +570,35 @@ class Student(Person):
     
     def enroll_in_section(self, section_id: str) -> None:
         """Enroll in a section."""
-        self._enrollments.add(section_id)
+        code = IDRegistry.intern(section_id)
+        if code not in self._enrollments:
+            self._enrollments.append(code)
         self.update()
     
     def drop_section(self, section_id: str) -> None:
         """Drop a section."""
-        self._enrollments.discard(section_id)
+        code = IDRegistry.code_of(section_id)
+        if code is not None and code in self._enrollments:
+            self._enrollments.remove(code)
         self.update()
     
     def get_enrollments(self) -> Set[str]:
         """Get all enrolled sections."""
-        return self._enrollments.copy()
+        return set(_decode_id_list(self._enrollments))
 
     @property
-    def enrollments(self) -> Set[str]:
+    def enrollments(self) -> FrozenSet[str]:
         """Backward-compatible property for enrollments used by API layers.
 
         Some parts of the codebase expect a `student.enrollments` attribute.
-        Provide it as a read-only property that returns a copy of the internal set.
+        Provide it as a read-only frozenset; use get_enrollments() for a mutable copy.
         """
-        return self._enrollments.copy()
+        return self._snapshot('_enrollments', _decode_id_set)
+    
+    @property
+    def enrollment_list(self) -> List[str]:
+        """Shared, read-only list snapshot of the enrolled section IDs."""
+        return self._snapshot('_enrollments', _decode_id_list)
     
     def update_gpa(self, gpa: float) -> None:
         """Update GPA."""
@@ -246,38 +607,43 @@ class Student(Person):
         self._gpa = gpa
         self.update()
     
+    @staticmethod
+    def bulk_update_gpa(students: Sequence['Student'], gpas: Sequence[float]) -> None:
+        """Set GPA and academic standing for many students at once (e.g. end of term).
+        
+        All GPAs are validated before any student is modified.
+        """
+        if len(students) != len(gpas):
+            raise ValidationError("students and gpas must have the same length")
+        codes = classify_gpas(gpas)
+        for student, gpa, code in zip(students, gpas, codes):
+            if code < 0:
+                raise ValidationError(
+                    f"GPA must be between 0.0 and 4.0 (got {gpa} for {student.student_id})"
+                )
+        names = STANDING_NAMES
+        for student, gpa, code in zip(students, gpas, codes):
+            student._gpa = float(gpa)
+            student._academic_standing = names[code]
+            student.update()
+    
     def set_advisor(self, advisor_id: str) -> None:
         """Set academic advisor."""
         self._advisor = advisor_id
         self.update()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert student to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_first_name': self._first_name,
-            '_last_name': self._last_name,
-            '_email': self._email,
-            '_person_type': self._person_type.value,
-            '_roles': list(self._roles),
-            '_student_id': self._student_id,
-            '_grade_level': self._grade_level.value,
-            '_gpa': self._gpa,
-            '_academic_standing': self._academic_standing,
-            '_advisor': self._advisor,
-            '_enrollments': list(self._enrollments)
-        })
-        return base_dict
 
 
 class Lecturer(Person):
     """Lecturer entity with teaching-specific properties."""
     
+    __slots__ = ('_employee_id', '_department', '_courses', '_office_hours', '_research_interests',
+                 '_qualifications')
+    
     def __init__(self, first_name: str, last_name: str, email: str, employee_id: str, 
                  department: str, **kwargs):
         super().__init__(first_name, last_name, email, PersonType.LECTURER, **kwargs)
         self._employee_id = employee_id
-        self._department = department
+        self._department = _intern(department)
         self._courses: Set[str] = set()  # Course IDs
         self._office_hours: Dict[str, str] = {}
         self._research_interests: List[str] = []
@@ -292,20 +658,20 @@ class Lecturer(Person):
         return self._department
     
     @property
-    def courses(self) -> Set[str]:
-        return self._courses.copy()
+    def courses(self) -> FrozenSet[str]:
+        return self._snapshot('_courses', frozenset)
     
     @property
-    def office_hours(self) -> Dict[str, str]:
-        return self._office_hours.copy()
+    def office_hours(self) -> Mapping[str, str]:
+        return MappingProxyType(self._office_hours)
     
     @property
-    def research_interests(self) -> List[str]:
-        return self._research_interests.copy()
+    def research_interests(self) -> Tuple[str, ...]:
+        return self._snapshot('_research_interests', tuple)
     
     @property
-    def qualifications(self) -> List[str]:
-        return self._qualifications.copy()
+    def qualifications(self) -> Tuple[str, ...]:
+        return self._snapshot('_qualifications', tuple)
     
     def add_course(self, course_id: str) -> None:
         """Add a course to teach."""
@@ -336,12 +702,14 @@ class Lecturer(Person):
 class Staff(Person):
     """Staff entity with administrative properties."""
     
+    __slots__ = ('_employee_id', '_department', '_position', '_permissions', '_managed_resources')
+    
     def __init__(self, first_name: str, last_name: str, email: str, employee_id: str, 
                  department: str, position: str, **kwargs):
         super().__init__(first_name, last_name, email, PersonType.STAFF, **kwargs)
         self._employee_id = employee_id
-        self._department = department
-        self._position = position
+        self._department = _intern(department)
+        self._position = _intern(position)
         self._permissions: Set[str] = set()
         self._managed_resources: Set[str] = set()
     
@@ -358,12 +726,12 @@ class Staff(Person):
         return self._position
     
     @property
-    def permissions(self) -> Set[str]:
-        return self._permissions.copy()
+    def permissions(self) -> FrozenSet[str]:
+        return self._snapshot('_permissions', frozenset)
     
     @property
-    def managed_resources(self) -> Set[str]:
-        return self._managed_resources.copy()
+    def managed_resources(self) -> FrozenSet[str]:
+        return self._snapshot('_managed_resources', frozenset)
     
     def add_permission(self, permission: str) -> None:
         """Add a permission."""
@@ -379,23 +747,13 @@ class Staff(Person):
         """Add a managed resource."""
         self._managed_resources.add(resource_id)
         self.update()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert person to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_first_name': self._first_name,
-            '_last_name': self._last_name,
-            '_email': self._email,
-            '_person_type': self._person_type.value,
-            '_roles': list(self._roles)
-        })
-        return base_dict
 
 
 class Guest(Person):
     """Guest entity with limited access."""
     
+    __slots__ = ('_sponsor_id', '_visit_purpose', '_expires_at', '_access_areas')
+    
     def __init__(self, first_name: str, last_name: str, email: str, 
                  sponsor_id: str, visit_purpose: str, **kwargs):
         super().__init__(first_name, last_name, email, PersonType.GUEST, **kwargs)
@@ -417,8 +775,8 @@ class Guest(Person):
         return self._expires_at
     
     @property
-    def access_areas(self) -> Set[str]:
-        return self._access_areas.copy()
+    def access_areas(self) -> FrozenSet[str]:
+        return self._snapshot('_access_areas', frozenset)
     
     def set_expiration(self, expires_at: datetime) -> None:
         """Set guest expiration time."""
@@ -440,15 +798,29 @@ class Guest(Person):
 class Course(AbstractEntity):
     """Course entity representing an academic course."""
     
+    __slots__ = ('_course_code', '_title', '_description', '_credits', '_department',
+                 '_prerequisites', '_sections', '_syllabus')
+    
+    _FIELD_SPEC = {
+        '_course_code': 'scalar',
+        '_title': 'scalar',
+        '_description': 'scalar',
+        '_credits': 'scalar',
+        '_department': 'scalar',
+        '_prerequisites': 'list',
+        '_sections': 'list',
+        '_syllabus': 'scalar',
+    }
+    
     def __init__(self, course_code: str, title: str, description: str, 
-                 credits: int, department: str, **kwargs):
+                 credits: int, department: str, prerequisites: Optional[List[str]] = None, **kwargs):
         super().__init__(**kwargs)
         self._course_code = course_code
         self._title = title
         self._description = description
         self._credits = credits
-        self._department = department
-        self._prerequisites: Set[str] = set()  # Course IDs
+        self._department = _intern(department)
+        self._prerequisites: Set[str] = set(prerequisites or ())  # Course IDs
         self._sections: Set[str] = set()  # Section IDs
         self._syllabus: Optional[str] = None  # Syllabus ID
     
@@ -473,12 +845,22 @@ class Course(AbstractEntity):
         return self._department
     
     @property
-    def prerequisites(self) -> Set[str]:
-        return self._prerequisites.copy()
+    def prerequisites(self) -> FrozenSet[str]:
+        return self._snapshot('_prerequisites', frozenset)
+    
+    @property
+    def sections(self) -> FrozenSet[str]:
+        return self._snapshot('_sections', frozenset)
+    
+    @property
+    def prerequisite_list(self) -> List[str]:
+        """Shared, read-only list snapshot of the prerequisite course IDs."""
+        return self._snapshot('_prerequisites')
     
     @property
-    def sections(self) -> Set[str]:
-        return self._sections.copy()
+    def section_list(self) -> List[str]:
+        """Shared, read-only list snapshot of the section IDs."""
+        return self._snapshot('_sections')
     
     @property
     def syllabus(self) -> Optional[str]:
@@ -498,39 +880,44 @@ class Course(AbstractEntity):
         """Set the syllabus."""
         self._syllabus = syllabus_id
         self.update()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert course to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_course_code': self._course_code,
-            '_title': self._title,
-            '_description': self._description,
-            '_credits': self._credits,
-            '_department': self._department,
-            '_prerequisites': list(self._prerequisites),
-            '_sections': list(self._sections),
-            '_syllabus': self._syllabus
-        })
-        return base_dict
 
 
 class Section(AbstractEntity):
     """Section entity representing a specific instance of a course."""
     
+    __slots__ = ('_course_id', '_section_number', '_semester', '_year', '_instructor_id',
+                 '_room_id', '_schedule', '_capacity', '_enrolled', '_waitlist',
+                 '_enrollment_policy')
+    
+    _FIELD_SPEC = {
+        '_course_id': 'scalar',
+        '_section_number': 'scalar',
+        '_semester': 'scalar',
+        '_year': 'scalar',
+        '_instructor_id': 'scalar',
+        '_room_id': 'scalar',
+        '_schedule': 'scalar',
+        '_capacity': 'scalar',
+        '_enrolled': 'list',
+        '_waitlist': 'list',
+        '_enrollment_policy': 'scalar',
+    }
+    
     def __init__(self, course_id: str, section_number: str, semester: str, 
-                 year: int, instructor_id: str, **kwargs):
+                 year: int, instructor_id: str, capacity: int = 0, **kwargs):
+        if capacity < 0:
+            raise ValidationError("Capacity cannot be negative")
         super().__init__(**kwargs)
         self._course_id = course_id
         self._section_number = section_number
-        self._semester = semester
+        self._semester = _intern(semester)
         self._year = year
         self._instructor_id = instructor_id
         self._room_id: Optional[str] = None
         self._schedule: Dict[str, str] = {}  # day -> time
-        self._capacity: int = 0
+        self._capacity: int = capacity
         self._enrolled: Set[str] = set()  # Student IDs
-        self._waitlist: List[str] = []  # Student IDs in order
+        self._waitlist: Deque[str] = deque()  # Student IDs in order
         self._enrollment_policy: Optional[str] = None
     
     @property
@@ -558,13 +945,25 @@ class Section(AbstractEntity):
         return self._room_id
     
     @property
-    def schedule(self) -> Dict[str, str]:
-        return self._schedule.copy()
+    def schedule(self) -> Mapping[str, str]:
+        return MappingProxyType(self._schedule)
     
     @property
     def capacity(self) -> int:
         return self._capacity
     
+    @property
+    def enrolled(self) -> FrozenSet[str]:
+        return self._snapshot('_enrolled', frozenset)
+    
+    @property
+    def waitlist(self) -> List[str]:
+        return list(self._waitlist)
+    
+    @property
+    def enrollment_policy(self) -> Optional[str]:
+        return self._enrollment_policy
+    
     @property
     def enrolled_count(self) -> int:
         return len(self._enrolled)
@@ -615,7 +1014,7 @@ class Section(AbstractEntity):
             self._enrolled.remove(student_id)
             # Move first waitlisted student to enrolled
             if self._waitlist:
-                next_student = self._waitlist.pop(0)
+                next_student = self._waitlist.popleft()
                 self._enrolled.add(next_student)
             self.update()
             return True
@@ -624,32 +1023,18 @@ class Section(AbstractEntity):
             self.update()
             return True
         return False
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert section to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_course_id': self._course_id,
-            '_section_number': self._section_number,
-            '_semester': self._semester,
-            '_year': self._year,
-            '_instructor_id': self._instructor_id,
-            '_room_id': self._room_id,
-            '_schedule': self._schedule,
-            '_capacity': self._capacity,
-            '_enrolled': list(self._enrolled),
-            '_waitlist': self._waitlist,
-            '_enrollment_policy': self._enrollment_policy
-        })
-        return base_dict
 
 
 class Grade(AbstractEntity):
     """Immutable grade entity."""
     
+    __slots__ = ('_student_id', '_section_id', '_assessment_id', '_grade_value', '_letter_grade',
+                 '_percentage', '_graded_at', '_grader_id', '_comments')
+    
     def __init__(self, student_id: str, section_id: str, assessment_id: str,
                  grade_value: Union[str, float], letter_grade: str, 
-                 percentage: float, **kwargs):
+                 percentage: float, grader_id: Optional[str] = None,
+                 comments: str = "", **kwargs):
         super().__init__(**kwargs)
         self._student_id = student_id
         self._section_id = section_id
@@ -658,8 +1043,8 @@ class Grade(AbstractEntity):
         self._letter_grade = letter_grade
         self._percentage = percentage
         self._graded_at = datetime.now(timezone.utc)
-        self._grader_id: Optional[str] = None
-        self._comments: str = ""
+        self._grader_id = grader_id
+        self._comments = comments
     
     @property
     def student_id(self) -> str:
@@ -697,24 +1082,43 @@ class Grade(AbstractEntity):
     def comments(self) -> str:
         return self._comments
     
-    def set_grader(self, grader_id: str) -> None:
-        """Set the grader ID."""
-        self._grader_id = grader_id
-        self.update()
+    def with_grader(self, grader_id: str) -> 'Grade':
+        """Return a new version of this grade with the grader set."""
+        return self._evolve(_grader_id=grader_id)
     
-    def set_comments(self, comments: str) -> None:
-        """Set grade comments."""
-        self._comments = comments
-        self.update()
+    def with_comments(self, comments: str) -> 'Grade':
+        """Return a new version of this grade with the comments set."""
+        return self._evolve(_comments=comments)
+    
+    def __eq__(self, other: object) -> bool:
+        # Changes only happen through with_*(), so (id, version) identifies the contents
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._id, self._version) == (other._id, other._version)
+    
+    def __hash__(self) -> int:
+        return hash((self._id, self._version))
 
 
 class Facility(AbstractEntity):
     """Facility entity representing a building or area."""
     
+    __slots__ = ('_name', '_facility_type', '_location', '_rooms', '_access_level',
+                 '_security_zones')
+    
+    _FIELD_SPEC = {
+        '_name': 'scalar',
+        '_facility_type': 'scalar',
+        '_location': 'scalar',
+        '_rooms': 'list',
+        '_access_level': 'enum',
+        '_security_zones': 'list',
+    }
+    
     def __init__(self, name: str, facility_type: str, location: str, **kwargs):
         super().__init__(**kwargs)
         self._name = name
-        self._facility_type = facility_type
+        self._facility_type = _intern(facility_type)
         self._location = location
         self._rooms: Set[str] = set()  # Room IDs
         self._access_level: AccessLevel = AccessLevel.READ
@@ -733,16 +1137,16 @@ class Facility(AbstractEntity):
         return self._location
     
     @property
-    def rooms(self) -> Set[str]:
-        return self._rooms.copy()
+    def rooms(self) -> FrozenSet[str]:
+        return self._snapshot('_rooms', frozenset)
     
     @property
     def access_level(self) -> AccessLevel:
         return self._access_level
     
     @property
-    def security_zones(self) -> Set[str]:
-        return self._security_zones.copy()
+    def security_zones(self) -> FrozenSet[str]:
+        return self._snapshot('_security_zones', frozenset)
     
     def add_room(self, room_id: str) -> None:
         """Add a room to this facility."""
@@ -751,41 +1155,43 @@ class Facility(AbstractEntity):
     
     def set_access_level(self, level: AccessLevel) -> None:
         """Set access level for this facility."""
-        self._access_level = level
+        self._access_level = AccessLevel(level)
         self.update()
     
     def add_security_zone(self, zone: str) -> None:
         """Add a security zone."""
         self._security_zones.add(zone)
         self.update()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert facility to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_name': self._name,
-            '_facility_type': self._facility_type,
-            '_location': self._location,
-            '_rooms': list(self._rooms),
-            '_access_level': self._access_level.value if hasattr(self._access_level, 'value') else str(self._access_level),
-            '_security_zones': list(self._security_zones)
-        })
-        return base_dict
 
 
 class Room(AbstractEntity):
     """Room entity representing a specific room in a facility."""
     
+    __slots__ = ('_room_number', '_facility_id', '_room_type', '_capacity', '_equipment',
+                 '_access_control', '_bookings')
+    
+    _FIELD_SPEC = {
+        '_room_number': 'scalar',
+        '_facility_id': 'scalar',
+        '_room_type': 'scalar',
+        '_capacity': 'scalar',
+        '_equipment': 'list',
+        '_access_control': 'scalar',
+        '_bookings': 'rows',
+    }
+    
     def __init__(self, room_number: str, facility_id: str, room_type: str, 
                  capacity: int, **kwargs):
         super().__init__(**kwargs)
         self._room_number = room_number
         self._facility_id = facility_id
-        self._room_type = room_type
+        self._room_type = _intern(room_type)
         self._capacity = capacity
         self._equipment: Set[str] = set()
         self._access_control: bool = False
-        self._booking_schedule: Dict[str, Any] = {}
+        # (start, end, booker_id) with epoch-second bounds, sorted by start and
+        # never overlapping, so one bisect finds the only possible conflicts
+        self._bookings: List[Tuple[float, float, str]] = []
     
     @property
     def room_number(self) -> str:
@@ -804,8 +1210,8 @@ class Room(AbstractEntity):
         return self._capacity
     
     @property
-    def equipment(self) -> Set[str]:
-        return self._equipment.copy()
+    def equipment(self) -> FrozenSet[str]:
+        return self._snapshot('_equipment', frozenset)
     
     @property
     def has_access_control(self) -> bool:
@@ -821,45 +1227,51 @@ class Room(AbstractEntity):
         self._access_control = enabled
         self.update()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert room to dictionary."""
-        base_dict = super().to_dict()
-        base_dict.update({
-            '_room_number': self._room_number,
-            '_facility_id': self._facility_id,
-            '_room_type': self._room_type,
-            '_capacity': self._capacity,
-            '_equipment': list(self._equipment),
-            '_access_control': self._access_control,
-            '_booking_schedule': self._booking_schedule
-        })
-        return base_dict
+    
+    @property
+    def bookings(self) -> Tuple[Tuple[float, float, str], ...]:
+        """(start, end, booker_id) bookings in start order, as epoch seconds."""
+        return self._snapshot('_bookings', tuple)
+    
+    def _find_slot(self, start: float, end: float) -> Optional[int]:
+        """Insertion index for [start, end), or None if it overlaps a booking."""
+        bookings = self._bookings
+        index = bisect.bisect_left(bookings, (start,))
+        if index and bookings[index - 1][1] > start:
+            return None
+        if index < len(bookings) and bookings[index][0] < end:
+            return None
+        return index
+    
+    def is_available(self, start_time: datetime, end_time: datetime) -> bool:
+        """Check whether the room is free for the whole period."""
+        return self._find_slot(start_time.timestamp(), end_time.timestamp()) is not None
     
     def book_room(self, start_time: datetime, end_time: datetime, 
                   booker_id: str) -> bool:
         """Book the room for a time period."""
-        # Simple booking logic - in practice, this would be more complex
-        booking_key = f"{start_time.isoformat()}-{end_time.isoformat()}"
-        if booking_key not in self._booking_schedule:
-            self._booking_schedule[booking_key] = {
-                'booker_id': booker_id,
-                'start_time': start_time,
-                'end_time': end_time
-            }
-            self.update()
-            return True
-        return False
+        start, end = start_time.timestamp(), end_time.timestamp()
+        index = self._find_slot(start, end)
+        if index is None:
+            return False
+        self._bookings.insert(index, (start, end, booker_id))
+        self.update()
+        return True
 
 
 class Event(AbstractEntity):
     """Event entity for event sourcing."""
     
+    __slots__ = ('_event_type', '_stream_id', '_event_data', '_event_data_json', '_correlation_id',
+                 '_causation_id')
+    
     def __init__(self, event_type: EventType, stream_id: str, 
                  event_data: Dict[str, Any], **kwargs):
         super().__init__(**kwargs)
         self._event_type = event_type
         self._stream_id = stream_id
         self._event_data = event_data
+        self._event_data_json: Optional[str] = None
         self._version = 1
         self._correlation_id: Optional[str] = None
         self._causation_id: Optional[str] = None
@@ -873,8 +1285,20 @@ class Event(AbstractEntity):
         return self._stream_id
     
     @property
-    def event_data(self) -> Dict[str, Any]:
-        return self._event_data.copy()
+    def event_data(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._event_data)
+    
+    @property
+    def event_data_json(self) -> str:
+        """The event payload as JSON, encoded once and reused by every store write."""
+        encoded = self._event_data_json
+        if encoded is None:
+            if ORJSON_AVAILABLE:
+                encoded = orjson.dumps(self._event_data, option=orjson.OPT_NON_STR_KEYS).decode()
+            else:
+                encoded = json.dumps(self._event_data)
+            self._event_data_json = encoded
+        return encoded
     
     @property
     def correlation_id(self) -> Optional[str]:
@@ -898,6 +1322,8 @@ class Event(AbstractEntity):
 class Policy(AbstractEntity):
     """Policy entity for access control and business rules."""
     
+    __slots__ = ('_name', '_policy_type', '_rules', '_priority', '_is_active', '_applies_to')
+    
     def __init__(self, name: str, policy_type: PolicyType, 
                  rules: Dict[str, Any], **kwargs):
         super().__init__(**kwargs)
@@ -917,8 +1343,8 @@ class Policy(AbstractEntity):
         return self._policy_type
     
     @property
-    def rules(self) -> Dict[str, Any]:
-        return self._rules.copy()
+    def rules(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._rules)
     
     @property
     def priority(self) -> int:
@@ -929,8 +1355,8 @@ class Policy(AbstractEntity):
         return self._is_active
     
     @property
-    def applies_to(self) -> Set[str]:
-        return self._applies_to.copy()
+    def applies_to(self) -> FrozenSet[str]:
+        return self._snapshot('_applies_to', frozenset)
     
     def set_priority(self, priority: int) -> None:
         """Set policy priority."""
@@ -956,56 +1382,54 @@ class Policy(AbstractEntity):
 class AuditLogEntry(AbstractEntity):
     """Immutable audit log entry."""
     
+    __slots__ = ('_user_id', '_action', '_resource_type', '_resource_id', '_details',
+                 '_details_view', '_ip_address', '_user_agent', '_timestamp')
+    
     def __init__(self, user_id: str, action: AuditAction, resource_type: str,
-                 resource_id: str, details: Dict[str, Any], **kwargs):
+                 resource_id: str, details: Dict[str, Any], ip_address: Optional[str] = None,
+                 user_agent: Optional[str] = None, timestamp: Optional[datetime] = None,
+                 **kwargs):
         super().__init__(**kwargs)
-        self._user_id = user_id
+        # Entries for the same user/resource share one string object
+        self._user_id = _intern(user_id)
         self._action = action
-        self._resource_type = resource_type
-        self._resource_id = resource_id
+        self._resource_type = _intern(resource_type)
+        self._resource_id = _intern(resource_id)
         self._details = details
-        self._ip_address: Optional[str] = None
-        self._user_agent: Optional[str] = None
-        self._timestamp = datetime.now(timezone.utc)
-    
-    @property
-    def user_id(self) -> str:
-        return self._user_id
-    
-    @property
-    def action(self) -> AuditAction:
-        return self._action
-    
-    @property
-    def resource_type(self) -> str:
-        return self._resource_type
-    
-    @property
-    def resource_id(self) -> str:
-        return self._resource_id
-    
-    @property
-    def details(self) -> Dict[str, Any]:
-        return self._details.copy()
-    
-    @property
-    def ip_address(self) -> Optional[str]:
-        return self._ip_address
-    
-    @property
-    def user_agent(self) -> Optional[str]:
-        return self._user_agent
-    
-    @property
-    def timestamp(self) -> datetime:
-        return self._timestamp
-    
-    def set_ip_address(self, ip_address: str) -> None:
-        """Set IP address."""
+        self._details_view = MappingProxyType(details)
         self._ip_address = ip_address
-        self.update()
-    
-    def set_user_agent(self, user_agent: str) -> None:
-        """Set user agent."""
         self._user_agent = user_agent
-        self.update()
+        # Batch writers pass one timestamp for every entry they create
+        self._timestamp = timestamp or datetime.now(timezone.utc)
+    
+    # Plain slot reads: attrgetter fetches them without running a Python frame
+    user_id = property(attrgetter('_user_id'))
+    action = property(attrgetter('_action'))
+    resource_type = property(attrgetter('_resource_type'))
+    resource_id = property(attrgetter('_resource_id'))
+    details = property(attrgetter('_details_view'))
+    ip_address = property(attrgetter('_ip_address'))
+    user_agent = property(attrgetter('_user_agent'))
+    timestamp = property(attrgetter('_timestamp'))
+    
+    def with_ip_address(self, ip_address: str) -> 'AuditLogEntry':
+        """Return a new version of this entry with the IP address set."""
+        return self._evolve(_ip_address=ip_address)
+    
+    def with_user_agent(self, user_agent: str) -> 'AuditLogEntry':
+        """Return a new version of this entry with the user agent set."""
+        return self._evolve(_user_agent=user_agent)
+    
+    def with_detail(self, key: str, value: Any) -> 'AuditLogEntry':
+        """Return a new version of this entry with one detail added or replaced."""
+        details = dict(self._details)
+        details[key] = value
+        return self._evolve(_details=details, _details_view=MappingProxyType(details))
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._id, self._version) == (other._id, other._version)
+    
+    def __hash__(self) -> int:
+        return hash((self._id, self._version))
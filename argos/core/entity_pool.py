@@ -0,0 +1,53 @@
+"""
+Object pool for short-lived entities created during bulk ingestion.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Type, TypeVar
+
+from .entities import AbstractEntity
+
+E = TypeVar('E', bound=AbstractEntity)
+
+
+class EntityPool:
+    """Reuses released entity instances instead of allocating new ones.
+
+    Only for transient intermediaries (e.g. grades or sections built, saved and
+    discarded in an import loop); never release an entity that is still
+    referenced by a repository, cache or API response.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._max_size = max_size
+        self._free: Dict[type, Deque[AbstractEntity]] = {}
+
+    def acquire(self, cls: Type[E], *args: Any, **kwargs: Any) -> E:
+        """Get an initialized instance of cls, reusing a released one if available."""
+        free = self._free.get(cls)
+        if free:
+            try:
+                entity = free.pop()
+            except IndexError:
+                # Another thread took the last one
+                return cls(*args, **kwargs)
+            entity.__init__(*args, **kwargs)
+            return entity
+        return cls(*args, **kwargs)
+
+    def release(self, entity: AbstractEntity) -> None:
+        """Reset an entity and keep it for reuse."""
+        free = self._free.get(entity.__class__)
+        if free is None:
+            free = self._free.setdefault(entity.__class__, deque())
+        if len(free) < self._max_size:
+            entity._reset()
+            free.append(entity)
+
+    def size(self, cls: type) -> int:
+        """Number of pooled instances of cls."""
+        return len(self._free.get(cls, ()))
+
+    def clear(self) -> None:
+        """Drop all pooled instances."""
+        self._free.clear()
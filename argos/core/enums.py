@@ -97,3 +97,20 @@ class AuditAction(Enum):
     ACCESS_GRANTED = "access_granted"
     ACCESS_DENIED = "access_denied"
     POLICY_VIOLATION = "policy_violation"
+
+
+def _from_value(cls, value):
+    """Look up a member by value with a single dict probe."""
+    try:
+        return cls._value2member_map_[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+# Every enum above gets from_value() and a VALUES frozenset of its raw values,
+# for validating and converting strings without going through Enum.__call__
+for _enum in [obj for obj in list(globals().values())
+              if isinstance(obj, type) and issubclass(obj, Enum) and obj.__module__ == __name__]:
+    _enum.from_value = classmethod(_from_value)
+    _enum.VALUES = frozenset(_enum._value2member_map_)
+del _enum
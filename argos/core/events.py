@@ -1,20 +1,135 @@
+import atexit
+import os
+import sys
+import threading
+import weakref
 from datetime import datetime
 from .abstract_entity import AbstractEntity
 
+BATCH_SIZE = int(os.getenv("ARGOS_AUDIT_BATCH_SIZE", "100"))
+BATCH_MS = int(os.getenv("ARGOS_AUDIT_BATCH_MS", "50"))
+
 class Event(AbstractEntity):
-    def __init__(self, type, data):
+    __slots__ = ('type', 'data', 'timestamp')
+
+    def __init__(self, type, data, timestamp=None):
         super().__init__()
-        self.type = type
+        self.type = sys.intern(type) if type.__class__ is str else type
         self.data = data
-        self.timestamp = datetime.utcnow()
+        # created_at was just stamped; reuse it rather than reading the clock again
+        self.timestamp = timestamp or self.created_at
+
+# Streams with a sink, flushed at interpreter exit so buffered events are not dropped
+_open_streams = weakref.WeakSet()
+
+def _flush_open_streams():
+    for stream in list(_open_streams):
+        stream.close()
+
+atexit.register(_flush_open_streams)
 
 class EventStream:
-    def __init__(self):
+    __slots__ = ('events', 'batch_size', 'flush_ms', '_sink', '_buf', '_lock',
+                 '_flush_lock', '_timer', '__weakref__')
+
+    def __init__(self, batch_size=BATCH_SIZE, flush_ms=BATCH_MS, sink=None):
         self.events = []
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        # sink: anything with append_events(list), e.g. an EventStore
+        self._sink = sink
+        self._buf = []
+        self._lock = threading.Lock()
+        # Held across the swap and the write so batches reach the sink in order
+        self._flush_lock = threading.Lock()
+        self._timer = None
+        if sink is not None:
+            _open_streams.add(self)
 
     def publish(self, event):
         self.events.append(event)
+        self._enqueue((event,))
+
+    def publish_records(self, records):
+        """Create and publish an Event per (type, data) pair, all stamped with one timestamp."""
+        now = datetime.utcnow()
+        events = [Event(type, data, now) for type, data in records]
+        self.events.extend(events)
+        self._enqueue(events)
+        return events
+
+    def _enqueue(self, events):
+        if self._sink is None:
+            return
+        with self._lock:
+            self._buf.extend(events)
+            if len(self._buf) < self.batch_size:
+                # Whatever is buffered gets written at most flush_ms from now
+                self._arm_timer()
+                return
+        self.flush()
+
+    def _arm_timer(self):
+        # Caller holds self._lock
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_ms / 1000.0, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buf = self._buf, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if batch:
+                try:
+                    self._sink.append_events(batch)
+                except Exception:
+                    with self._lock:
+                        # Put the batch back ahead of anything published since and retry later
+                        self._buf[:0] = batch
+                        self._arm_timer()
+                    raise
+
+    def close(self):
+        """Cancel the pending timer and write out whatever is still buffered."""
+        if self._sink is None:
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+        _open_streams.discard(self)
 
     def replay(self):
-        for event in self.events:
-            yield event
+        return iter(self.events)
+
+    def snapshot(self):
+        return tuple(self.events)
+
+class Dispatcher:
+    """Routes events to the handlers registered for their type with one dict lookup."""
+    __slots__ = ('_by_type',)
+
+    def __init__(self):
+        self._by_type = {}
+
+    def register(self, event_type, handler):
+        # Handler tuples are replaced, never mutated, so dispatch needs no lock
+        self._by_type[event_type] = self._by_type.get(event_type, ()) + (handler,)
+
+    def register_handler(self, handler, event_types):
+        """Register handler under every type in event_types its can_handle() accepts."""
+        for event_type in event_types:
+            if handler.can_handle(event_type):
+                self.register(event_type, handler)
+
+    def handlers_for(self, event_type):
+        return self._by_type.get(event_type, ())
+
+    def dispatch(self, event, event_type=None):
+        for handler in self._by_type.get(event.type if event_type is None else event_type, ()):
+            handler.handle_event(event)
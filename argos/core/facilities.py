@@ -1,17 +1,23 @@
 from .abstract_entity import AbstractEntity
 
 class Facility(AbstractEntity):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         super().__init__()
         self.name = name
 
 class Room(Facility):
+    __slots__ = ('capacity', 'resources')
+
     def __init__(self, name, capacity):
         super().__init__(name)
         self.capacity = capacity
         self.resources = []
 
 class Resource(AbstractEntity):
+    __slots__ = ('type', 'status')
+
     def __init__(self, type, status="active"):
         super().__init__()
         self.type = type
@@ -3,12 +3,15 @@ Core interfaces and abstract base classes for the Argos platform.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Protocol, TypeVar, Generic
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Sequence, TypeVar, Generic
 from datetime import datetime
 from enum import Enum
 
 from .enums import ReportFormat, AccessLevel, ConstraintType
 
+if TYPE_CHECKING:
+    from .entities import Event
+
 
 T = TypeVar('T')
 R = TypeVar('R')
@@ -117,6 +120,10 @@ class AuthToken(ABC):
         """Check if the token is expired."""
         pass
     
+    def expires_at_epoch(self) -> Optional[float]:
+        """Expiry as a Unix timestamp, or None if the token can't tell in advance."""
+        return None
+    
     @abstractmethod
     def get_claims(self) -> Dict[str, Any]:
         """Get token claims."""
@@ -152,7 +159,11 @@ class EventHandler(ABC):
     
     @abstractmethod
     def can_handle(self, event_type: str) -> bool:
-        """Check if this handler can handle the event type."""
+        """Check if this handler can handle the event type.
+        
+        Legacy hook: dispatchers call it once per event type at registration,
+        not per event, so the answer must not change afterwards.
+        """
         pass
 
 
@@ -165,9 +176,13 @@ class MLModel(ABC):
         pass
     
     @abstractmethod
+    def predict_batch(self, inputs: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Make one prediction per input; vectorized models may take an (N, F) array."""
+        pass
+    
     def predict(self, input_data: Dict[str, Any]) -> Any:
         """Make a prediction."""
-        pass
+        return self.predict_batch([input_data])[0]
     
     @abstractmethod
     def explain(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -222,6 +237,11 @@ class EventStore(ABC):
         """Append an event to the store."""
         pass
     
+    def append_events(self, events: List['Event']) -> None:
+        """Append several events; stores override this with a single bulk write."""
+        for event in events:
+            self.append_event(event)
+    
     @abstractmethod
     def get_events(self, stream_id: str, from_version: int = 0) -> List['Event']:
         """Get events for a stream."""
@@ -1,14 +1,42 @@
-from abc import ABC, abstractmethod
+import asyncio
+from .interfaces import MLModel
 
-class MLModel(ABC):
-    @abstractmethod
-    def train(self, data):
-        pass
+__all__ = ["MLModel", "BatchingPredictor"]
 
-    @abstractmethod
-    def predict(self, x):
-        pass
+class BatchingPredictor:
+    """Coalesces concurrent async predict() calls into one predict_batch() call."""
 
-    @abstractmethod
-    def explain(self, x):
-        pass
+    def __init__(self, model, max_batch=256, max_delay_ms=5):
+        self._model = model
+        self._max_batch = max_batch
+        self._delay = max_delay_ms / 1000.0
+        self._pending = []
+        self._timer = None
+
+    async def predict(self, x):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((x, future))
+        if len(self._pending) >= self._max_batch:
+            self._drain()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._delay, self._drain)
+        return await future
+
+    def _drain(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            results = self._model.predict_batch([x for x, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,26 +1,56 @@
+import threading
 from .abstract_entity import AbstractEntity
 
+# Each distinct role gets one bit of Person.roles, assigned on first use
+_ROLE_BITS = {}
+_ROLE_NAMES = []
+_ROLE_LOCK = threading.Lock()
+
+
+def _role_bit(role):
+    bit = _ROLE_BITS.get(role)
+    if bit is None:
+        with _ROLE_LOCK:
+            bit = _ROLE_BITS.get(role)
+            if bit is None:
+                bit = 1 << len(_ROLE_NAMES)
+                _ROLE_NAMES.append(role)
+                _ROLE_BITS[role] = bit
+    return bit
+
+
 class Person(AbstractEntity):
+    __slots__ = ('name', 'email', 'roles')
+
     def __init__(self, name, email):
         super().__init__()
         self.name = name
         self.email = email
-        self.roles = set()
+        self.roles = 0
 
     def add_role(self, role):
-        self.roles.add(role)
+        self.roles |= _role_bit(role)
 
     def remove_role(self, role):
-        self.roles.discard(role)
+        bit = _ROLE_BITS.get(role)
+        if bit is not None:
+            self.roles &= ~bit
+
+    def has_role(self, role):
+        bit = _ROLE_BITS.get(role)
+        return bit is not None and bool(self.roles & bit)
+
+    def get_roles(self):
+        return {name for i, name in enumerate(_ROLE_NAMES) if self.roles >> i & 1}
 
 class Student(Person):
-    pass
+    __slots__ = ()
 
 class Lecturer(Person):
-    pass
+    __slots__ = ()
 
 class Staff(Person):
-    pass
+    __slots__ = ()
 
 class Guest(Person):
-    pass
+    __slots__ = ()
@@ -1,17 +1,69 @@
 from abc import ABC, abstractmethod
+from collections import Counter
+
+# Results of pure policies kept per engine before the cache is dropped
+CACHE_SIZE = 10000
+# Re-sort policies by rejection count every this many checks
+REORDER_EVERY = 1000
 
 class Policy(ABC):
+    # A pure policy's result depends only on its own configuration, user.id and resource,
+    # so it can be cached
+    pure = False
+
+    @property
+    def policy_id(self):
+        return type(self).__name__
+
     @abstractmethod
     def evaluate(self, user, resource):
         pass
 
 class AgePolicy(Policy):
+    pure = True
+
     def evaluate(self, user, resource):
         return True
 
 class PolicyEngine:
     def __init__(self, policies=None):
-        self.policies = policies or []
+        self.policies = list(policies or [])
+        self._cache = {}
+        self._reject_hits = Counter()
+        self._checks = 0
 
     def check(self, user, resource):
-        return all(p.evaluate(user, resource) for p in self.policies)
+        self._checks += 1
+        if self._checks % REORDER_EVERY == 0:
+            self._reorder()
+        cache = self._cache
+        for p in self.policies:
+            allowed = None
+            if p.pure:
+                # Keyed on the policy object: instances of one class can be configured differently
+                key = (p, user.id, resource)
+                try:
+                    allowed = cache.get(key)
+                except TypeError:
+                    # Unhashable resource; evaluate without caching
+                    key = None
+                if allowed is None:
+                    allowed = bool(p.evaluate(user, resource))
+                    if key is not None:
+                        if len(cache) >= CACHE_SIZE:
+                            cache.clear()
+                        cache[key] = allowed
+            else:
+                allowed = p.evaluate(user, resource)
+            if not allowed:
+                self._reject_hits[p] += 1
+                return False
+        return True
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _reorder(self):
+        # Policies that reject most often run first; sorted() is stable for ties
+        hits = self._reject_hits
+        self.policies = sorted(self.policies, key=lambda p: -hits[p])
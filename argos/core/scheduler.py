@@ -1,13 +1,28 @@
-from abc import ABC, abstractmethod
-
-class Constraint(ABC):
-    @abstractmethod
-    def check(self, schedule):
-        pass
+from .enums import ConstraintType
+from .interfaces import Constraint
+from ._sched_kernels import has_overlap
 
 class NoOverlapConstraint(Constraint):
-    def check(self, schedule):
-        return True  # mock
+    def get_type(self):
+        return ConstraintType.HARD
+
+    def get_weight(self):
+        return 1.0
+
+    def is_satisfied(self, schedule):
+        # Sections without a start/end/room_id booking are not checked
+        starts, ends, rooms = [], [], []
+        room_codes = {}
+        for section in schedule:
+            start = getattr(section, 'start', None)
+            end = getattr(section, 'end', None)
+            room = getattr(section, 'room_id', None)
+            if start is None or end is None or room is None:
+                continue
+            starts.append(start)
+            ends.append(end)
+            rooms.append(room_codes.setdefault(room, len(room_codes)))
+        return not has_overlap(starts, ends, rooms)
 
 class Scheduler:
     def __init__(self, constraints=None):
@@ -15,6 +30,6 @@ class Scheduler:
 
     def schedule(self, sections):
         for c in self.constraints:
-            if not c.check(sections):
+            if not c.is_satisfied(sections):
                 raise Exception("Schedule violates constraints")
         return True
@@ -3,6 +3,7 @@ Main entry point for the Argos platform.
 """
 
 import asyncio
+import os
 import threading
 import time
 from typing import Optional
@@ -21,8 +22,8 @@ from .services import (
     ConcurrencyManager, EnrollmentService, SchedulerService, 
     EventService, DistributedCoordinator
 )
-from .api.grpc_api import ArgosGrpcService
-from .api.rest_api import ArgosRestAPI
+from .api.grpc_api import ArgosGrpcService, PROTOBUF_BACKEND, MAX_INFLIGHT
+from .api.rest_api import ArgosRestAPI, REST_LOOP, REST_HTTP
 
 
 class ArgosPlatform:
@@ -39,6 +40,7 @@ class ArgosPlatform:
         self._event_service = None
         self._distributed_coordinator = None
         self._grpc_server = None
+        self._grpc_loop = None
         self._rest_app = None
         self._running = False
         
@@ -99,7 +101,8 @@ class ArgosPlatform:
             self._database,
             self._enrollment_service,
             self._scheduler_service,
-            self._event_service
+            self._event_service,
+            max_inflight=self._config.get('grpc_max_inflight', MAX_INFLIGHT)
         )
         
         self._rest_app = ArgosRestAPI(
@@ -112,24 +115,51 @@ class ArgosPlatform:
         
         print("✓ Argos platform initialized successfully!")
     
-    def start_grpc_server(self, port: int = 50051, max_workers: int = 10):
+    def start_grpc_server(self, port: int = 50051, max_workers: Optional[int] = None):
         """Start the gRPC server."""
         if self._grpc_server:
             print("gRPC server already running")
             return
         
-        self._grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        # Handlers mostly wait on SQLite and service locks, so size the pool for I/O
+        if max_workers is None:
+            max_workers = self._config.get('grpc_max_workers') or int(
+                os.getenv('ARGOS_GRPC_WORKERS', (os.cpu_count() or 1) * 4)
+            )
+        
+        # The async servicer runs on its own event loop thread; blocking
+        # repository calls are offloaded to the loop's default executor.
+        self._grpc_loop = asyncio.new_event_loop()
+        self._grpc_loop.set_default_executor(futures.ThreadPoolExecutor(max_workers=max_workers))
+        self._grpc_thread = threading.Thread(target=self._grpc_loop.run_forever, daemon=True)
+        self._grpc_thread.start()
+        
+        self._grpc_server = asyncio.run_coroutine_threadsafe(
+            self._serve_grpc(port), self._grpc_loop
+        ).result()
+        
+        print(f"✓ gRPC server started on port {port} (protobuf backend: {PROTOBUF_BACKEND}, "
+              f"workers: {max_workers})")
+        if PROTOBUF_BACKEND == "python":
+            print("  ! pure-Python protobuf in use; install a protobuf wheel with the upb "
+                  "extension and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION")
+    
+    async def _serve_grpc(self, port: int) -> grpc.aio.Server:
+        """Create and start the asyncio gRPC server on the current loop."""
+        # Cap streams per connection at the servicer's inflight limit
+        server = grpc.aio.server(options=[
+            ("grpc.max_concurrent_streams", self._grpc_service.max_inflight)
+        ])
         
         # Add service to server
         from .api import argos_pb2_grpc
-        argos_pb2_grpc.add_ArgosServiceServicer_to_server(self._grpc_service, self._grpc_server)
+        argos_pb2_grpc.add_ArgosServiceServicer_to_server(self._grpc_service, server)
         
         # Start server
         listen_addr = f'[::]:{port}'
-        self._grpc_server.add_insecure_port(listen_addr)
-        self._grpc_server.start()
-        
-        print(f"✓ gRPC server started on port {port}")
+        server.add_insecure_port(listen_addr)
+        await server.start()
+        return server
     
     def start_rest_server(self, host: str = "0.0.0.0", port: int = 8000):
         """Start the REST server."""
@@ -137,21 +167,11 @@ class ArgosPlatform:
             print("REST app not initialized")
             return
         
-        import uvicorn
-        
-        def run_server():
-            uvicorn.run(
-                self._rest_app.app,
-                host=host,
-                port=port,
-                log_level="info"
-            )
-        
         # Start server in a separate thread
-        self._rest_thread = threading.Thread(target=run_server, daemon=True)
+        self._rest_thread = threading.Thread(target=self._rest_app.run, args=(host, port), daemon=True)
         self._rest_thread.start()
         
-        print(f"✓ REST server started on {host}:{port}")
+        print(f"✓ REST server started on {host}:{port} (loop: {REST_LOOP}, http: {REST_HTTP})")
     
     def start_platform(self, grpc_port: int = 50051, rest_port: int = 8000):
         """Start the entire platform."""
@@ -183,8 +203,12 @@ class ArgosPlatform:
         
         # Stop gRPC server
         if self._grpc_server:
-            self._grpc_server.stop(grace=5.0)
+            asyncio.run_coroutine_threadsafe(
+                self._grpc_server.stop(grace=5.0), self._grpc_loop
+            ).result()
+            self._grpc_loop.call_soon_threadsafe(self._grpc_loop.stop)
             self._grpc_server = None
+            self._grpc_loop = None
             print("✓ gRPC server stopped")
         
         # Cleanup concurrency manager
@@ -192,6 +216,9 @@ class ArgosPlatform:
             self._concurrency_manager.cleanup()
             print("✓ Concurrency manager cleaned up")
         
+        if self._database:
+            self._database.close()
+        
         self._running = False
         print("✓ Argos platform stopped")
     
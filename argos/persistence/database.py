@@ -2,23 +2,77 @@
 Database management and connection handling.
 """
 
+import queue
 import sqlite3
 import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 import json
 from datetime import datetime
+from pathlib import Path
 
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_batch
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
 from ..core.exceptions import PersistenceError, ConfigurationError
 
+# Seconds a cached table_exists/get_table_schema answer is trusted
+SCHEMA_CACHE_TTL = 60.0
+
+_DDL_PREFIXES = ("CREATE", "DROP", "ALTER")
+_MISSING = object()
+
+
+def _is_ddl(query: str) -> bool:
+    """Whether a statement can change the set of tables or their columns."""
+    return query.lstrip()[:6].upper().startswith(_DDL_PREFIXES)
+
+
+class _SchemaCache:
+    """Short-lived cache of table metadata lookups, cleared whenever DDL runs."""
+    
+    def __init__(self, ttl: float = SCHEMA_CACHE_TTL):
+        self._ttl = ttl
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return _MISSING
+        return entry[1]
+    
+    def put(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+# Prepared statements kept per SQLite connection (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every SQLite connection: WAL lets pooled readers run alongside the
+# writer, and NORMAL sync only fsyncs at checkpoints instead of on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+# Only the read-write connection can switch the journal mode
+_SQLITE_RW_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
 
 class DatabaseManager(ABC):
     """Abstract base class for database management."""
@@ -33,6 +87,10 @@ class DatabaseManager(ABC):
         """Execute a query and return results."""
         pass
     
+    def execute_query_iter(self, query: str, params: Optional[tuple] = None) -> Iterator[Dict[str, Any]]:
+        """Execute a query and yield result rows one at a time."""
+        return iter(self.execute_query(query, params))
+    
     @abstractmethod
     def execute_update(self, query: str, params: Optional[tuple] = None) -> int:
         """Execute an update query and return affected rows."""
@@ -43,6 +101,11 @@ class DatabaseManager(ABC):
         """Execute multiple queries in a transaction."""
         pass
     
+    def execute_many(self, query: str, seq_of_params: List[tuple]) -> int:
+        """Execute one statement for each parameter tuple in a single transaction."""
+        self.execute_transaction([(query, params) for params in seq_of_params])
+        return len(seq_of_params)
+    
     @abstractmethod
     def create_tables(self, schema: Dict[str, str]) -> None:
         """Create database tables from schema."""
@@ -57,19 +120,31 @@ class DatabaseManager(ABC):
     def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table schema information."""
         pass
+    
+    def close(self) -> None:
+        """Release any pooled connections."""
+        pass
 
 
 class SQLiteDatabase(DatabaseManager):
     """SQLite database implementation."""
     
-    def __init__(self, database_path: str = "argos.db"):
+    def __init__(self, database_path: str = "argos.db", read_pool_size: int = 4):
         self._database_path = database_path
+        # Guards the single read-write connection; writes are serialized on it
         self._lock = threading.RLock()
+        self._rw_conn: Optional[sqlite3.Connection] = None
+        # An in-memory database only exists on its own connection, so reads share it
+        self._read_pool_size = 0 if database_path == ":memory:" else read_pool_size
+        self._ro_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._ro_opened = 0
+        self._ro_lock = threading.Lock()
+        self._schema_cache = _SchemaCache()
         self._initialize_database()
     
     def _initialize_database(self) -> None:
         """Initialize the database with basic schema."""
-        with self._get_connection() as conn:
+        with self._rw() as conn:
             cursor = conn.cursor()
             
             # Create basic tables
@@ -119,21 +194,87 @@ class SQLiteDatabase(DatabaseManager):
             
             conn.commit()
     
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a new connection to the database file."""
+        # Pooled connections live on, so sqlite3's per-connection statement cache
+        # keeps the repositories' and event store's SQL compiled across calls
+        if read_only:
+            uri = Path(self._database_path).absolute().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(self._database_path, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in _SQLITE_RW_PRAGMAS:
+                conn.execute(pragma)
+        for pragma in _SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     @contextmanager
-    def _get_connection(self):
-        """Get database connection with proper cleanup."""
+    def _rw(self):
+        """Use the shared read-write connection; rolled back on error, never closed."""
+        with self._lock:
+            try:
+                if self._rw_conn is None:
+                    self._rw_conn = self._open()
+                yield self._rw_conn
+            except Exception as e:
+                if self._rw_conn is not None:
+                    self._rw_conn.rollback()
+                raise PersistenceError(f"Database connection error: {str(e)}")
+    
+    @contextmanager
+    def _ro(self):
+        """Check out a pooled read-only connection."""
+        if not self._read_pool_size:
+            with self._rw() as conn:
+                yield conn
+            return
         conn = None
         try:
-            conn = sqlite3.connect(self._database_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
+            conn = self._checkout()
             yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
             raise PersistenceError(f"Database connection error: {str(e)}")
         finally:
-            if conn:
+            if conn is not None:
+                self._ro_pool.put(conn)
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle read-only connection, opening one while under the pool size."""
+        try:
+            return self._ro_pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._ro_lock:
+            can_open = self._ro_opened < self._read_pool_size
+            if can_open:
+                self._ro_opened += 1
+        if not can_open:
+            return self._ro_pool.get()
+        try:
+            return self._open(read_only=True)
+        except Exception:
+            with self._ro_lock:
+                self._ro_opened -= 1
+            raise
+    
+    def close(self) -> None:
+        """Close pooled connections; they are reopened on next use."""
+        with self._ro_lock:
+            while True:
+                try:
+                    conn = self._ro_pool.get_nowait()
+                except queue.Empty:
+                    break
                 conn.close()
+                self._ro_opened -= 1
+        # Closed last so it can checkpoint the WAL and remove the -wal/-shm files
+        with self._lock:
+            if self._rw_conn is not None:
+                self._rw_conn.close()
+                self._rw_conn = None
     
     def connect(self) -> sqlite3.Connection:
         """Create a database connection."""
@@ -141,33 +282,52 @@ class SQLiteDatabase(DatabaseManager):
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """Execute a query and return results."""
-        with self._get_connection() as conn:
+        with self._ro() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
             
+            # Plain tuple rows zipped with the column names once per query
             columns = [description[0] for description in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                results.append(dict(zip(columns, row)))
-            return results
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def execute_query_iter(self, query: str, params: Optional[tuple] = None) -> Iterator[Dict[str, Any]]:
+        """Execute a query and yield result rows one at a time.
+        
+        A pooled connection stays checked out until the iterator is exhausted
+        or closed, so consume it promptly.
+        """
+        with self._ro() as conn:
+            cursor = conn.cursor()
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                columns = [description[0] for description in cursor.description]
+                for row in cursor:
+                    yield dict(zip(columns, row))
+            finally:
+                cursor.close()
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> int:
         """Execute an update query and return affected rows."""
-        with self._get_connection() as conn:
+        with self._rw() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
             conn.commit()
+            if _is_ddl(query):
+                self._schema_cache.clear()
             return cursor.rowcount
     
     def execute_transaction(self, queries: List[tuple]) -> bool:
         """Execute multiple queries in a transaction."""
-        with self._get_connection() as conn:
+        with self._rw() as conn:
             try:
                 cursor = conn.cursor()
                 for query, params in queries:
@@ -176,29 +336,53 @@ class SQLiteDatabase(DatabaseManager):
                     else:
                         cursor.execute(query)
                 conn.commit()
+                if any(_is_ddl(query) for query, _ in queries):
+                    self._schema_cache.clear()
                 return True
             except Exception as e:
                 conn.rollback()
                 raise PersistenceError(f"Transaction failed: {str(e)}")
     
+    def execute_many(self, query: str, seq_of_params: List[tuple]) -> int:
+        """Execute one statement for each parameter tuple in a single transaction."""
+        with self._rw() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(query, seq_of_params)
+                conn.commit()
+                if _is_ddl(query):
+                    self._schema_cache.clear()
+                return cursor.rowcount
+            except Exception as e:
+                conn.rollback()
+                raise PersistenceError(f"Transaction failed: {str(e)}")
+    
     def create_tables(self, schema: Dict[str, str]) -> None:
         """Create database tables from schema."""
-        with self._get_connection() as conn:
+        with self._rw() as conn:
             cursor = conn.cursor()
             for table_name, table_schema in schema.items():
                 cursor.execute(table_schema)
             conn.commit()
+        self._schema_cache.clear()
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
-        query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
-        results = self.execute_query(query, (table_name,))
-        return len(results) > 0
+        exists = self._schema_cache.get(("exists", table_name))
+        if exists is _MISSING:
+            query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+            exists = len(self.execute_query(query, (table_name,))) > 0
+            self._schema_cache.put(("exists", table_name), exists)
+        return exists
     
     def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table schema information."""
-        query = "PRAGMA table_info(?)"
-        return self.execute_query(query, (table_name,))
+        columns = self._schema_cache.get(("schema", table_name))
+        if columns is _MISSING:
+            query = "SELECT * FROM pragma_table_info(?)"
+            columns = self.execute_query(query, (table_name,))
+            self._schema_cache.put(("schema", table_name), columns)
+        return [dict(column) for column in columns]
 
 
 class PostgreSQLDatabase(DatabaseManager):
@@ -215,6 +399,7 @@ class PostgreSQLDatabase(DatabaseManager):
         self._user = user
         self._password = password
         self._lock = threading.RLock()
+        self._schema_cache = _SchemaCache()
         self._initialize_database()
     
     def _get_connection_string(self) -> str:
@@ -313,6 +498,8 @@ class PostgreSQLDatabase(DatabaseManager):
             else:
                 cursor.execute(query)
             conn.commit()
+            if _is_ddl(query):
+                self._schema_cache.clear()
             return cursor.rowcount
     
     def execute_transaction(self, queries: List[tuple]) -> bool:
@@ -326,11 +513,28 @@ class PostgreSQLDatabase(DatabaseManager):
                     else:
                         cursor.execute(query)
                 conn.commit()
+                if any(_is_ddl(query) for query, _ in queries):
+                    self._schema_cache.clear()
                 return True
             except Exception as e:
                 conn.rollback()
                 raise PersistenceError(f"Transaction failed: {str(e)}")
     
+    def execute_many(self, query: str, seq_of_params: List[tuple]) -> int:
+        """Execute one statement for each parameter tuple in a single transaction."""
+        with self._get_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                # Sends the statements in pages rather than one round-trip each
+                execute_batch(cursor, query, seq_of_params)
+                conn.commit()
+                if _is_ddl(query):
+                    self._schema_cache.clear()
+                return len(seq_of_params)
+            except Exception as e:
+                conn.rollback()
+                raise PersistenceError(f"Transaction failed: {str(e)}")
+    
     def create_tables(self, schema: Dict[str, str]) -> None:
         """Create database tables from schema."""
         with self._get_connection() as conn:
@@ -338,12 +542,16 @@ class PostgreSQLDatabase(DatabaseManager):
             for table_name, table_schema in schema.items():
                 cursor.execute(table_schema)
             conn.commit()
+        self._schema_cache.clear()
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
-        query = "SELECT table_name FROM information_schema.tables WHERE table_name = %s"
-        results = self.execute_query(query, (table_name,))
-        return len(results) > 0
+        exists = self._schema_cache.get(("exists", table_name))
+        if exists is _MISSING:
+            query = "SELECT table_name FROM information_schema.tables WHERE table_name = %s"
+            exists = len(self.execute_query(query, (table_name,))) > 0
+            self._schema_cache.put(("exists", table_name), exists)
+        return exists
     
     def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table schema information."""
@@ -353,7 +561,11 @@ class PostgreSQLDatabase(DatabaseManager):
             WHERE table_name = %s
             ORDER BY ordinal_position
         """
-        return self.execute_query(query, (table_name,))
+        columns = self._schema_cache.get(("schema", table_name))
+        if columns is _MISSING:
+            columns = self.execute_query(query, (table_name,))
+            self._schema_cache.put(("schema", table_name), columns)
+        return [dict(column) for column in columns]
 
 
 class DatabaseFactory:
@@ -36,6 +36,20 @@ class FileEventStore(EventStore):
         """Get file path for a snapshot."""
         return os.path.join(self._base_path, f"{stream_id}.snapshot.json")
     
+    def _event_line(self, event: Event) -> str:
+        """Serialize an event as one JSONL line."""
+        event_data = {
+            "id": event.id,
+            "event_type": event.event_type.value,
+            "stream_id": event.stream_id,
+            "event_data": dict(event.event_data),
+            "created_at": event.created_at.isoformat(),
+            "version": event.version,
+            "correlation_id": event.correlation_id,
+            "causation_id": event.causation_id
+        }
+        return json.dumps(event_data) + "\n"
+    
     def append_event(self, event: Event) -> None:
         """Append an event to the store."""
         with self._lock:
@@ -43,20 +57,24 @@ class FileEventStore(EventStore):
             
             try:
                 with open(stream_path, "a", encoding="utf-8") as f:
-                    event_data = {
-                        "id": event.id,
-                        "event_type": event.event_type.value,
-                        "stream_id": event.stream_id,
-                        "event_data": event.event_data,
-                        "created_at": event.created_at.isoformat(),
-                        "version": event.version,
-                        "correlation_id": event.correlation_id,
-                        "causation_id": event.causation_id
-                    }
-                    f.write(json.dumps(event_data) + "\n")
+                    f.write(self._event_line(event))
             except Exception as e:
                 raise EventSourcingError(f"Failed to append event: {str(e)}")
     
+    def append_events(self, events: List[Event]) -> None:
+        """Append several events with one write per stream file."""
+        lines_by_stream: Dict[str, List[str]] = {}
+        for event in events:
+            lines_by_stream.setdefault(event.stream_id, []).append(self._event_line(event))
+        
+        with self._lock:
+            try:
+                for stream_id, lines in lines_by_stream.items():
+                    with open(self._get_stream_path(stream_id), "a", encoding="utf-8") as f:
+                        f.write("".join(lines))
+            except Exception as e:
+                raise EventSourcingError(f"Failed to append events: {str(e)}")
+    
     def get_events(self, stream_id: str, from_version: int = 0) -> List[Event]:
         """Get events for a stream."""
         with self._lock:
@@ -75,7 +93,7 @@ class FileEventStore(EventStore):
                         try:
                             event_data = json.loads(line.strip())
                             event = Event(
-                                event_type=EventType(event_data["event_type"]),
+                                event_type=EventType.from_value(event_data["event_type"]),
                                 stream_id=event_data["stream_id"],
                                 event_data=event_data["event_data"],
                                 entity_id=event_data["id"]
@@ -188,33 +206,60 @@ class DatabaseEventStore(EventStore):
             }
             self._database.create_tables(schema)
     
+    _INSERT_EVENT = """
+        INSERT INTO events (id, stream_id, event_type, event_data, created_at, version, correlation_id, causation_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def _event_params(self, event: Event) -> tuple:
+        """Insert parameters for an event."""
+        return (
+            event.id,
+            event.stream_id,
+            event.event_type.value,
+            event.event_data_json,
+            event.created_at.isoformat(),
+            event.version,
+            event.correlation_id,
+            event.causation_id
+        )
+    
     def append_event(self, event: Event) -> None:
         """Append an event to the store."""
         with self._lock:
             try:
-                query = """
-                    INSERT INTO events (id, stream_id, event_type, event_data, created_at, version, correlation_id, causation_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                
-                # Convert event data to JSON string
-                event_data_json = json.dumps(event.event_data)
-                
-                params = (
-                    event.id,
-                    event.stream_id,
-                    event.event_type.value,
-                    event_data_json,
-                    event.created_at.isoformat(),
-                    event.version,
-                    event.correlation_id,
-                    event.causation_id
-                )
-                
-                self._database.execute_update(query, params)
+                self._database.execute_update(self._INSERT_EVENT, self._event_params(event))
             except Exception as e:
                 raise EventSourcingError(f"Failed to append event: {str(e)}")
     
+    def append_events(self, events: List[Event]) -> None:
+        """Append several events with one batched INSERT in a single transaction."""
+        if not events:
+            return
+        params = [self._event_params(event) for event in events]
+        with self._lock:
+            try:
+                self._database.execute_many(self._INSERT_EVENT, params)
+            except Exception as e:
+                raise EventSourcingError(f"Failed to append events: {str(e)}")
+    
+    @staticmethod
+    def _event_from_row(row: Dict[str, Any]) -> Event:
+        """Rebuild an Event from an events table row."""
+        event = Event(
+            event_type=EventType.from_value(row["event_type"]),
+            stream_id=row["stream_id"],
+            event_data=json.loads(row["event_data"]),
+            entity_id=row["id"]
+        )
+        # Re-appending the event can reuse the stored payload text
+        event._event_data_json = row["event_data"]
+        event._created_at = datetime.fromisoformat(row["created_at"])
+        event._version = row["version"]
+        event._correlation_id = row.get("correlation_id")
+        event._causation_id = row.get("causation_id")
+        return event
+    
     def get_events(self, stream_id: str, from_version: int = 0) -> List[Event]:
         """Get events for a stream."""
         with self._lock:
@@ -226,23 +271,9 @@ class DatabaseEventStore(EventStore):
                     ORDER BY version ASC
                 """
                 
-                results = self._database.execute_query(query, (stream_id, from_version))
-                
-                events = []
-                for row in results:
-                    event = Event(
-                        event_type=EventType(row["event_type"]),
-                        stream_id=row["stream_id"],
-                        event_data=json.loads(row["event_data"]),
-                        entity_id=row["id"]
-                    )
-                    event._created_at = datetime.fromisoformat(row["created_at"])
-                    event._version = row["version"]
-                    event._correlation_id = row.get("correlation_id")
-                    event._causation_id = row.get("causation_id")
-                    events.append(event)
+                rows = self._database.execute_query_iter(query, (stream_id, from_version))
                 
-                return events
+                return [self._event_from_row(row) for row in rows]
             except Exception as e:
                 raise EventSourcingError(f"Failed to get events: {str(e)}")
     
@@ -315,23 +346,9 @@ class DatabaseEventStore(EventStore):
                 if limit:
                     query += f" LIMIT {limit}"
                 
-                results = self._database.execute_query(query, (event_type.value,))
-                
-                events = []
-                for row in results:
-                    event = Event(
-                        event_type=EventType(row["event_type"]),
-                        stream_id=row["stream_id"],
-                        event_data=json.loads(row["event_data"]),
-                        entity_id=row["id"]
-                    )
-                    event._created_at = datetime.fromisoformat(row["created_at"])
-                    event._version = row["version"]
-                    event._correlation_id = row.get("correlation_id")
-                    event._causation_id = row.get("causation_id")
-                    events.append(event)
+                rows = self._database.execute_query_iter(query, (event_type.value,))
                 
-                return events
+                return [self._event_from_row(row) for row in rows]
             except Exception as e:
                 raise EventSourcingError(f"Failed to get events by type: {str(e)}")
     
@@ -3,22 +3,46 @@ Repository pattern implementations for data access.
 """
 
 import json
+import sys
 import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Generic
 from datetime import datetime, timezone
 
 from ..core.entities import (
     Student, Lecturer, Staff, Guest, Course, Section, Grade, 
-    Facility, Room, AbstractEntity
+    Facility, Room, AbstractEntity, IDRegistry
 )
 from ..core.enums import EntityStatus
 from ..core.interfaces import Repository
 from ..core.exceptions import PersistenceError, ResourceNotFoundError
 from .database import DatabaseManager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_entity(entity: AbstractEntity) -> str:
+    """Serialize an entity for the data column."""
+    if ORJSON_AVAILABLE:
+        # orjson formats the raw datetimes itself, matching isoformat()
+        return orjson.dumps(entity.to_dict(stringify_times=False),
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(entity.to_dict())
+
+
 T = TypeVar('T', bound=AbstractEntity)
 
+# In-memory key indexes, shared by every repository over the same database so a
+# write through one instance (REST, gRPC, platform) is visible to all of them.
+_KEY_INDEXES: "weakref.WeakKeyDictionary[DatabaseManager, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_KEY_INDEXES_LOCK = threading.Lock()
+
 
 class BaseRepository(Repository[T], Generic[T]):
     """Base repository implementation with common functionality."""
@@ -26,98 +50,199 @@ class BaseRepository(Repository[T], Generic[T]):
     def __init__(self, database: DatabaseManager, entity_type: str):
         self._database = database
         self._entity_type = entity_type
-        self._lock = threading.RLock()
+        # Never re-entered: save() checks existence via _exists(), which doesn't lock
+        self._lock = threading.Lock()
+    
+    def _shared_index(self, name: str, loader) -> Any:
+        """Get the named index for this database, loading it on first use."""
+        with _KEY_INDEXES_LOCK:
+            indexes = _KEY_INDEXES.setdefault(self._database, {})
+            if name not in indexes:
+                indexes[name] = loader()
+            return indexes[name]
+    
+    def _remember(self, entity: T) -> None:
+        """Record a saved entity in the in-memory indexes."""
+    
+    def _forget(self, entity_id: str) -> None:
+        """Drop a deleted entity from the in-memory indexes."""
+    
+    def _index_field(self, field: str) -> None:
+        """Create an expression index over one JSON field of this type's rows, once per database."""
+        def create() -> bool:
+            try:
+                self._database.execute_update(
+                    f"CREATE INDEX IF NOT EXISTS idx_entities_{self._entity_type}{field} "
+                    f"ON entities(type, json_extract(data, '$.{field}'))"
+                )
+                return True
+            except Exception:
+                # Backends without json_extract fall back to a scan in _find_id_by_field
+                return False
+        self._shared_index(f"{field}_sql_index", create)
+    
+    def _find_id_by_field(self, field: str, value: Any) -> Optional[str]:
+        """Ask the database for the newest entity whose JSON field equals value."""
+        query = (
+            f"SELECT id FROM entities WHERE type = ? AND json_extract(data, '$.{field}') = ? "
+            "ORDER BY created_at DESC LIMIT 1"
+        )
+        with self._lock:
+            results = self._database.execute_query(query, (self._entity_type, value))
+        return results[0]["id"] if results else None
     
     def save(self, entity: T) -> T:
         """Save an entity."""
-        with self._lock:
-            try:
-                # Check if entity exists
-                existing = self.find_by_id(entity.id)
-                
-                if existing:
-                    # Update existing entity
-                    query = """
-                        UPDATE entities 
-                        SET data = ?, updated_at = ?, version = ?, status = ?
-                        WHERE id = ? AND type = ?
-                    """
-                    params = (
-                        json.dumps(entity.to_dict()),
-                        datetime.now(timezone.utc).isoformat(),
-                        entity.version,
-                        entity.status.value if hasattr(entity.status, 'value') else str(entity.status),
-                        entity.id,
-                        self._entity_type
-                    )
-                    self._database.execute_update(query, params)
-                else:
-                    # Insert new entity
-                    query = """
-                        INSERT INTO entities (id, type, data, created_at, updated_at, version, status)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """
-                    params = (
-                        entity.id,
-                        self._entity_type,
-                        json.dumps(entity.to_dict()),
-                        entity.created_at.isoformat(),
-                        entity.updated_at.isoformat(),
-                        entity.version,
-                        entity.status.value if hasattr(entity.status, 'value') else str(entity.status)
-                    )
-                    self._database.execute_update(query, params)
-                
-                return entity
-            except Exception as e:
-                raise PersistenceError(f"Failed to save {self._entity_type}: {str(e)}")
+        try:
+            # Serialize outside the lock; only the existence check and write need it
+            data = _encode_entity(entity)
+            
+            with self._lock:
+                query, params = self._save_statement(entity, self._exists(entity.id), data)
+                self._database.execute_update(query, params)
+            self._remember(entity)
+            return entity
+        except Exception as e:
+            raise PersistenceError(f"Failed to save {self._entity_type}: {str(e)}")
+    
+    def save_many(self, entities: List[T]) -> List[T]:
+        """Save several entities in a single transaction."""
+        if not entities:
+            return []
+        
+        try:
+            payloads = [_encode_entity(entity) for entity in entities]
+            
+            # One lookup for the whole batch instead of one per entity
+            placeholders = ", ".join("?" for _ in entities)
+            query = f"SELECT id FROM entities WHERE type = ? AND id IN ({placeholders})"
+            params = (self._entity_type,) + tuple(entity.id for entity in entities)
+            
+            with self._lock:
+                existing_ids = {row["id"] for row in self._database.execute_query(query, params)}
+                statements = [
+                    self._save_statement(entity, entity.id in existing_ids, data)
+                    for entity, data in zip(entities, payloads)
+                ]
+                self._database.execute_transaction(statements)
+            for entity in entities:
+                self._remember(entity)
+            return entities
+        except Exception as e:
+            raise PersistenceError(f"Failed to save {self._entity_type}s: {str(e)}")
+    
+    def _exists(self, entity_id: str) -> bool:
+        """Check whether an entity row exists without decoding it."""
+        query = "SELECT 1 FROM entities WHERE id = ? AND type = ?"
+        return bool(self._database.execute_query(query, (entity_id, self._entity_type)))
+    
+    def _save_statement(self, entity: T, exists: bool, data: str) -> tuple:
+        """Build the UPDATE or INSERT statement that persists an entity."""
+        status = entity.status.value if hasattr(entity.status, 'value') else str(entity.status)
+        
+        if exists:
+            # Update existing entity
+            query = """
+                UPDATE entities 
+                SET data = ?, updated_at = ?, version = ?, status = ?
+                WHERE id = ? AND type = ?
+            """
+            params = (
+                data,
+                datetime.now(timezone.utc).isoformat(),
+                entity.version,
+                status,
+                entity.id,
+                self._entity_type
+            )
+        else:
+            # Insert new entity
+            query = """
+                INSERT INTO entities (id, type, data, created_at, updated_at, version, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """
+            params = (
+                entity.id,
+                self._entity_type,
+                data,
+                entity.created_at.isoformat(),
+                entity.updated_at.isoformat(),
+                entity.version,
+                status
+            )
+        return query, params
     
     def find_by_id(self, entity_id: str) -> Optional[T]:
         """Find entity by ID."""
-        with self._lock:
-            try:
-                query = "SELECT data FROM entities WHERE id = ? AND type = ?"
+        try:
+            query = "SELECT data FROM entities WHERE id = ? AND type = ?"
+            with self._lock:
                 results = self._database.execute_query(query, (entity_id, self._entity_type))
-                
-                if results:
-                    entity_data = json.loads(results[0]["data"])
-                    return self._entity_from_dict(entity_data)
-                return None
-            except Exception as e:
-                raise PersistenceError(f"Failed to find {self._entity_type} by ID: {str(e)}")
+            
+            # Decode outside the lock
+            if results:
+                entity_data = json.loads(results[0]["data"])
+                return self._entity_from_dict(entity_data)
+            return None
+        except Exception as e:
+            raise PersistenceError(f"Failed to find {self._entity_type} by ID: {str(e)}")
     
     def find_all(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
         """Find all entities matching filters."""
-        with self._lock:
-            try:
-                query = "SELECT data FROM entities WHERE type = ?"
-                params = [self._entity_type]
-                
-                if filters:
-                    for key, value in filters.items():
-                        if key == "status":
-                            query += " AND status = ?"
-                            params.append(value)
-                        elif key == "created_after":
-                            query += " AND created_at > ?"
-                            params.append(value)
-                        elif key == "created_before":
-                            query += " AND created_at < ?"
-                            params.append(value)
-                
-                query += " ORDER BY created_at DESC"
-                
+        try:
+            query = "SELECT data FROM entities WHERE type = ?"
+            params = [self._entity_type]
+            
+            if filters:
+                for key, value in filters.items():
+                    if key == "status":
+                        query += " AND status = ?"
+                        params.append(value)
+                    elif key == "created_after":
+                        query += " AND created_at > ?"
+                        params.append(value)
+                    elif key == "created_before":
+                        query += " AND created_at < ?"
+                        params.append(value)
+            
+            query += " ORDER BY created_at DESC"
+            
+            with self._lock:
                 results = self._database.execute_query(query, tuple(params))
-                entities = []
+            
+            # Decode outside the lock
+            entities = []
+            for row in results:
+                entity_data = json.loads(row["data"])
+                entity = self._entity_from_dict(entity_data)
+                entities.append(entity)
+            
+            return entities
+        except Exception as e:
+            raise PersistenceError(f"Failed to find {self._entity_type}s: {str(e)}")
+    
+    def iter_all(self, skip: int = 0, limit: Optional[int] = None, batch_size: int = 500) -> Iterator[T]:
+        """Yield entities newest first, reading and decoding one batch of rows at a time."""
+        query = "SELECT data FROM entities WHERE type = ? ORDER BY created_at DESC, id LIMIT ? OFFSET ?"
+        offset = skip
+        remaining = limit
+        
+        try:
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                with self._lock:
+                    results = self._database.execute_query(query, (self._entity_type, size, offset))
                 
                 for row in results:
-                    entity_data = json.loads(row["data"])
-                    entity = self._entity_from_dict(entity_data)
-                    entities.append(entity)
+                    yield self._entity_from_dict(json.loads(row["data"]))
                 
-                return entities
-            except Exception as e:
-                raise PersistenceError(f"Failed to find {self._entity_type}s: {str(e)}")
+                if len(results) < size:
+                    return
+                offset += size
+                if remaining is not None:
+                    remaining -= size
+        except Exception as e:
+            raise PersistenceError(f"Failed to iterate {self._entity_type}s: {str(e)}")
     
     def delete(self, entity_id: str) -> bool:
         """Delete an entity by ID."""
@@ -125,6 +250,7 @@ class BaseRepository(Repository[T], Generic[T]):
             try:
                 query = "DELETE FROM entities WHERE id = ? AND type = ?"
                 affected_rows = self._database.execute_update(query, (entity_id, self._entity_type))
+                self._forget(entity_id)
                 return affected_rows > 0
             except Exception as e:
                 raise PersistenceError(f"Failed to delete {self._entity_type}: {str(e)}")
@@ -158,6 +284,40 @@ class StudentRepository(BaseRepository[Student]):
     
     def __init__(self, database: DatabaseManager):
         super().__init__(database, "student")
+        # student_id -> entity id, so lookups by student number skip the table scan
+        self._student_ids: Dict[str, str] = self._shared_index("student_id", self._load_student_ids)
+        self._index_field("_student_id")
+    
+    def _load_student_ids(self) -> Dict[str, str]:
+        """Map every stored student number to its entity ID (newest wins)."""
+        student_ids: Dict[str, str] = {}
+        for student in self.find_all():
+            student_ids.setdefault(student.student_id, student.id)
+        return student_ids
+    
+    def _entity_id_for_student_id(self, student_id: str) -> Optional[str]:
+        """Resolve a student number; an index miss is checked against the database."""
+        entity_id = self._student_ids.get(student_id)
+        if entity_id is None:
+            # Rows written by another process or connection never reach the index
+            entity_id = self._find_id_by_field("_student_id", student_id)
+            if entity_id is not None:
+                self._student_ids[student_id] = entity_id
+        return entity_id
+    
+    def has_student_id(self, student_id: str) -> bool:
+        """Whether a student with this number is stored."""
+        return self._entity_id_for_student_id(student_id) is not None
+    
+    def _remember(self, entity: Student) -> None:
+        super()._remember(entity)
+        self._student_ids[entity.student_id] = entity.id
+    
+    def _forget(self, entity_id: str) -> None:
+        super()._forget(entity_id)
+        for student_id, known_id in list(self._student_ids.items()):
+            if known_id == entity_id:
+                del self._student_ids[student_id]
     
     def _entity_from_dict(self, data: Dict[str, Any]) -> Student:
         """Convert dictionary to Student instance."""
@@ -168,15 +328,15 @@ class StudentRepository(BaseRepository[Student]):
             last_name=data["_last_name"],
             email=data["_email"],
             student_id=data["_student_id"],
-            grade_level=GradeLevel(data["_grade_level"]),
+            grade_level=GradeLevel.from_value(data["_grade_level"]),
             entity_id=data["id"]
         )
         
         # Restore additional properties
         student._gpa = data.get("_gpa")
-        student._academic_standing = data.get("_academic_standing", "good")
+        student._academic_standing = sys.intern(data.get("_academic_standing", "good"))
         student._advisor = data.get("_advisor")
-        student._enrollments = set(data.get("_enrollments", []))
+        student._enrollments = IDRegistry.encode(data.get("_enrollments", []))
         student._roles = set(data.get("_roles", []))
         student._created_at = datetime.fromisoformat(data["created_at"])
         student._updated_at = datetime.fromisoformat(data["updated_at"])
@@ -189,23 +349,28 @@ class StudentRepository(BaseRepository[Student]):
             student._status = EntityStatus.ACTIVE
         else:
             try:
-                student._status = EntityStatus(_status_raw)
+                student._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     student._status = EntityStatus[_status_raw]
                 except Exception:
                     student._status = EntityStatus.ACTIVE
-        student._metadata = data.get("metadata", {})
+        student._metadata = data.get("metadata") or None
         
         return student
     
     def find_by_student_id(self, student_id: str) -> Optional[Student]:
         """Find student by student ID."""
-        students = self.find_all()
-        for student in students:
-            if student.student_id == student_id:
-                return student
-        return None
+        entity_id = self._entity_id_for_student_id(student_id)
+        if entity_id is None:
+            return None
+        student = self.find_by_id(entity_id)
+        if student is None:
+            # Removed behind the index's back; drop the stale entry and ask again
+            self._forget(entity_id)
+            entity_id = self._entity_id_for_student_id(student_id)
+            student = self.find_by_id(entity_id) if entity_id is not None else None
+        return student
     
     def find_by_email(self, email: str) -> Optional[Student]:
         """Find student by email."""
@@ -261,13 +426,13 @@ class LecturerRepository(BaseRepository[Lecturer]):
             lecturer._status = EntityStatus.ACTIVE
         else:
             try:
-                lecturer._status = EntityStatus(_status_raw)
+                lecturer._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     lecturer._status = EntityStatus[_status_raw]
                 except Exception:
                     lecturer._status = EntityStatus.ACTIVE
-        lecturer._metadata = data.get("metadata", {})
+        lecturer._metadata = data.get("metadata") or None
         
         return lecturer
     
@@ -295,6 +460,40 @@ class CourseRepository(BaseRepository[Course]):
     
     def __init__(self, database: DatabaseManager):
         super().__init__(database, "course")
+        # course_code -> entity id, so duplicate checks and code lookups skip the table scan
+        self._course_codes: Dict[str, str] = self._shared_index("course_code", self._load_course_codes)
+        self._index_field("_course_code")
+    
+    def _load_course_codes(self) -> Dict[str, str]:
+        """Map every stored course code to its entity ID (newest wins)."""
+        course_codes: Dict[str, str] = {}
+        for course in self.find_all():
+            course_codes.setdefault(course.course_code, course.id)
+        return course_codes
+    
+    def _entity_id_for_course_code(self, course_code: str) -> Optional[str]:
+        """Resolve a course code; an index miss is checked against the database."""
+        entity_id = self._course_codes.get(course_code)
+        if entity_id is None:
+            # Rows written by another process or connection never reach the index
+            entity_id = self._find_id_by_field("_course_code", course_code)
+            if entity_id is not None:
+                self._course_codes[course_code] = entity_id
+        return entity_id
+    
+    def has_course_code(self, course_code: str) -> bool:
+        """Whether a course with this code is stored."""
+        return self._entity_id_for_course_code(course_code) is not None
+    
+    def _remember(self, entity: Course) -> None:
+        super()._remember(entity)
+        self._course_codes[entity.course_code] = entity.id
+    
+    def _forget(self, entity_id: str) -> None:
+        super()._forget(entity_id)
+        for course_code, known_id in list(self._course_codes.items()):
+            if known_id == entity_id:
+                del self._course_codes[course_code]
     
     def _entity_from_dict(self, data: Dict[str, Any]) -> Course:
         """Convert dictionary to Course instance."""
@@ -321,23 +520,28 @@ class CourseRepository(BaseRepository[Course]):
             course._status = EntityStatus.ACTIVE
         else:
             try:
-                course._status = EntityStatus(_status_raw)
+                course._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     course._status = EntityStatus[_status_raw]
                 except Exception:
                     course._status = EntityStatus.ACTIVE
-        course._metadata = data.get("metadata", {})
+        course._metadata = data.get("metadata") or None
         
         return course
     
     def find_by_course_code(self, course_code: str) -> Optional[Course]:
         """Find course by course code."""
-        courses = self.find_all()
-        for course in courses:
-            if course.course_code == course_code:
-                return course
-        return None
+        entity_id = self._entity_id_for_course_code(course_code)
+        if entity_id is None:
+            return None
+        course = self.find_by_id(entity_id)
+        if course is None:
+            # Removed behind the index's back; drop the stale entry and ask again
+            self._forget(entity_id)
+            entity_id = self._entity_id_for_course_code(course_code)
+            course = self.find_by_id(entity_id) if entity_id is not None else None
+        return course
     
     def find_by_department(self, department: str) -> List[Course]:
         """Find courses by department."""
@@ -372,7 +576,7 @@ class SectionRepository(BaseRepository[Section]):
         section._schedule = data.get("_schedule", {})
         section._capacity = data.get("_capacity", 0)
         section._enrolled = set(data.get("_enrolled", []))
-        section._waitlist = data.get("_waitlist", [])
+        section._waitlist = deque(data.get("_waitlist", []))
         section._enrollment_policy = data.get("_enrollment_policy")
         section._created_at = datetime.fromisoformat(data["created_at"])
         section._updated_at = datetime.fromisoformat(data["updated_at"])
@@ -384,13 +588,13 @@ class SectionRepository(BaseRepository[Section]):
             section._status = EntityStatus.ACTIVE
         else:
             try:
-                section._status = EntityStatus(_status_raw)
+                section._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     section._status = EntityStatus[_status_raw]
                 except Exception:
                     section._status = EntityStatus.ACTIVE
-        section._metadata = data.get("metadata", {})
+        section._metadata = data.get("metadata") or None
         
         return section
     
@@ -430,13 +634,13 @@ class GradeRepository(BaseRepository[Grade]):
             grade_value=data["_grade_value"],
             letter_grade=data["_letter_grade"],
             percentage=data["_percentage"],
+            grader_id=data.get("_grader_id"),
+            comments=data.get("_comments", ""),
             entity_id=data["id"]
         )
         
         # Restore additional properties
         grade._graded_at = datetime.fromisoformat(data["_graded_at"])
-        grade._grader_id = data.get("_grader_id")
-        grade._comments = data.get("_comments", "")
         grade._created_at = datetime.fromisoformat(data["created_at"])
         grade._updated_at = datetime.fromisoformat(data["updated_at"])
         grade._version = data["version"]
@@ -447,13 +651,13 @@ class GradeRepository(BaseRepository[Grade]):
             grade._status = EntityStatus.ACTIVE
         else:
             try:
-                grade._status = EntityStatus(_status_raw)
+                grade._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     grade._status = EntityStatus[_status_raw]
                 except Exception:
                     grade._status = EntityStatus.ACTIVE
-        grade._metadata = data.get("metadata", {})
+        grade._metadata = data.get("metadata") or None
         
         return grade
     
@@ -497,7 +701,7 @@ class FacilityRepository(BaseRepository[Facility]):
         
         # Restore additional properties
         facility._rooms = set(data.get("_rooms", []))
-        facility._access_level = AccessLevel(data.get("_access_level", "read"))
+        facility._access_level = AccessLevel.from_value(data.get("_access_level", "read"))
         facility._security_zones = set(data.get("_security_zones", []))
         facility._created_at = datetime.fromisoformat(data["created_at"])
         facility._updated_at = datetime.fromisoformat(data["updated_at"])
@@ -509,13 +713,13 @@ class FacilityRepository(BaseRepository[Facility]):
             facility._status = EntityStatus.ACTIVE
         else:
             try:
-                facility._status = EntityStatus(_status_raw)
+                facility._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     facility._status = EntityStatus[_status_raw]
                 except Exception:
                     facility._status = EntityStatus.ACTIVE
-        facility._metadata = data.get("metadata", {})
+        facility._metadata = data.get("metadata") or None
         
         return facility
     
@@ -557,7 +761,16 @@ class RoomRepository(BaseRepository[Room]):
         # Restore additional properties
         room._equipment = set(data.get("_equipment", []))
         room._access_control = data.get("_access_control", False)
-        room._booking_schedule = data.get("_booking_schedule", {})
+        if "_bookings" in data:
+            room._bookings = [tuple(booking) for booking in data["_bookings"]]
+        else:
+            # Rows written before bookings were kept as sorted intervals
+            room._bookings = sorted(
+                (datetime.fromisoformat(booking["start_time"]).timestamp(),
+                 datetime.fromisoformat(booking["end_time"]).timestamp(),
+                 booking["booker_id"])
+                for booking in data.get("_booking_schedule", {}).values()
+            )
         room._created_at = datetime.fromisoformat(data["created_at"])
         room._updated_at = datetime.fromisoformat(data["updated_at"])
         room._version = data["version"]
@@ -568,13 +781,13 @@ class RoomRepository(BaseRepository[Room]):
             room._status = EntityStatus.ACTIVE
         else:
             try:
-                room._status = EntityStatus(_status_raw)
+                room._status = EntityStatus.from_value(_status_raw)
             except Exception:
                 try:
                     room._status = EntityStatus[_status_raw]
                 except Exception:
                     room._status = EntityStatus.ACTIVE
-        room._metadata = data.get("metadata", {})
+        room._metadata = data.get("metadata") or None
         
         return room
     
@@ -600,17 +813,7 @@ class RoomRepository(BaseRepository[Room]):
         available_rooms = []
         
         for room in rooms:
-            # Simple availability check - in practice, this would be more complex
-            is_available = True
-            for booking_key, booking in room.booking_schedule.items():
-                booking_start = datetime.fromisoformat(booking['start_time'])
-                booking_end = datetime.fromisoformat(booking['end_time'])
-                
-                if (start_time < booking_end and end_time > booking_start):
-                    is_available = False
-                    break
-            
-            if is_available:
+            if room.is_available(start_time, end_time):
                 available_rooms.append(room)
         
         return available_rooms
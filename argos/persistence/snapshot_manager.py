@@ -139,7 +139,7 @@ class SnapshotManager:
             # This is a simplified approach - in practice, you'd have more sophisticated
             # event-to-entity mapping logic
             if hasattr(repository, '_entity_from_dict'):
-                entity_data = event.event_data
+                entity_data = dict(event.event_data)
                 entity_data["id"] = event.event_data.get("entity_id", event.id)
                 return repository._entity_from_dict(entity_data)
             
@@ -6,12 +6,14 @@ import asyncio
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 import uuid
 
 from ..core.entities import Student, Section, Grade, Event, EventType
+from ..core.events import Dispatcher
 from ..core.interfaces import EnrollmentPolicy, EventHandler
 from ..core.exceptions import EnrollmentError, ValidationError, ConcurrencyError
 from .concurrency_manager import ConcurrencyManager, LockType
@@ -140,9 +142,10 @@ class EnrollmentService:
     def __init__(self, concurrency_manager: ConcurrencyManager):
         self._concurrency_manager = concurrency_manager
         self._enrollments: Dict[str, Dict[str, EnrollmentStatus]] = {}  # student_id -> section_id -> status
-        self._waitlists: Dict[str, List[str]] = {}  # section_id -> [student_ids]
+        self._waitlists: Dict[str, Deque[str]] = {}  # section_id -> [student_ids]
         self._policies: List[EnrollmentPolicy] = []
         self._event_handlers: List[EventHandler] = []
+        self._dispatcher = Dispatcher()
         self._lock = threading.RLock()
         
         # Initialize default policies
@@ -185,6 +188,7 @@ class EnrollmentService:
         """Add an event handler."""
         with self._lock:
             self._event_handlers.append(handler)
+            self._dispatcher.register_handler(handler, EventType.VALUES)
     
     def enroll_student(self, student: Student, section: Section) -> EnrollmentResult:
         """Enroll a student in a section."""
@@ -281,7 +285,7 @@ class EnrollmentService:
                     
                     # Move next student from waitlist to enrolled
                     if section_id in self._waitlists and self._waitlists[section_id]:
-                        next_student_id = self._waitlists[section_id].pop(0)
+                        next_student_id = self._waitlists[section_id].popleft()
                         self._enroll_student_direct(next_student_id, section_id)
                         
                         self._publish_event(EventType.ENROLLMENT, {
@@ -326,7 +330,7 @@ class EnrollmentService:
     def _add_to_waitlist(self, student_id: str, section_id: str) -> int:
         """Add student to waitlist and return position."""
         if section_id not in self._waitlists:
-            self._waitlists[section_id] = []
+            self._waitlists[section_id] = deque()
         
         if student_id not in self._waitlists[section_id]:
             self._waitlists[section_id].append(student_id)
@@ -348,12 +352,11 @@ class EnrollmentService:
             event_data=event_data
         )
         
-        for handler in self._event_handlers:
-            if handler.can_handle(event_type.value):
-                try:
-                    handler.handle_event(event)
-                except Exception as e:
-                    print(f"Error in event handler {handler.__class__.__name__}: {e}")
+        for handler in self._dispatcher.handlers_for(event_type.value):
+            try:
+                handler.handle_event(event)
+            except Exception as e:
+                print(f"Error in event handler {handler.__class__.__name__}: {e}")
     
     def get_enrollments(self, student_id: str) -> List[str]:
         """Get all sections a student is enrolled in."""
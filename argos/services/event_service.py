@@ -213,7 +213,7 @@ class EventService:
             # Publish to relevant streams
             stream = self._event_streams.get(event.stream_id)
             if stream:
-                stream.publish(event.event_data)
+                stream.publish(dict(event.event_data))
             
             # Notify subscribers
             self._notify_subscribers(event)
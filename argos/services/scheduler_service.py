@@ -30,11 +30,23 @@ class ScheduleStatus(Enum):
 
 @dataclass
 class TimeSlot:
-    """Represents a time slot for scheduling."""
-    start_time: datetime
-    end_time: datetime
+    """Represents a time slot for scheduling.
+    
+    Times are held as integer milliseconds since the epoch so overlap checks
+    are plain int comparisons; datetimes are accepted and converted once.
+    """
+    __slots__ = ('start_time', 'end_time', 'day_of_week')
+    
+    start_time: int
+    end_time: int
     day_of_week: int  # 0=Monday, 6=Sunday
     
+    def __post_init__(self):
+        if isinstance(self.start_time, datetime):
+            self.start_time = int(self.start_time.timestamp() * 1000)
+        if isinstance(self.end_time, datetime):
+            self.end_time = int(self.end_time.timestamp() * 1000)
+    
     def overlaps_with(self, other: 'TimeSlot') -> bool:
         """Check if this time slot overlaps with another."""
         return (self.start_time < other.end_time and 
@@ -43,7 +55,7 @@ class TimeSlot:
     
     def duration_minutes(self) -> int:
         """Get duration in minutes."""
-        return int((self.end_time - self.start_time).total_seconds() / 60)
+        return (self.end_time - self.start_time) // 60000
 
 
 @dataclass
@@ -354,7 +366,8 @@ class SchedulerService:
         for time_slot in request.time_slots:
             for existing_slot in self._room_assignments.get(room.id, []):
                 if time_slot.overlaps_with(existing_slot):
-                    conflicts.append(f"Room {room.room_number} is already booked at {time_slot.start_time}")
+                    booked_at = datetime.fromtimestamp(time_slot.start_time / 1000)
+                    conflicts.append(f"Room {room.room_number} is already booked at {booked_at}")
         
         # Check constraints
         for constraint_id in request.constraints: